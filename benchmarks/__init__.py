@@ -0,0 +1 @@
+"""Benchmarks for tool result handling; run with ``python -m benchmarks.<name>``."""
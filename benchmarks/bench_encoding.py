@@ -0,0 +1,46 @@
+"""Encoding time of tool results for each available result encoder.
+
+Payloads are realistic SDK objects as returned by get_run, get_message,
+get_run_step and list_messages, plus a compacted page, which is encoded from
+plain dicts rather than SDK models.
+"""
+
+import time
+from typing import Any, Callable
+
+from src.encoding import available_encoders, get_encoder
+from src.tools.projection import shape
+
+from .fixtures import make_message, make_message_page, make_run, make_run_step
+
+ROUNDS = 500
+
+CASES = [
+    ("Run", make_run()),
+    ("Message", make_message()),
+    ("RunStep (file_search)", make_run_step()),
+    ("list_messages (100)", make_message_page()),
+    ("list_messages compact", shape(make_message_page(), compact=True)),
+]
+
+
+def mean_us(encode: Callable[[Any], str], value: Any) -> float:
+    """Return the mean time to encode ``value`` in microseconds."""
+    rounds = max(10, ROUNDS // max(1, len(encode(value)) // 20000))
+    start = time.perf_counter()
+    for _ in range(rounds):
+        encode(value)
+    return 1e6 * (time.perf_counter() - start) / rounds
+
+
+def main() -> None:
+    """Print encoding time per payload for each encoder."""
+    names = available_encoders()
+    print(f"{'payload':<24}" + "".join(f"{name + ' us':>14}" for name in names))
+    for label, value in CASES:
+        times = [mean_us(get_encoder(name), value) for name in names]
+        print(f"{label:<24}" + "".join(f"{t:>14.1f}" for t in times))
+
+
+if __name__ == "__main__":
+    main()
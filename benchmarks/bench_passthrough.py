@@ -0,0 +1,67 @@
+"""CPU time per 100-message page with and without raw-JSON passthrough.
+
+The parsed path builds SDK models from the response body the way the SDK does
+and encodes them the way FastMCP does. The raw path forwards the body, or
+shapes it as plain JSON when fields are requested.
+"""
+
+import json
+import time
+from typing import Any, Callable
+
+import pydantic_core
+from openai._models import construct_type
+from openai.pagination import SyncCursorPage
+from openai.types.beta.threads.message import Message
+
+from src.tools.projection import shape, shape_json
+
+from .fixtures import message_page_body
+
+ROUNDS = 200
+FIELDS = ["id", "role", "content.text.value"]
+
+MessagePage = SyncCursorPage[Message]
+MessagePage.model_rebuild()
+
+
+def encode(result: Any) -> str:
+    """Encode a tool result the way FastMCP does."""
+    if isinstance(result, str):
+        return result
+    return json.dumps(pydantic_core.to_jsonable_python(result))
+
+
+def parsed(body: str, fields: Any = None) -> str:
+    """Parse the body into SDK models, shape and encode it."""
+    page = construct_type(type_=MessagePage, value=json.loads(body))
+    return encode(shape(page, fields, compact=False))
+
+
+def raw(body: str, fields: Any = None) -> str:
+    """Forward the body, shaping it as plain JSON if fields are requested."""
+    return encode(shape_json(body, fields, compact=False))
+
+
+def cpu_ms(run: Callable[[], Any]) -> float:
+    """Return the mean CPU time of ``run`` in milliseconds."""
+    run()
+    start = time.process_time()
+    for _ in range(ROUNDS):
+        run()
+    return 1000 * (time.process_time() - start) / ROUNDS
+
+
+def main() -> None:
+    """Print CPU time per page for parsed and raw list responses."""
+    body = message_page_body()
+    print(f"{'list_messages (100)':<28}{'parsed ms':>10}{'raw ms':>10}")
+    for label, fields in (("all fields", None), ("fields", FIELDS)):
+        print(
+            f"{label:<28}{cpu_ms(lambda: parsed(body, fields)):>10.2f}"
+            f"{cpu_ms(lambda: raw(body, fields)):>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
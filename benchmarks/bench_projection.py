@@ -0,0 +1,66 @@
+"""Payload size of tool results with field projection, compact mode and
+text rendering of messages.
+
+Sizes are measured the way FastMCP serializes tool results, so they match
+what an MCP client receives.
+"""
+
+import json
+from typing import Any, List, Optional
+
+import pydantic_core
+
+from src.tools.messages import compact_message
+from src.tools.projection import shape
+
+from .fixtures import make_assistant, make_message, make_message_page, make_run
+
+CASES = [
+    ("get_assistant", make_assistant(), ["id", "name", "model"]),
+    ("get_run", make_run(), ["id", "status", "usage"]),
+    ("list_messages (100)", make_message_page(), ["id", "role", "content.text.value"]),
+]
+
+
+def payload_size(
+    result: Any, fields: Optional[List[str]] = None, compact: bool = False
+) -> int:
+    """Return the size in bytes of the tool result sent to the client."""
+    shaped = shape(result, fields, compact)
+    return len(json.dumps(pydantic_core.to_jsonable_python(shaped)).encode())
+
+
+def render_page(page: Any, citations: bool) -> Any:
+    """Render a page of messages the way list_messages does for render="text"."""
+    return {
+        "data": [compact_message(message, citations) for message in page.data],
+        "has_more": page.has_more,
+    }
+
+
+def main() -> None:
+    """Print full, compact and projected payload sizes for each case."""
+    print(f"{'tool':<22}{'full':>10}{'compact':>10}{'projected':>12}{'both':>8}")
+    for name, result, fields in CASES:
+        full = payload_size(result)
+        compact = payload_size(result, compact=True)
+        projected = payload_size(result, fields)
+        both = payload_size(result, fields, compact=True)
+        print(f"{name:<22}{full:>10}{compact:>10}{projected:>12}{both:>8}")
+
+    # render="text" on get_message and list_messages
+    print()
+    print(f"{'render=text':<22}{'full':>10}{'text':>10}{'citations':>12}")
+    message, page = make_message(), make_message_page()
+    for name, result, render in [
+        ("get_message", message, lambda cite: compact_message(message, cite)),
+        ("list_messages (100)", page, lambda cite: render_page(page, cite)),
+    ]:
+        full = payload_size(result)
+        text = payload_size(render(False))
+        cited = payload_size(render(True))
+        print(f"{name:<22}{full:>10}{text:>10}{cited:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""CPU time spent building requests for create tools.
+
+The OpenAI client is replaced by one that returns immediately, so the timings
+cover validating the arguments and building the request body, including the
+SDK's own transform of the body into JSON.
+"""
+
+import time
+from typing import Any, Callable, Dict, List
+from unittest.mock import patch
+
+import httpx
+from openai import OpenAI
+
+from src.tools.assistant import tools as assistant_tools
+from src.tools.messages import tools as message_tools
+from src.tools.threads import tools as thread_tools
+
+from .fixtures import INSTRUCTIONS, TOOLS
+
+ROUNDS = 2000
+
+CONTENT: List[Dict[str, Any]] = [
+    {"type": "text", "text": {"value": "Summarize the attached policies."}},
+    {"type": "image_url", "image_url": {"url": "https://example.com/a.png"}},
+    {"type": "image_file", "image_file": {"file_id": "file_abc123"}},
+]
+ATTACHMENTS: List[Dict[str, Any]] = [
+    {"file_id": f"file_{n:06d}", "tools": [{"type": "file_search"}]} for n in range(3)
+]
+THREAD_MESSAGES: List[Dict[str, Any]] = [
+    {
+        "role": "user",
+        "content": CONTENT,
+        "attachments": ATTACHMENTS,
+        "metadata": {"n": str(n)},
+    }
+    for n in range(5)
+]
+
+
+def offline_client() -> OpenAI:
+    """Return a client whose requests are answered locally with a canned body."""
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path.endswith("/messages"):
+            body = {
+                "id": "msg_abc123",
+                "object": "thread.message",
+                "created_at": 0,
+                "thread_id": "thread_abc123",
+                "role": "user",
+                "status": "completed",
+                "content": [],
+                "attachments": [],
+                "metadata": {},
+            }
+        elif path.endswith("/threads"):
+            body = {"id": "thread_abc123", "object": "thread", "created_at": 0}
+        else:
+            body = {
+                "id": "asst_abc123",
+                "object": "assistant",
+                "created_at": 0,
+                "model": "gpt-4o",
+                "tools": [],
+            }
+        return httpx.Response(200, json=body)
+
+    return OpenAI(
+        api_key="sk-bench",
+        http_client=httpx.Client(transport=httpx.MockTransport(respond)),
+    )
+
+
+def cpu_us(run: Callable[[], Any], rounds: int = ROUNDS) -> float:
+    """Return the mean CPU time of ``run`` in microseconds."""
+    run()
+    start = time.process_time()
+    for _ in range(rounds):
+        run()
+    return 1e6 * (time.process_time() - start) / rounds
+
+
+def main() -> None:
+    """Print CPU time per call for each create tool."""
+    client = offline_client()
+    cases = [
+        (
+            "create_message",
+            lambda: message_tools.create_message(
+                "thread_abc123", "user", CONTENT, ATTACHMENTS, {"k": "v"}
+            ),
+        ),
+        (
+            "create_thread (5 messages)",
+            lambda: thread_tools.create_thread(THREAD_MESSAGES, {"k": "v"}),
+        ),
+        (
+            "create_assistant",
+            lambda: assistant_tools.create_assistant(
+                model="gpt-4o",
+                name="Store support",
+                instructions=INSTRUCTIONS,
+                tools=TOOLS,
+                metadata={"team": "support"},
+            ),
+        ),
+    ]
+    with patch.object(message_tools, "client", client), patch.object(
+        thread_tools, "client", client
+    ), patch.object(assistant_tools, "client", client):
+        print(f"{'tool':<28}{'us/call':>10}")
+        for name, run in cases:
+            print(f"{name:<28}{cpu_us(run):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Validation time of tool lists.
+
+Compares the discriminated ``Tool`` union with the smart union it replaced on
+a list of function tools, with small and with large parameter schemas.
+"""
+
+import time
+from typing import Any, Callable, Dict, List, Union
+
+from pydantic import TypeAdapter
+
+from src.tools.models import (
+    AssistantFileSearchTool,
+    CodeInterpreterTool,
+    FunctionTool,
+    Tool,
+)
+
+ROUNDS = 200
+
+
+def function_schema(properties: int = 150) -> Dict[str, Any]:
+    """Return a parameters schema of about 30 KB."""
+    return {
+        "type": "object",
+        "properties": {
+            f"field_{i}": {
+                "type": ["string", "null"],
+                "description": f"Value of field {i} as shown in the form",
+                "enum": [f"option_{j}" for j in range(8)],
+            }
+            for i in range(properties)
+        },
+        "required": [f"field_{i}" for i in range(0, properties, 3)],
+    }
+
+
+def tool_list(count: int = 10, properties: int = 150) -> List[Dict[str, Any]]:
+    """Return ``count`` function tools sharing one schema."""
+    return [
+        {
+            "type": "function",
+            "function": {
+                "name": f"fill_form_{i}",
+                "parameters": function_schema(properties),
+            },
+        }
+        for i in range(count)
+    ]
+
+
+def mean_us(call: Callable[[], Any], rounds: int = ROUNDS) -> float:
+    """Return the mean time of ``call`` in microseconds."""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        call()
+    return 1e6 * (time.perf_counter() - start) / rounds
+
+
+def main() -> None:
+    """Print tool list validation times."""
+    smart = TypeAdapter(
+        List[Union[CodeInterpreterTool, AssistantFileSearchTool, FunctionTool]]
+    )
+    discriminated = TypeAdapter(List[Tool])
+
+    print(f"{'case':<40}{'us':>12}")
+    for label, properties in (("small", 2), ("30 KB", 150)):
+        tools = tool_list(properties=properties)
+        print(
+            f"{f'10 tools ({label} schemas), smart union':<40}"
+            f"{mean_us(lambda: smart.validate_python(tools)):>12.1f}"
+        )
+        print(
+            f"{f'10 tools ({label} schemas), discriminated':<40}"
+            f"{mean_us(lambda: discriminated.validate_python(tools)):>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+"""Realistic SDK objects shared by the benchmarks."""
+
+import json
+from typing import Any, Dict, List
+
+from openai.pagination import SyncCursorPage
+from openai.types.beta.assistant import Assistant
+from openai.types.beta.threads.message import Message
+from openai.types.beta.threads.run import Run
+from openai.types.beta.threads.runs.run_step import RunStep
+
+INSTRUCTIONS = (
+    "You are a support assistant for an online store. Answer using the "
+    "attached policy documents, cite the document for every claim, and ask "
+    "a clarifying question when the order number is missing. "
+) * 20
+
+TOOLS: List[Dict[str, Any]] = [
+    {"type": "code_interpreter"},
+    {"type": "file_search"},
+] + [
+    {
+        "type": "function",
+        "function": {
+            "name": f"lookup_{name}",
+            "description": f"Look up an {name} by its identifier.",
+            "parameters": {
+                "type": "object",
+                "properties": {"id": {"type": "string"}},
+                "required": ["id"],
+            },
+        },
+    }
+    for name in ("order", "customer", "invoice", "shipment")
+]
+
+
+def make_assistant(index: int = 0) -> Assistant:
+    """Build an assistant with long instructions and several tools."""
+    return Assistant.model_validate(
+        {
+            "id": f"asst_{index:06d}",
+            "object": "assistant",
+            "created_at": 1713226573,
+            "name": "Store support",
+            "description": "Answers order and policy questions",
+            "model": "gpt-4o",
+            "instructions": INSTRUCTIONS,
+            "tools": TOOLS,
+            "tool_resources": {"file_search": {"vector_store_ids": ["vs_abc123"]}},
+            "metadata": {"team": "support", "env": "prod"},
+            "temperature": 1.0,
+            "top_p": 1.0,
+            "response_format": "auto",
+        }
+    )
+
+
+def make_run(index: int = 0) -> Run:
+    """Build a completed run as returned by the API."""
+    return Run.model_validate(
+        {
+            "id": f"run_{index:06d}",
+            "object": "thread.run",
+            "created_at": 1713226573,
+            "assistant_id": "asst_000000",
+            "thread_id": "thread_abc123",
+            "status": "completed",
+            "started_at": 1713226574,
+            "expires_at": None,
+            "cancelled_at": None,
+            "failed_at": None,
+            "completed_at": 1713226580,
+            "required_action": None,
+            "last_error": None,
+            "model": "gpt-4o",
+            "instructions": INSTRUCTIONS,
+            "tools": TOOLS,
+            "metadata": {},
+            "incomplete_details": None,
+            "usage": {
+                "prompt_tokens": 1500,
+                "completion_tokens": 320,
+                "total_tokens": 1820,
+            },
+            "temperature": 1.0,
+            "top_p": 1.0,
+            "max_prompt_tokens": None,
+            "max_completion_tokens": None,
+            "truncation_strategy": {"type": "auto", "last_messages": None},
+            "response_format": "auto",
+            "tool_choice": "auto",
+            "parallel_tool_calls": True,
+        }
+    )
+
+
+def message_payload(index: int = 0) -> Dict[str, Any]:
+    """Build the API JSON of an assistant message with file citations."""
+    return {
+        "id": f"msg_{index:06d}",
+        "object": "thread.message",
+        "created_at": 1713226573 + index,
+        "assistant_id": "asst_000000",
+        "thread_id": "thread_abc123",
+        "run_id": f"run_{index:06d}",
+        "role": "assistant",
+        "status": "completed",
+        "completed_at": 1713226580 + index,
+        "incomplete_at": None,
+        "incomplete_details": None,
+        "content": [
+            {
+                "type": "text",
+                "text": {
+                    "value": "Your order ships within two business days "
+                    "according to the shipping policy【4:0†source】. Returns "
+                    "are accepted for 30 days【4:1†source】.",
+                    "annotations": [
+                        {
+                            "type": "file_citation",
+                            "text": f"【4:{n}†source】",
+                            "start_index": 60 + n * 40,
+                            "end_index": 72 + n * 40,
+                            "file_citation": {"file_id": f"file_{n:06d}"},
+                        }
+                        for n in range(2)
+                    ],
+                },
+            }
+        ],
+        "attachments": [],
+        "metadata": {},
+    }
+
+
+def make_message(index: int = 0) -> Message:
+    """Build an assistant message with file citations."""
+    return Message.model_validate(message_payload(index))
+
+
+def make_message_page(count: int = 100) -> SyncCursorPage[Message]:
+    """Build a full page of messages."""
+    return SyncCursorPage[Message](
+        data=[make_message(i) for i in range(count)], has_more=True
+    )
+
+
+def message_page_body(count: int = 100) -> str:
+    """Build the API response body of a full page of messages."""
+    data = [message_payload(i) for i in range(count)]
+    return json.dumps(
+        {
+            "object": "list",
+            "data": data,
+            "first_id": data[0]["id"],
+            "last_id": data[-1]["id"],
+            "has_more": True,
+        }
+    )
+
+
+def make_run_step(index: int = 0, results: int = 5) -> RunStep:
+    """Build a file_search run step with result content."""
+    return RunStep.model_validate(
+        {
+            "id": f"step_{index:06d}",
+            "object": "thread.run.step",
+            "created_at": 1713226574,
+            "assistant_id": "asst_000000",
+            "thread_id": "thread_abc123",
+            "run_id": "run_000000",
+            "type": "tool_calls",
+            "status": "completed",
+            "cancelled_at": None,
+            "completed_at": 1713226578,
+            "expired_at": None,
+            "failed_at": None,
+            "last_error": None,
+            "step_details": {
+                "type": "tool_calls",
+                "tool_calls": [
+                    {
+                        "id": "call_000000",
+                        "type": "file_search",
+                        "file_search": {
+                            "ranking_options": {
+                                "ranker": "default_2024_08_21",
+                                "score_threshold": 0.0,
+                            },
+                            "results": [
+                                {
+                                    "file_id": f"file_{n:06d}",
+                                    "file_name": f"policy_{n}.md",
+                                    "score": 0.9 - n / 100,
+                                    "content": [
+                                        {"type": "text", "text": INSTRUCTIONS[:800]}
+                                    ],
+                                }
+                                for n in range(results)
+                            ],
+                        },
+                    }
+                ],
+            },
+            "usage": {
+                "prompt_tokens": 900,
+                "completion_tokens": 40,
+                "total_tokens": 940,
+            },
+            "metadata": {},
+        }
+    )
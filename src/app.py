@@ -0,0 +1,60 @@
+"""FastMCP application shared by the tool handler modules.
+
+Settings and logging are set up here, before any handler module registers its
+tools on ``mcp``.
+"""
+
+import logging
+from typing import Any, Dict, List, Sequence, Union
+
+from mcp.server.fastmcp import FastMCP
+from mcp.types import EmbeddedResource, ImageContent, TextContent
+from mcp.types import Tool as MCPTool
+
+from .catalog import compact_tools
+from .config.settings import Settings
+from .encoding import get_encoder, to_content
+
+# Load settings
+settings = Settings()
+
+# Configure logging
+logging.basicConfig(
+    level=getattr(logging, settings.LOG_LEVEL),
+    format="%(asctime)s [%(levelname)s] %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+logger = logging.getLogger(__name__)
+logger.info("Loaded settings: %s", settings)
+
+
+class AssistantMCP(FastMCP):
+    """FastMCP server with a configurable tool catalog and result encoder."""
+
+    async def list_tools(self) -> List[MCPTool]:
+        """List tools, in compact form when COMPACT_TOOL_CATALOG is set."""
+        tools = await super().list_tools()
+        if not settings.COMPACT_TOOL_CATALOG:
+            return tools
+        return compact_tools(tools)
+
+    async def call_tool(
+        self, name: str, arguments: Dict[str, Any]
+    ) -> Sequence[Union[TextContent, ImageContent, EmbeddedResource]]:
+        """Call a tool by name with arguments."""
+        context = self.get_context()
+        result = await self._tool_manager.call_tool(name, arguments, context=context)
+        return to_content(result)
+
+
+# Fail at startup rather than on the first tool call if the encoder is missing
+get_encoder(settings.RESULT_ENCODER)
+
+# Initialize FastMCP server
+logger.info("Creating FastMCP server")
+mcp = AssistantMCP(
+    "openai-assistant-api",
+    host=settings.HOST,
+    port=settings.PORT,
+)
+logger.info("FastMCP server created: %s", mcp)
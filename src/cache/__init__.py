@@ -0,0 +1,19 @@
+"""Caching package."""
+
+from .store import (
+    CacheEntry,
+    TTLCache,
+    estimate_size,
+    get_cache,
+    list_caches,
+    register_cache,
+)
+
+__all__ = [
+    "CacheEntry",
+    "TTLCache",
+    "estimate_size",
+    "get_cache",
+    "list_caches",
+    "register_cache",
+]
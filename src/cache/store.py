@@ -0,0 +1,247 @@
+"""In-process TTL/LRU cache used for OpenAI objects.
+
+Caches are registered by name so they can be inspected and flushed from a
+single place. Every cache is bounded by entry count and, optionally, by an
+estimated byte budget.
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Generic, List, Optional, TypeVar
+
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+V = TypeVar("V")
+
+
+def estimate_size(value: Any) -> int:
+    """Estimate the serialized size of a cached value in bytes."""
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, str):
+        return len(value.encode("utf-8"))
+    if isinstance(value, BaseModel):
+        return len(value.model_dump_json())
+    try:
+        return len(json.dumps(value, default=str))
+    except (TypeError, ValueError):
+        return 0
+
+
+@dataclass
+class CacheEntry(Generic[V]):
+    """A cached value with its size and insertion time."""
+
+    value: V
+    size: int
+    stored_at: float
+
+
+class TTLCache(Generic[V]):
+    """Thread-safe LRU cache with per-entry time-to-live.
+
+    A cache with ``enabled=False`` never stores anything, so callers can use it
+    unconditionally and let settings decide whether caching takes effect.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_entries: int,
+        ttl_seconds: float,
+        max_bytes: int = 0,
+        enabled: bool = True,
+        sizeof: Callable[[Any], int] = estimate_size,
+    ) -> None:
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self._sizeof = sizeof
+        self._entries: "OrderedDict[str, CacheEntry[V]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return self.peek(key) is not None
+
+    def _expired(self, entry: CacheEntry[V], now: float) -> bool:
+        return self.ttl_seconds > 0 and now - entry.stored_at > self.ttl_seconds
+
+    def _remove(self, key: str) -> Optional[CacheEntry[V]]:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+        return entry
+
+    def _evict(self, key: str) -> None:
+        if self._remove(key) is not None:
+            self.evictions += 1
+
+    def peek(self, key: str) -> Optional[V]:
+        """Return a live value without touching LRU order or hit counters."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or self._expired(entry, time.monotonic()):
+                return None
+            return entry.value
+
+    def get(self, key: str) -> Optional[V]:
+        """Return the cached value for ``key`` or None on miss or expiry."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._expired(entry, time.monotonic()):
+                self._evict(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.value
+
+    def set(self, key: str, value: V) -> None:
+        """Store ``value`` under ``key``, evicting old entries to stay in bounds."""
+        if not self.enabled:
+            return
+        size = self._sizeof(value)
+        if self.max_bytes and size > self.max_bytes:
+            logger.debug(f"Not caching {key} in {self.name}: {size} bytes over budget")
+            with self._lock:
+                self._evict(key)
+            return
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = CacheEntry(value, size, time.monotonic())
+            self._bytes += size
+            while self._entries and (
+                len(self._entries) > self.max_entries
+                or (self.max_bytes and self._bytes > self.max_bytes)
+            ):
+                self._evict(next(iter(self._entries)))
+
+    def pop(self, key: str) -> Optional[V]:
+        """Remove ``key`` and return its value if it was cached."""
+        with self._lock:
+            entry = self._remove(key)
+            return entry.value if entry is not None else None
+
+    def invalidate(self, key: str) -> bool:
+        """Drop ``key`` on operator request and report whether it was cached."""
+        with self._lock:
+            if self._remove(key) is None:
+                return False
+            self.invalidations += 1
+            return True
+
+    def invalidate_prefix(self, prefix: str) -> int:
+        """Drop every key starting with ``prefix`` and return how many were cached."""
+        with self._lock:
+            keys = [key for key in self._entries if key.startswith(prefix)]
+            for key in keys:
+                self._remove(key)
+            self.invalidations += len(keys)
+            return len(keys)
+
+    def values(self) -> List[V]:
+        """Return all live values, dropping expired entries."""
+        with self._lock:
+            now = time.monotonic()
+            for key in [k for k, e in self._entries.items() if self._expired(e, now)]:
+                self._evict(key)
+            return [entry.value for entry in self._entries.values()]
+
+    def clear(self) -> int:
+        """Remove every entry and return how many were dropped."""
+        with self._lock:
+            count = len(self._entries)
+            self._entries.clear()
+            self._bytes = 0
+            self.invalidations += count
+            return count
+
+    def age_distribution(self) -> Dict[str, float]:
+        """Return min, median, p90 and max entry age in seconds."""
+        with self._lock:
+            now = time.monotonic()
+            ages = sorted(now - entry.stored_at for entry in self._entries.values())
+        if not ages:
+            return {}
+        return {
+            "min": ages[0],
+            "p50": ages[len(ages) // 2],
+            "p90": ages[min(len(ages) - 1, int(len(ages) * 0.9))],
+            "max": ages[-1],
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        """Return counters describing the cache's current state."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "age_seconds": self.age_distribution(),
+            }
+
+
+_registry: Dict[str, TTLCache] = {}
+
+
+def register_cache(
+    name: str,
+    max_entries: int,
+    ttl_seconds: float,
+    max_bytes: int = 0,
+    enabled: bool = True,
+    sizeof: Callable[[Any], int] = estimate_size,
+) -> TTLCache:
+    """Create a named cache and add it to the registry."""
+    cache: TTLCache = TTLCache(
+        name,
+        max_entries=max_entries,
+        ttl_seconds=ttl_seconds,
+        max_bytes=max_bytes,
+        enabled=enabled,
+        sizeof=sizeof,
+    )
+    _registry[name] = cache
+    return cache
+
+
+def get_cache(name: str) -> TTLCache:
+    """Return a registered cache by name."""
+    if name not in _registry:
+        raise ValueError(f"Unknown cache: {name}")
+    return _registry[name]
+
+
+def list_caches() -> List[TTLCache]:
+    """Return all registered caches."""
+    return list(_registry.values())
@@ -0,0 +1,17 @@
+"""Tool catalog package."""
+
+from .compact import (
+    catalog_size,
+    compact_description,
+    compact_schema,
+    compact_tools,
+    estimate_tokens,
+)
+
+__all__ = [
+    "catalog_size",
+    "compact_description",
+    "compact_schema",
+    "compact_tools",
+    "estimate_tokens",
+]
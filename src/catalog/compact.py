@@ -0,0 +1,109 @@
+"""Compact form of the tools/list catalog.
+
+Every session and every model context pays for the tool catalog. Most of its
+size is the "Returns:" section of each tool's docstring and the parts of the
+pydantic input schemas a client does not need: generated titles, the
+``{"type": "null"}`` branch and ``null`` default of every optional argument,
+and discriminator mappings that repeat the ``oneOf`` references. Compact mode
+drops them; argument names, types, constraints and descriptions are kept.
+"""
+
+import inspect
+import json
+import re
+from typing import Any, Dict, List
+
+from mcp.types import Tool as MCPTool
+
+# Keywords holding a single subschema, a mapping of subschemas or a list of them
+_SCHEMA_KEYWORDS = ("items", "additionalProperties", "not")
+_SCHEMA_MAP_KEYWORDS = ("properties", "$defs", "definitions", "patternProperties")
+_SCHEMA_LIST_KEYWORDS = ("anyOf", "allOf", "oneOf", "prefixItems")
+# Annotations a client does not need to call the tool
+_DROPPED_KEYWORDS = ("title", "discriminator")
+
+_RETURNS_SECTION = re.compile(r"^\s*Returns:\s*$", re.MULTILINE)
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the model tokens of JSON text at about four bytes per token."""
+    return (len(text.encode("utf-8")) + 3) // 4
+
+
+def catalog_size(tools: List[MCPTool]) -> Dict[str, int]:
+    """Return the byte size and token estimate of a tools/list result."""
+    body = json.dumps(
+        {"tools": [tool.model_dump(mode="json", exclude_none=True) for tool in tools]}
+    )
+    return {"bytes": len(body.encode("utf-8")), "tokens": estimate_tokens(body)}
+
+
+def compact_description(description: str) -> str:
+    """Cut a tool docstring before its "Returns:" section and dedent it."""
+    return inspect.cleandoc(_RETURNS_SECTION.split(description, maxsplit=1)[0])
+
+
+def _optional_member(schema: Any) -> Any:
+    """Drop the null branch of an optional argument whose default is null."""
+    if not isinstance(schema, dict):
+        return schema
+    branches = schema.get("anyOf")
+    if (
+        "default" not in schema
+        or schema["default"] is not None
+        or not isinstance(branches, list)
+        or {"type": "null"} not in branches
+    ):
+        return schema
+    rest = [branch for branch in branches if branch != {"type": "null"}]
+    collapsed = {k: v for k, v in schema.items() if k not in ("anyOf", "default")}
+    if len(rest) == 1 and isinstance(rest[0], dict):
+        return {**rest[0], **collapsed}
+    return {"anyOf": rest, **collapsed}
+
+
+def compact_schema(schema: Any) -> Any:
+    """
+    Drop titles, discriminators and null branches of optional arguments.
+
+    Args:
+        schema: (REQUIRED) JSON schema as generated by pydantic
+
+    Returns:
+        A new schema; ``schema`` is not modified
+    """
+    if not isinstance(schema, dict):
+        return schema
+    compacted: Dict[str, Any] = {}
+    for keyword, value in schema.items():
+        if keyword in _DROPPED_KEYWORDS:
+            continue
+        if keyword in _SCHEMA_KEYWORDS:
+            value = compact_schema(value)
+        elif keyword in _SCHEMA_MAP_KEYWORDS and isinstance(value, dict):
+            value = {name: compact_schema(sub) for name, sub in value.items()}
+        elif keyword in _SCHEMA_LIST_KEYWORDS and isinstance(value, list):
+            value = [compact_schema(sub) for sub in value]
+        compacted[keyword] = value
+
+    properties = compacted.get("properties")
+    if isinstance(properties, dict):
+        required = set(compacted.get("required", ()))
+        compacted["properties"] = {
+            name: sub if name in required else _optional_member(sub)
+            for name, sub in properties.items()
+        }
+    return compacted
+
+
+def compact_tools(tools: List[MCPTool]) -> List[MCPTool]:
+    """Return the compact form of a tools/list catalog."""
+    return [
+        tool.model_copy(
+            update={
+                "description": compact_description(tool.description or ""),
+                "inputSchema": compact_schema(tool.inputSchema),
+            }
+        )
+        for tool in tools
+    ]
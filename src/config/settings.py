@@ -41,6 +41,64 @@ class Settings(BaseSettings):
     # OpenAI Settings
     OPENAI_API_KEY: str = ""
 
+    # Caching
+    CACHE_ENABLED: bool = False
+    ASSISTANT_CACHE_MAX_ENTRIES: int = 1000
+    ASSISTANT_CACHE_TTL_SECONDS: float = 900.0
+    # Warm the assistant cache at startup and refresh it in the background
+    ASSISTANT_CACHE_WARMUP: bool = False
+    ASSISTANT_CACHE_REFRESH_SECONDS: float = 300.0
+    # Compressed run steps with file_search result content, bounded by bytes
+    RUN_STEP_CONTENT_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    RUN_STEP_CONTENT_CACHE_TTL_SECONDS: float = 3600.0
+
+    # Prefetch the next page of list_messages, list_runs and list_run_steps
+    LIST_PREFETCH_ENABLED: bool = False
+    LIST_PREFETCH_MAX_PAGES: int = 16
+    LIST_PREFETCH_MAX_BYTES: int = 16 * 1024 * 1024
+    LIST_PREFETCH_TTL_SECONDS: float = 30.0
+    LIST_PREFETCH_WORKERS: int = 4
+
+    # Upper bound on threads written to concurrently by batch tools
+    BATCH_MAX_CONCURRENCY: int = 8
+    # Retries of a rate-limited batch item; the delay doubles when the API
+    # sends no retry-after header
+    BATCH_RATE_LIMIT_RETRIES: int = 3
+    BATCH_RATE_LIMIT_BACKOFF_SECONDS: float = 1.0
+    # Interval of the shared poller used by fan_out_runs
+    FAN_OUT_POLL_SECONDS: float = 1.0
+    # Consecutive failed polls after which fan_out_runs gives up on a run
+    FAN_OUT_MAX_POLL_FAILURES: int = 5
+    # Initial messages accepted by one create thread request
+    THREAD_CREATE_MAX_MESSAGES: int = 32
+
+    # Serialize tool results without null fields, defaults and empty lists
+    COMPACT_RESPONSES: bool = False
+    # Advertise short tool descriptions and trimmed input schemas in tools/list
+    COMPACT_TOOL_CATALOG: bool = False
+    # Comma-separated tool domains to register:
+    # assistants, threads, messages, runs, run_steps
+    ENABLED_DOMAINS: str = "assistants,threads,messages,runs,run_steps"
+    # JSON encoder for tool results: auto (orjson when installed), orjson or stdlib
+    RESULT_ENCODER: str = "auto"
+    # Split tool results larger than this many bytes (0 = no cap); the remaining
+    # slices are held for get_result_continuation
+    MAX_RESULT_BYTES: int = 0
+    RESULT_CONTINUATION_TTL_SECONDS: float = 300.0
+    RESULT_CONTINUATION_MAX_ENTRIES: int = 4096
+    RESULT_CONTINUATION_MAX_BYTES: int = 64 * 1024 * 1024
+
+    # Directory export_thread, export_threads and iter_thread_messages write
+    # into; output paths from callers are resolved inside it
+    EXPORT_DIR: str = "exports"
+
+    # Thread mirror (kept only with CACHE_ENABLED)
+    THREAD_MIRROR_MAX_THREADS: int = 200
+    THREAD_MIRROR_MAX_BYTES: int = 256 * 1024 * 1024
+    # Age after which patch_metadata re-fetches mirrored objects that can
+    # still change instead of merging into their mirrored metadata
+    THREAD_MIRROR_MAX_AGE_SECONDS: float = 30.0
+
     model_config = {
         "env_file": ".env",
         "env_file_encoding": "utf-8",
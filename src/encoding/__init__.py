@@ -0,0 +1,27 @@
+"""Tool result encoding package."""
+
+from .continuation import get_continuation, limit_result, split_result
+from .encoders import (
+    available_encoders,
+    encode_orjson,
+    encode_result,
+    encode_stdlib,
+    get_encoder,
+    register_encoder,
+    to_content,
+)
+
+__all__ = [
+    # Encoders
+    "available_encoders",
+    "encode_orjson",
+    "encode_result",
+    "encode_stdlib",
+    "get_encoder",
+    "register_encoder",
+    "to_content",
+    # Result size caps
+    "get_continuation",
+    "limit_result",
+    "split_result",
+]
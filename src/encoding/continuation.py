@@ -0,0 +1,222 @@
+"""Size caps on tool results with continuation tokens.
+
+With MAX_RESULT_BYTES set, a tool result whose JSON is larger than the cap is
+split into slices. JSON is split between the items of its largest list, such as
+the messages of a page or the results of a file_search step, and each slice
+keeps the rest of the object around its share of the items. A slice that is
+still over the cap, like a single huge message, is cut into ``partial`` text
+pieces that join back into its JSON. Each piece names the ``value`` it belongs
+to (counting the slices and split values of the result), its ``part`` number
+within that value and whether it is the ``final`` part, so two oversized items
+in a row are joined separately.
+
+Every slice carries a ``continuation`` object; its ``token`` fetches the next
+slice with ``get_result_continuation`` and is null on the last one. Slices wait
+in the ``result_continuations`` cache for RESULT_CONTINUATION_TTL_SECONDS.
+"""
+
+import json
+import secrets
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from src.cache import TTLCache, register_cache
+from src.config.settings import Settings
+from src.metrics import increment
+
+settings = Settings()
+
+# Smallest cap honoured, leaving room for the continuation object
+MIN_RESULT_BYTES = 1024
+
+# Stand in for the continuation object and piece position while slices are sized
+_PLACEHOLDER = {"token": "x" * 22, "slice": 99999, "slices": 99999}
+_PART_PLACEHOLDER = {"value": 99999, "part": 99999, "final": False}
+
+continuation_cache: TTLCache[str] = register_cache(
+    "result_continuations",
+    max_entries=settings.RESULT_CONTINUATION_MAX_ENTRIES,
+    ttl_seconds=settings.RESULT_CONTINUATION_TTL_SECONDS,
+    max_bytes=settings.RESULT_CONTINUATION_MAX_BYTES,
+)
+
+Path = Tuple[Any, ...]
+# A slice is either a JSON value or a piece of JSON text
+Piece = Tuple[str, Any]
+
+
+def _size(value: Any) -> int:
+    """Return the size of ``value`` encoded as JSON, in bytes."""
+    return len(json.dumps(value).encode("utf-8"))
+
+
+def _lists(value: Any, path: Path = ()) -> Iterator[Tuple[Path, List[Any]]]:
+    """Yield the path and value of every list with more than one item."""
+    if isinstance(value, list):
+        if len(value) > 1:
+            yield path, value
+        children: Any = enumerate(value)
+    elif isinstance(value, dict):
+        children = value.items()
+    else:
+        return
+    for key, child in children:
+        yield from _lists(child, path + (key,))
+
+
+def _replace(value: Any, path: Path, new: Any) -> Any:
+    """Return a copy of ``value`` with the item at ``path`` replaced by ``new``."""
+    if not path:
+        return new
+    copy: Any = dict(value) if isinstance(value, dict) else list(value)
+    copy[path[0]] = _replace(value[path[0]], path[1:], new)
+    return copy
+
+
+def _with_continuation(value: Any, continuation: Dict[str, Any]) -> Dict[str, Any]:
+    """Attach the continuation object, wrapping values that are not objects."""
+    if isinstance(value, dict):
+        return {**value, "continuation": continuation}
+    return {"data": value, "continuation": continuation}
+
+
+def _text_pieces(text: str, max_bytes: int, value: int = 0) -> List[Piece]:
+    """Cut the JSON text of one value into parts that fit the cap once wrapped."""
+    parts: List[str] = []
+    rest = text
+    while rest:
+        length = max_bytes
+        piece = rest[:length]
+        while length > 1 and (
+            _size({"partial": piece, **_PART_PLACEHOLDER, "continuation": _PLACEHOLDER})
+            > max_bytes
+        ):
+            length = length * 9 // 10
+            piece = rest[:length]
+        parts.append(piece)
+        rest = rest[length:]
+    return [
+        (
+            "partial",
+            {
+                "partial": piece,
+                "value": value,
+                "part": index,
+                "final": index == len(parts) - 1,
+            },
+        )
+        for index, piece in enumerate(parts)
+    ]
+
+
+def _list_pieces(value: Any, max_bytes: int) -> Optional[List[Piece]]:
+    """Split ``value`` between the items of its largest list."""
+    largest = max(_lists(value), key=lambda found: _size(found[1]), default=None)
+    if largest is None:
+        return None
+    path, items = largest
+    budget = max_bytes - _size(
+        _with_continuation(_replace(value, path, []), _PLACEHOLDER)
+    )
+    if budget <= 0:
+        return None
+
+    pieces: List[Piece] = []
+    batch: List[Any] = []
+    used = 0
+    for item in items:
+        # Items after the first are preceded by ", "
+        size = _size(item) + (2 if batch else 0)
+        if batch and used + size > budget:
+            pieces.append(("value", _replace(value, path, batch)))
+            batch, used, size = [], 0, size - 2
+        batch.append(item)
+        used += size
+    pieces.append(("value", _replace(value, path, batch)))
+
+    fitted: List[Piece] = []
+    for value, (kind, piece) in enumerate(pieces):
+        if _size(_with_continuation(piece, _PLACEHOLDER)) > max_bytes:
+            fitted.extend(_text_pieces(json.dumps(piece), max_bytes, value))
+        else:
+            fitted.append((kind, piece))
+    return fitted
+
+
+def split_result(text: str, max_bytes: int) -> List[Tuple[Optional[str], str]]:
+    """
+    Split an encoded tool result into slices of at most ``max_bytes``.
+
+    Args:
+        text: (REQUIRED) Encoded tool result, usually JSON
+        max_bytes: (REQUIRED) Largest slice size in bytes
+
+    Returns:
+        The token that fetches each slice (None for the first) and its JSON
+    """
+    max_bytes = max(max_bytes, MIN_RESULT_BYTES)
+    try:
+        pieces = _list_pieces(json.loads(text), max_bytes)
+    except ValueError:
+        pieces = None
+    if pieces is None:
+        pieces = _text_pieces(text, max_bytes)
+
+    tokens: List[Optional[str]] = [None]
+    tokens += [secrets.token_urlsafe(16) for _ in pieces[1:]]
+    slices = []
+    for index, (kind, piece) in enumerate(pieces):
+        continuation = {
+            "token": tokens[index + 1] if index + 1 < len(pieces) else None,
+            "slice": index + 1,
+            "slices": len(pieces),
+        }
+        if kind == "partial":
+            body = json.dumps({**piece, "continuation": continuation})
+        else:
+            body = json.dumps(_with_continuation(piece, continuation))
+        slices.append((tokens[index], body))
+    return slices
+
+
+def limit_result(text: str) -> str:
+    """
+    Cap an encoded tool result at MAX_RESULT_BYTES.
+
+    Args:
+        text: (REQUIRED) Encoded tool result
+
+    Returns:
+        ``text`` itself when it fits or no cap is set, otherwise its first slice;
+        the other slices are held for ``get_continuation``
+    """
+    max_bytes = settings.MAX_RESULT_BYTES
+    if not max_bytes or len(text.encode("utf-8")) <= max_bytes:
+        return text
+    (_, first), *rest = split_result(text, max_bytes)
+    for token, body in rest:
+        continuation_cache.set(token or "", body)
+    increment("result_continuation.results_split")
+    increment("result_continuation.slices_held", len(rest))
+    return first
+
+
+def get_continuation(token: str) -> str:
+    """
+    Return the slice held under a continuation token.
+
+    Args:
+        token: (REQUIRED) Token from the previous slice's continuation object
+
+    Returns:
+        JSON of the slice
+
+    Raises:
+        ValueError: If the token is unknown or its slice has expired
+    """
+    body = continuation_cache.get(token)
+    if body is None:
+        raise ValueError(
+            f"Continuation token {token} is unknown or has expired; "
+            "repeat the original call"
+        )
+    return body
@@ -0,0 +1,110 @@
+"""JSON encoders for tool results.
+
+FastMCP encodes tool results with ``json.dumps`` over pydantic's jsonable
+conversion. orjson encodes the same values several times faster and is used
+when it is installed; ``RESULT_ENCODER`` picks an encoder by name and
+``register_encoder`` adds new ones.
+"""
+import json
+import logging
+from typing import Any, Callable, Dict, List, Sequence, Union
+
+import pydantic_core
+from mcp.server.fastmcp.server import _convert_to_content
+from mcp.server.fastmcp.utilities.types import Image
+from mcp.types import EmbeddedResource, ImageContent, TextContent
+
+from src.config.settings import Settings
+
+from .continuation import limit_result
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+settings = Settings()
+
+Encoder = Callable[[Any], str]
+Content = Union[TextContent, ImageContent, EmbeddedResource]
+
+
+def encode_stdlib(value: Any) -> str:
+    """Encode ``value`` the way FastMCP does by default."""
+    return json.dumps(pydantic_core.to_jsonable_python(value))
+
+
+def encode_orjson(value: Any) -> str:
+    """Encode ``value`` with orjson, converting SDK models through pydantic."""
+    try:
+        return orjson.dumps(
+            value,
+            default=pydantic_core.to_jsonable_python,
+            option=orjson.OPT_NON_STR_KEYS,
+        ).decode()
+    except TypeError:
+        # orjson rejects a few values, such as integers beyond 64 bits
+        return encode_stdlib(value)
+
+
+_encoders: Dict[str, Encoder] = {"stdlib": encode_stdlib}
+if orjson is not None:
+    _encoders["orjson"] = encode_orjson
+
+
+def register_encoder(name: str, encoder: Encoder) -> None:
+    """Make ``encoder`` selectable through RESULT_ENCODER."""
+    _encoders[name] = encoder
+
+
+def available_encoders() -> List[str]:
+    """Return the names of the encoders that can be selected."""
+    return sorted(_encoders)
+
+
+def get_encoder(name: str = "auto") -> Encoder:
+    """Return an encoder by name; 'auto' prefers orjson over the stdlib."""
+    if name == "auto":
+        name = "orjson" if "orjson" in _encoders else "stdlib"
+    if name not in _encoders:
+        raise ValueError(f"Unknown or unavailable result encoder: {name}")
+    return _encoders[name]
+
+
+def encode_result(value: Any) -> str:
+    """Encode a tool result with the configured encoder."""
+    return get_encoder(settings.RESULT_ENCODER)(value)
+
+
+def _is_content(value: Any) -> bool:
+    """Return whether ``value`` is content FastMCP converts itself."""
+    return isinstance(value, (Image, TextContent, ImageContent, EmbeddedResource))
+
+
+def to_content(result: Any) -> Sequence[Content]:
+    """
+    Convert a tool result into MCP content using the configured encoder.
+
+    MCP content objects, and lists holding them, keep FastMCP's own handling;
+    other results, plain lists included, become a single text content holding
+    their JSON. Strings and JSON are capped at MAX_RESULT_BYTES.
+
+    Args:
+        result: Value returned by a tool
+
+    Returns:
+        Content list sent back to the client
+    """
+    if isinstance(result, str):
+        return _convert_to_content(limit_result(result))
+    if result is None or _is_content(result):
+        return _convert_to_content(result)
+    if isinstance(result, (list, tuple)) and any(_is_content(r) for r in result):
+        return _convert_to_content(result)
+    try:
+        text = encode_result(result)
+    except Exception as e:
+        logger.warning(f"Encoding tool result failed, using FastMCP encoding: {e}")
+        return _convert_to_content(result)
+    return [TextContent(type="text", text=limit_result(text))]
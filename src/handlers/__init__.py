@@ -0,0 +1,58 @@
+"""MCP tool handlers, grouped by API domain.
+
+Each module registers its tools on the shared ``mcp`` app when it is imported,
+so only the modules of enabled domains are imported. Modules whose tools span
+several domains are loaded when all of the domains they need are enabled.
+"""
+
+import importlib
+from types import ModuleType
+from typing import Dict, FrozenSet, List
+
+DOMAINS = ("assistants", "threads", "messages", "runs", "run_steps")
+
+# Handler module -> domains that must be enabled for it to be loaded
+HANDLERS: Dict[str, FrozenSet[str]] = {
+    "assistants": frozenset({"assistants"}),
+    "threads": frozenset({"threads"}),
+    "messages": frozenset({"messages"}),
+    "runs": frozenset({"runs"}),
+    "run_steps": frozenset({"run_steps"}),
+    "metadata": frozenset({"threads", "messages", "runs"}),
+    "export": frozenset({"threads", "messages", "runs", "run_steps"}),
+    "mirror": frozenset({"threads", "messages", "runs", "run_steps"}),
+    "cache": frozenset(),
+    "results": frozenset(),
+}
+
+
+def parse_domains(value: str) -> FrozenSet[str]:
+    """
+    Parse a comma-separated list of domain names.
+
+    Args:
+        value: (REQUIRED) Domain names such as "runs,messages"
+
+    Returns:
+        The set of domain names
+
+    Raises:
+        ValueError: If a name is not a known domain
+    """
+    domains = frozenset(name.strip() for name in value.split(",") if name.strip())
+    unknown = sorted(domains - set(DOMAINS))
+    if unknown:
+        raise ValueError(
+            f"Unknown domains {unknown} in ENABLED_DOMAINS, expected any of {DOMAINS}"
+        )
+    return domains
+
+
+def load_handlers(value: str) -> List[ModuleType]:
+    """Import the handler modules of the enabled domains, registering their tools."""
+    domains = parse_domains(value)
+    return [
+        importlib.import_module(f"{__name__}.{module}")
+        for module, required in HANDLERS.items()
+        if required <= domains
+    ]
@@ -0,0 +1,359 @@
+"""Assistant MCP tools."""
+
+import json
+from functools import partial
+from typing import List, Literal, Optional
+
+import anyio
+from mcp.server.fastmcp import Context
+from openai.pagination import SyncCursorPage
+from openai.types.beta.assistant import Assistant
+from openai.types.beta.assistant_deleted import AssistantDeleted
+
+from ..app import mcp, settings
+from ..tools import BatchResult, Metadata, ResponseFormat, Tool, ToolResources
+from ..tools.assistant import create_assistant as tools_create_assistant
+from ..tools.assistant import delete_assistant as tools_delete_assistant
+from ..tools.assistant import delete_assistants as tools_delete_assistants
+from ..tools.assistant import get_assistant as tools_get_assistant
+from ..tools.assistant import get_assistants as tools_get_assistants
+from ..tools.assistant import list_all_assistants as tools_list_all_assistants
+from ..tools.assistant import list_assistants as tools_list_assistants
+from ..tools.assistant import modify_assistant as tools_modify_assistant
+from ..tools.assistant import start_assistant_cache_refresh
+from ..tools.projection import Shaped, shape
+
+# Warm the assistant cache in the background so list_assistants at session
+# start is served locally instead of waiting on the upstream list call
+if settings.CACHE_ENABLED and settings.ASSISTANT_CACHE_WARMUP:
+    start_assistant_cache_refresh()
+
+__all__ = [
+    "create_assistant",
+    "get_assistant",
+    "get_assistants",
+    "list_assistants",
+    "modify_assistant",
+    "delete_assistant",
+    "delete_assistants",
+]
+
+
+@mcp.tool()
+def create_assistant(
+    model: str,
+    name: Optional[str] = None,
+    description: Optional[str] = None,
+    instructions: Optional[str] = None,
+    tools: Optional[List[Tool]] = None,
+    tool_resources: Optional[ToolResources] = None,
+    metadata: Optional[Metadata] = None,
+    temperature: Optional[float] = None,
+    top_p: Optional[float] = None,
+    response_format: Optional[ResponseFormat] = None,
+    reasoning_effort: Optional[Literal["low", "medium", "high"]] = None,
+) -> Shaped[Assistant]:
+    """
+    Create an assistant.
+
+    This is typically the first step in the workflow before creating threads
+    and messages.
+
+    Args:
+        model: (REQUIRED) ID of the model to use
+        name: Name of the assistant (max 256 chars)
+        description: Description of the assistant (max 512 chars)
+        instructions: System instructions (max 256k chars)
+        tools: List of tools (max 128 tools)
+        tool_resources: Resources for tools
+        metadata: Key-value pairs (max 16 pairs)
+        temperature: Sampling temperature (0-2)
+        top_p: Nucleus sampling parameter (0-1)
+        response_format: Output format specification
+        reasoning_effort: Reasoning effort level (low/medium/high)
+
+    Returns:
+        AssistantObject: The created assistant containing:
+        - id: The unique identifier for the assistant
+        - object: Always "assistant"
+        - created_at: Unix timestamp when the assistant was created
+        - model: ID of the model being used
+        - name: The assistant's name (max 256 chars)
+        - description: The assistant's description (max 512 chars)
+        - instructions: System instructions for the assistant (max 256k chars)
+        - tools: List of enabled tools (max 128 tools)
+        - tool_resources: Resources used by the assistant's tools
+        - metadata: Key-value pairs attached to the object
+        - temperature: Sampling temperature (0-2)
+        - top_p: Nucleus sampling parameter (0-1)
+        - response_format: Output format specification
+    """
+    return shape(
+        tools_create_assistant(
+            model=model,
+            name=name,
+            description=description,
+            instructions=instructions,
+            tools=tools,
+            tool_resources=tool_resources,
+            metadata=metadata,
+            temperature=temperature,
+            top_p=top_p,
+            response_format=response_format,
+            reasoning_effort=reasoning_effort,
+        )
+    )
+
+
+@mcp.tool()
+def get_assistant(
+    assistant_id: str,
+    fields: Optional[List[str]] = None,
+    compact: Optional[bool] = None,
+) -> Shaped[Assistant]:
+    """
+    Get assistant by ID.
+
+    Use this to retrieve an assistant's configuration after creation.
+
+    Args:
+        assistant_id: (REQUIRED) The ID of the assistant to retrieve
+        fields: Only return these fields, e.g. ["id", "name", "model"];
+            dotted paths select nested fields
+        compact: Drop null fields, defaults and empty lists from the result
+            (default COMPACT_RESPONSES)
+
+    Returns:
+        AssistantObject: The assistant containing:
+        - id: The unique identifier for the assistant
+        - object: Always "assistant"
+        - created_at: Unix timestamp when the assistant was created
+        - model: ID of the model being used
+        - name: The assistant's name (max 256 chars)
+        - description: The assistant's description (max 512 chars)
+        - instructions: System instructions for the assistant (max 256k chars)
+        - tools: List of enabled tools (max 128 tools)
+        - tool_resources: Resources used by the assistant's tools
+        - metadata: Key-value pairs attached to the object
+        - temperature: Sampling temperature (0-2)
+        - top_p: Nucleus sampling parameter (0-1)
+        - response_format: Output format specification
+    """
+    return shape(tools_get_assistant(assistant_id), fields, compact)
+
+
+@mcp.tool()
+async def get_assistants(
+    assistant_ids: List[str],
+    max_concurrency: Optional[int] = None,
+    fields: Optional[List[str]] = None,
+    compact: Optional[bool] = None,
+) -> Shaped[BatchResult]:
+    """
+    Retrieve many assistants in one call.
+
+    Use this to show several assistants at once instead of calling get_assistant
+    once per ID. Repeated IDs are fetched once, cached assistants are served
+    locally, and the rest are fetched concurrently.
+
+    Args:
+        assistant_ids: (REQUIRED) The IDs of the assistants to retrieve
+        max_concurrency: Number of requests run at once (default 8)
+        fields: Only return these fields, e.g. ["id", "name", "model"];
+            dotted paths select nested fields
+        compact: Drop null fields, defaults and empty lists from the result
+            (default COMPACT_RESPONSES)
+
+    Returns:
+        BatchResult containing:
+        - succeeded: Number of IDs retrieved
+        - failed: Number of IDs that could not be retrieved
+        - skipped: Always 0 for this tool
+        - items: One entry per requested ID, in request order, with index,
+          group (the ID), status, result (AssistantObject) and error
+    """
+    return shape(
+        await anyio.to_thread.run_sync(
+            partial(
+                tools_get_assistants,
+                assistant_ids=assistant_ids,
+                max_concurrency=max_concurrency,
+            )
+        ),
+        fields,
+        compact,
+    )
+
+
+@mcp.tool()
+async def list_assistants(
+    ctx: Context,
+    limit: Optional[int] = None,
+    order: Optional[Literal["asc", "desc"]] = None,
+    after: Optional[str] = None,
+    before: Optional[str] = None,
+    all: bool = False,
+    fields: Optional[List[str]] = None,
+    compact: Optional[bool] = None,
+) -> Shaped[SyncCursorPage[Assistant]]:
+    """
+    List assistants.
+
+    Use this to view all available assistants. Pass all=True to page through
+    every assistant in one call; each page is reported as it arrives through
+    progress notifications (assistant count) and an info log message (JSON
+    array of the page's assistant IDs), while the assistants themselves are
+    only in the result.
+
+    Args:
+        limit: Limit on number of assistants (1-100, default 20)
+        order: Sort order by created_at ('asc' or 'desc', default 'desc')
+        after: Cursor for pagination (get assistants after this ID)
+        before: Cursor for pagination (get assistants before this ID)
+        all: Return every assistant, ignoring limit and cursors
+        fields: Only return these fields, e.g. ["id", "name", "model"];
+            dotted paths select nested fields
+        compact: Drop null fields, defaults and empty lists from the result
+            (default COMPACT_RESPONSES)
+
+    Returns:
+        AssistantListResponse: The list of assistants containing:
+        - data: Array of AssistantObject items
+        - has_more: Whether there are more assistants to fetch
+    """
+    if all:
+
+        async def report_page(page: SyncCursorPage[Assistant], count: int) -> None:
+            await ctx.report_progress(count)
+            await ctx.info(json.dumps([assistant.id for assistant in page.data]))
+
+        return shape(
+            await tools_list_all_assistants(order=order or "desc", on_page=report_page),
+            fields,
+            compact,
+        )
+
+    return shape(
+        tools_list_assistants(limit=limit, order=order, after=after, before=before),
+        fields,
+        compact,
+    )
+
+
+@mcp.tool()
+def modify_assistant(
+    assistant_id: str,
+    model: Optional[str] = None,
+    name: Optional[str] = None,
+    description: Optional[str] = None,
+    instructions: Optional[str] = None,
+    tools: Optional[List[Tool]] = None,
+    tool_resources: Optional[ToolResources] = None,
+    metadata: Optional[Metadata] = None,
+    temperature: Optional[float] = None,
+    top_p: Optional[float] = None,
+    response_format: Optional[ResponseFormat] = None,
+    reasoning_effort: Optional[Literal["low", "medium", "high"]] = None,
+) -> Shaped[Assistant]:
+    """
+    Modify an assistant.
+
+    Use this to update an assistant's configuration after creation.
+
+    Args:
+        assistant_id: (REQUIRED) The ID of the assistant to modify
+        model: ID of the model to use
+        name: Name of the assistant (max 256 chars)
+        description: Description of the assistant (max 512 chars)
+        instructions: System instructions (max 256k chars)
+        tools: List of tools (max 128 tools)
+        tool_resources: Resources for tools
+        metadata: Key-value pairs (max 16 pairs)
+        temperature: Sampling temperature (0-2)
+        top_p: Nucleus sampling parameter (0-1)
+        response_format: Output format specification
+        reasoning_effort: Reasoning effort level (low/medium/high)
+
+    Returns:
+        AssistantObject: The assistant containing:
+        - id: The unique identifier for the assistant
+        - object: Always "assistant"
+        - created_at: Unix timestamp when the assistant was created
+        - model: ID of the model being used
+        - name: The assistant's name (max 256 chars)
+        - description: The assistant's description (max 512 chars)
+        - instructions: System instructions for the assistant (max 256k chars)
+        - tools: List of enabled tools (max 128 tools)
+        - tool_resources: Resources used by the assistant's tools
+        - metadata: Key-value pairs attached to the object
+        - temperature: Sampling temperature (0-2)
+        - top_p: Nucleus sampling parameter (0-1)
+        - response_format: Output format specification
+    """
+    return shape(
+        tools_modify_assistant(
+            assistant_id=assistant_id,
+            model=model,
+            name=name,
+            description=description,
+            instructions=instructions,
+            tools=tools,
+            tool_resources=tool_resources,
+            metadata=metadata,
+            temperature=temperature,
+            top_p=top_p,
+            response_format=response_format,
+            reasoning_effort=reasoning_effort,
+        )
+    )
+
+
+@mcp.tool()
+def delete_assistant(assistant_id: str) -> AssistantDeleted:
+    """
+    Delete an assistant.
+
+    Permanently removes an assistant and its configuration.
+
+    Args:
+        assistant_id: (REQUIRED) The ID of the assistant to delete
+
+    Returns:
+        DeleteAssistantResponse: The deletion confirmation containing:
+        - id: The ID of the deleted assistant
+        - object: Always "assistant.deleted"
+        - deleted: Boolean indicating whether the assistant was successfully deleted
+    """
+    return tools_delete_assistant(assistant_id)
+
+
+@mcp.tool()
+async def delete_assistants(
+    assistant_ids: List[str], max_concurrency: Optional[int] = None
+) -> BatchResult:
+    """
+    Delete many assistants in one call.
+
+    Use this for cleanup jobs instead of calling delete_assistant once per ID.
+    Deletions run concurrently and pause together when rate limited. Cached
+    copies of deleted assistants are evicted.
+
+    Args:
+        assistant_ids: (REQUIRED) The IDs of the assistants to delete
+        max_concurrency: Number of deletions run at once (default 8)
+
+    Returns:
+        BatchResult containing:
+        - succeeded: Number of assistants deleted
+        - failed: Number of deletions that failed
+        - skipped: Number of repeated IDs not attempted after a failure
+        - items: One entry per ID, in request order, with index, group
+          (the assistant ID), status, result (DeleteAssistantResponse) and error
+    """
+    return await anyio.to_thread.run_sync(
+        partial(
+            tools_delete_assistants,
+            assistant_ids=assistant_ids,
+            max_concurrency=max_concurrency,
+        )
+    )
@@ -0,0 +1,77 @@
+"""Cache operation MCP tools."""
+
+from typing import Any, Dict, Optional
+
+from ..app import mcp
+from ..tools.cache import flush_caches as tools_flush_caches
+from ..tools.cache import get_cache_stats as tools_get_cache_stats
+from ..tools.cache import invalidate_cache as tools_invalidate_cache
+
+__all__ = [
+    "get_cache_stats",
+    "invalidate_cache",
+    "flush_caches",
+]
+
+
+@mcp.tool()
+def get_cache_stats(name: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Get cache statistics.
+
+    Use this to diagnose stale data or memory pressure in the server caches.
+
+    Args:
+        name: Name of a single cache to report (default all caches)
+
+    Returns:
+        Dict containing:
+        - caches: Per-cache stats keyed by cache name
+            - enabled: Whether the cache stores entries
+            - entries: Number of cached entries
+            - bytes: Estimated size of cached entries
+            - hit_rate: Fraction of lookups served from the cache
+            - evictions: Entries dropped for size or expiry
+            - invalidations: Entries dropped by invalidation or flush
+            - age_seconds: Entry age distribution (min/p50/p90/max)
+        - metrics: Server metrics counters
+    """
+    return tools_get_cache_stats(name)
+
+
+@mcp.tool()
+def invalidate_cache(
+    name: str,
+    object_id: Optional[str] = None,
+    prefix: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Invalidate cache entries by object ID or key prefix.
+
+    Use this to force the next read of an object to go to the OpenAI API.
+
+    Args:
+        name: (REQUIRED) Name of the cache (see get_cache_stats)
+        object_id: ID of the object to drop
+        prefix: Drop every entry whose key starts with this prefix
+
+    Returns:
+        Dict containing:
+        - name: The cache name
+        - invalidated: Number of entries dropped
+    """
+    return tools_invalidate_cache(name, object_id=object_id, prefix=prefix)
+
+
+@mcp.tool()
+def flush_caches(name: Optional[str] = None) -> Dict[str, int]:
+    """
+    Remove every entry from one or all caches.
+
+    Args:
+        name: Name of a single cache to flush (default all caches)
+
+    Returns:
+        Dict mapping cache name to number of entries removed
+    """
+    return tools_flush_caches(name)
@@ -0,0 +1,97 @@
+"""Thread export MCP tools."""
+
+from functools import partial
+from typing import Any, Dict, List, Optional
+
+import anyio
+
+from ..app import mcp
+from ..tools import BatchResult
+from ..tools.export import export_thread as tools_export_thread
+from ..tools.export import export_threads as tools_export_threads
+
+__all__ = [
+    "export_thread",
+    "export_threads",
+]
+
+
+@mcp.tool()
+async def export_thread(
+    thread_id: str, output_path: str, include_steps: bool = True
+) -> Dict[str, Any]:
+    """
+    Export a whole thread to a JSONL file on the server's disk.
+
+    Use this for compliance or archival exports. The thread, all its
+    messages, all its runs and their run steps (with file_search result
+    content) are written one JSON line per record as they are fetched, so
+    threads of any length can be exported. Paths ending in .gz are
+    gzip-compressed. The file only appears at output_path once the export
+    has finished. Files can only be written inside the server's EXPORT_DIR.
+
+    Args:
+        thread_id: (REQUIRED) The ID of the thread to export
+        output_path: (REQUIRED) File to write, relative to EXPORT_DIR,
+            e.g. 'archive/thread.jsonl.gz'
+        include_steps: Whether to export run steps (default True)
+
+    Returns:
+        Dict containing:
+        - thread_id: The exported thread
+        - output_path: The absolute path of the file written
+        - messages: Number of messages written
+        - runs: Number of runs written
+        - run_steps: Number of run steps written
+        - bytes: Size of the file
+        Each line of the file is {"type": "thread" | "message" | "run" |
+        "run_step", "data": <object>}
+    """
+    return await anyio.to_thread.run_sync(
+        partial(
+            tools_export_thread, thread_id, output_path, include_steps=include_steps
+        )
+    )
+
+
+@mcp.tool()
+async def export_threads(
+    thread_ids: List[str],
+    output_dir: str,
+    compress: bool = True,
+    include_steps: bool = True,
+    max_concurrency: Optional[int] = None,
+) -> BatchResult:
+    """
+    Export many threads in parallel, one JSONL file per thread.
+
+    Works like export_thread for each thread, writing
+    '<output_dir>/<thread_id>.jsonl.gz' (or '.jsonl' without compression).
+
+    Args:
+        thread_ids: (REQUIRED) The IDs of the threads to export
+        output_dir: (REQUIRED) Directory to write the files into, relative to
+            EXPORT_DIR ('.' for EXPORT_DIR itself)
+        compress: Whether to gzip the files (default True)
+        include_steps: Whether to export run steps (default True)
+        max_concurrency: Number of threads exported at once (default 8)
+
+    Returns:
+        BatchResult containing:
+        - succeeded: Number of threads exported
+        - failed: Number of threads that could not be exported
+        - skipped: Repeats of a thread ID not attempted because an earlier
+          export of the same thread failed
+        - items: One entry per thread, in request order, with index, group
+          (the thread ID), status, result (the export_thread summary) and error
+    """
+    return await anyio.to_thread.run_sync(
+        partial(
+            tools_export_threads,
+            thread_ids,
+            output_dir,
+            compress=compress,
+            include_steps=include_steps,
+            max_concurrency=max_concurrency,
+        )
+    )
@@ -0,0 +1,447 @@
+"""Message MCP tools."""
+
+import json
+from functools import partial
+from typing import Any, Dict, List, Literal, Optional, Union
+
+import anyio
+from mcp.server.fastmcp import Context
+from openai.pagination import SyncCursorPage
+from openai.types.beta.threads.message import Message
+from openai.types.beta.threads.message_deleted import MessageDeleted
+
+from ..app import mcp
+from ..tools import BatchResult
+from ..tools.messages import BatchMessage, MessageContent
+from ..tools.messages import batch_create_messages as tools_batch_create_messages
+from ..tools.messages import compact_message
+from ..tools.messages import create_message as tools_create_message
+from ..tools.messages import delete_message as tools_delete_message
+from ..tools.messages import delete_messages as tools_delete_messages
+from ..tools.messages import get_message as tools_get_message
+from ..tools.messages import get_messages as tools_get_messages
+from ..tools.messages import iter_thread_messages as tools_iter_thread_messages
+from ..tools.messages import list_messages as tools_list_messages
+from ..tools.messages import list_messages_raw as tools_list_messages_raw
+from ..tools.messages import modify_message as tools_modify_message
+from ..tools.projection import Shaped, shape, shape_json
+
+__all__ = [
+    "create_message",
+    "batch_create_messages",
+    "get_message",
+    "get_messages",
+    "list_messages",
+    "iter_thread_messages",
+    "modify_message",
+    "delete_message",
+    "delete_messages",
+]
+
+
+@mcp.tool()
+def create_message(
+    thread_id: str,
+    role: Literal["user", "assistant"],
+    content: Union[str, List[MessageContent]],
+    attachments: Optional[List[Dict[str, Any]]] = None,
+    metadata: Optional[Dict[str, str]] = None,
+) -> Shaped[Message]:
+    """
+    Create a message in a thread.
+
+    Messages are added to threads to build conversations.
+    User messages are added when the user sends input, assistant messages
+    when the assistant responds.
+
+    Args:
+        thread_id: (REQUIRED) The ID of the thread to create a message for
+        role: (REQUIRED) The role of the entity creating the message
+            ('user' or 'assistant')
+        content: (REQUIRED) The content of the message (string or list of content parts)
+        attachments: List of file attachments
+        metadata: Key-value pairs (max 16 pairs)
+
+    Returns:
+        MessageObject: The created message containing:
+        - id: The unique identifier for the message
+        - object: Always "thread.message"
+        - created_at: Unix timestamp when the message was created
+        - thread_id: The ID of the thread this message belongs to
+        - role: The role of the entity that created the message (user/assistant)
+        - content: Array of message content (text, images, etc.)
+        - assistant_id: ID of the assistant that authored this message (if applicable)
+        - run_id: ID of the run associated with the message (if applicable)
+        - completed_at: Unix timestamp when the message was completed
+        - incomplete_at: Unix timestamp when the message was marked incomplete
+        - incomplete_details: Details about why the message is incomplete
+        - status: Message status (in_progress/incomplete/completed)
+        - attachments: Files attached to the message
+        - metadata: Key-value pairs attached to the message
+    """
+    return shape(
+        tools_create_message(
+            thread_id=thread_id,
+            role=role,
+            content=content,
+            attachments=attachments,
+            metadata=metadata,
+        )
+    )
+
+
+@mcp.tool()
+async def batch_create_messages(
+    messages: List[BatchMessage],
+    max_concurrency: Optional[int] = None,
+) -> Shaped[BatchResult]:
+    """
+    Create many messages in one call, in one or more threads.
+
+    Use this to seed conversations or import chat history instead of calling
+    create_message once per message. Messages for the same thread are created
+    in the order given; different threads are written concurrently. If a
+    message fails, the remaining messages of that thread are skipped so the
+    conversation order is never broken, while other threads continue.
+
+    Args:
+        messages: (REQUIRED) Messages to create. Each item has:
+            - thread_id: (REQUIRED) The thread to add the message to
+            - role: (REQUIRED) 'user' or 'assistant'
+            - content: (REQUIRED) String or list of content parts
+            - attachments: List of file attachments
+            - metadata: Key-value pairs (max 16 pairs)
+        max_concurrency: Number of threads written at once (default 8)
+
+    Returns:
+        BatchResult containing:
+        - succeeded: Number of messages created
+        - failed: Number of messages that failed
+        - skipped: Number of messages not attempted after an earlier failure
+        - items: One entry per message, in request order, with index, group
+          (thread ID), status, result (the created MessageObject) and error
+    """
+    return shape(
+        await anyio.to_thread.run_sync(
+            partial(
+                tools_batch_create_messages,
+                messages=messages,
+                max_concurrency=max_concurrency,
+            )
+        )
+    )
+
+
+@mcp.tool()
+def get_message(
+    thread_id: str,
+    message_id: str,
+    fields: Optional[List[str]] = None,
+    compact: Optional[bool] = None,
+    render: Literal["json", "text"] = "json",
+    citations: bool = False,
+) -> Shaped[Message]:
+    """
+    Get message by ID.
+
+    Use this to retrieve a specific message's details from a thread.
+
+    Args:
+        thread_id: (REQUIRED) The ID of the thread the message belongs to
+        message_id: (REQUIRED) The ID of the message to retrieve
+        fields: Only return these fields, e.g. ["id", "role", "content.text.value"];
+            dotted paths select nested fields
+        compact: Drop null fields, defaults and empty lists from the result
+            (default COMPACT_RESPONSES)
+        render: "text" returns id, role, created_at, run_id and the message
+            content flattened to plain text instead of the full object
+        citations: With render="text", replace file citations and file paths
+            with [n] markers and list the cited file IDs after the text
+
+    Returns:
+        MessageObject: The message containing:
+        - id: The unique identifier for the message
+        - object: Always "thread.message"
+        - created_at: Unix timestamp when the message was created
+        - thread_id: The ID of the thread this message belongs to
+        - role: The role of the entity that created the message (user/assistant)
+        - content: Array of message content (text, images, etc.)
+        - assistant_id: ID of the assistant that authored this message (if applicable)
+        - run_id: ID of the run associated with the message (if applicable)
+        - completed_at: Unix timestamp when the message was completed
+        - incomplete_at: Unix timestamp when the message was marked incomplete
+        - incomplete_details: Details about why the message is incomplete
+        - status: Message status (in_progress/incomplete/completed)
+        - attachments: Files attached to the message
+        - metadata: Key-value pairs attached to the message
+    """
+    message = tools_get_message(thread_id, message_id)
+    if render == "text":
+        return shape(compact_message(message, citations), fields, compact)
+    return shape(message, fields, compact)
+
+
+@mcp.tool()
+async def get_messages(
+    thread_id: str,
+    message_ids: List[str],
+    max_concurrency: Optional[int] = None,
+    fields: Optional[List[str]] = None,
+    compact: Optional[bool] = None,
+) -> Shaped[BatchResult]:
+    """
+    Retrieve many messages in one call.
+
+    Use this to show several messages at once instead of calling get_message
+    once per ID. Repeated IDs are fetched once, settled messages in the thread
+    mirror are served locally, and the rest are fetched concurrently.
+
+    Args:
+        thread_id: (REQUIRED) The ID of the thread the messages belong to
+        message_ids: (REQUIRED) The IDs of the messages to retrieve
+        max_concurrency: Number of requests run at once (default 8)
+        fields: Only return these fields, e.g. ["id", "role", "content.text.value"];
+            dotted paths select nested fields
+        compact: Drop null fields, defaults and empty lists from the result
+            (default COMPACT_RESPONSES)
+
+    Returns:
+        BatchResult containing:
+        - succeeded: Number of IDs retrieved
+        - failed: Number of IDs that could not be retrieved
+        - skipped: Always 0 for this tool
+        - items: One entry per requested ID, in request order, with index,
+          group (the ID), status, result (MessageObject) and error
+    """
+    return shape(
+        await anyio.to_thread.run_sync(
+            partial(
+                tools_get_messages,
+                thread_id=thread_id,
+                message_ids=message_ids,
+                max_concurrency=max_concurrency,
+            )
+        ),
+        fields,
+        compact,
+    )
+
+
+@mcp.tool()
+def list_messages(
+    thread_id: str,
+    limit: Optional[int] = None,
+    order: Optional[str] = None,
+    after: Optional[str] = None,
+    before: Optional[str] = None,
+    run_id: Optional[str] = None,
+    fields: Optional[List[str]] = None,
+    compact: Optional[bool] = None,
+    raw: bool = False,
+    render: Literal["json", "text"] = "json",
+    citations: bool = False,
+) -> Union[Shaped[SyncCursorPage[Message]], str]:
+    """
+    List messages for a thread.
+
+    Use this to retrieve the conversation history in a thread.
+
+    Args:
+        thread_id: (REQUIRED) The ID of the thread to list messages for
+        limit: Limit on number of messages (1-100, default 20)
+        order: Sort order ('asc' or 'desc', default 'desc')
+        after: Cursor for pagination (get messages after this ID)
+        before: Cursor for pagination (get messages before this ID)
+        run_id: Filter for messages from a specific run
+        fields: Only return these fields, e.g. ["id", "role", "content.text.value"];
+            dotted paths select nested fields
+        compact: Drop null fields, defaults and empty lists from the result
+            (default COMPACT_RESPONSES)
+        raw: Forward the API response body as text without building SDK
+            objects; faster for large pages (ignored with render="text")
+        render: "text" returns each message as id, role, created_at, run_id
+            and its content flattened to plain text, plus has_more
+        citations: With render="text", replace file citations and file paths
+            with [n] markers and list the cited file IDs after the text
+
+    Returns:
+        MessageListResponse: The list of messages containing:
+        - object: Always "list"
+        - data: Array of MessageObject items
+        - first_id: The ID of the first message in the list
+        - last_id: The ID of the last message in the list
+        - has_more: Whether there are more messages to fetch
+        With raw=True, the same list as JSON text
+    """
+    if raw and render != "text":
+        return shape_json(
+            tools_list_messages_raw(
+                thread_id=thread_id,
+                limit=limit,
+                order=order,
+                after=after,
+                before=before,
+                run_id=run_id,
+            ),
+            fields,
+            compact,
+        )
+
+    page = tools_list_messages(
+        thread_id=thread_id,
+        limit=limit,
+        order=order,
+        after=after,
+        before=before,
+        run_id=run_id,
+    )
+    if render == "text":
+        text_page = {
+            "data": [compact_message(message, citations) for message in page.data],
+            "has_more": page.has_more,
+        }
+        return shape(text_page, fields, compact)
+    return shape(page, fields, compact)
+
+
+@mcp.tool()
+async def iter_thread_messages(
+    ctx: Context,
+    thread_id: str,
+    order: Literal["asc", "desc"] = "asc",
+    run_id: Optional[str] = None,
+    output_path: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Read every message in a thread as a stream of compact chunks.
+
+    Use this instead of looping on list_messages to read a whole thread. Pages
+    of up to 100 messages are fetched one at a time and each is reduced to
+    id, role, created_at, run_id and plain-text content. Without output_path,
+    every chunk is sent as an info log message (a JSON array) together with a
+    progress notification carrying the running message count. With
+    output_path, chunks are appended to that file as JSON lines and only
+    progress is reported.
+
+    Args:
+        thread_id: (REQUIRED) The ID of the thread to read
+        order: Sort order ('asc' or 'desc', default 'asc')
+        run_id: Filter for messages from a specific run
+        output_path: Path of a JSONL file to write messages to, relative to
+            the server's EXPORT_DIR
+
+    Returns:
+        Dict containing:
+        - thread_id: The ID of the thread that was read
+        - messages: Number of messages streamed
+        - pages: Number of pages fetched
+        - output_path: The absolute path of the JSONL file written, if any
+    """
+
+    async def report_chunk(chunk: List[Dict[str, Any]], count: int) -> None:
+        await ctx.report_progress(count)
+        if output_path is None:
+            await ctx.info(json.dumps(chunk))
+
+    return await tools_iter_thread_messages(
+        thread_id=thread_id,
+        order=order,
+        run_id=run_id,
+        output_path=output_path,
+        on_chunk=report_chunk,
+    )
+
+
+@mcp.tool()
+def modify_message(
+    thread_id: str,
+    message_id: str,
+    metadata: Optional[Dict[str, str]] = None,
+) -> Shaped[Message]:
+    """
+    Modify a message.
+
+    Use this to update message metadata after creation.
+
+    Args:
+        thread_id: (REQUIRED) The ID of the thread the message belongs to
+        message_id: (REQUIRED) The ID of the message to modify
+        metadata: Key-value pairs (max 16 pairs)
+
+    Returns:
+        MessageObject: The modified message containing:
+        - id: The unique identifier for the message
+        - object: Always "thread.message"
+        - created_at: Unix timestamp when the message was created
+        - thread_id: The ID of the thread this message belongs to
+        - role: The role of the entity that created the message (user/assistant)
+        - content: Array of message content (text, images, etc.)
+        - assistant_id: ID of the assistant that authored this message (if applicable)
+        - run_id: ID of the run associated with the message (if applicable)
+        - completed_at: Unix timestamp when the message was completed
+        - incomplete_at: Unix timestamp when the message was marked incomplete
+        - incomplete_details: Details about why the message is incomplete
+        - status: Message status (in_progress/incomplete/completed)
+        - attachments: Files attached to the message
+        - metadata: Key-value pairs attached to the message
+    """
+    return shape(
+        tools_modify_message(
+            thread_id=thread_id,
+            message_id=message_id,
+            metadata=metadata,
+        )
+    )
+
+
+@mcp.tool()
+def delete_message(thread_id: str, message_id: str) -> MessageDeleted:
+    """
+    Delete a message.
+
+    Permanently removes a message from a thread.
+
+    Args:
+        thread_id: (REQUIRED) The ID of the thread the message belongs to
+        message_id: (REQUIRED) The ID of the message to delete
+
+    Returns:
+        DeleteMessageResponse: The deletion confirmation containing:
+        - id: The ID of the deleted message
+        - object: Always "thread.message.deleted"
+        - deleted: Boolean indicating whether the message was successfully deleted
+    """
+    return tools_delete_message(thread_id, message_id)
+
+
+@mcp.tool()
+async def delete_messages(
+    thread_id: str, message_ids: List[str], max_concurrency: Optional[int] = None
+) -> BatchResult:
+    """
+    Delete many messages from a thread in one call.
+
+    Deletions run concurrently and pause together when rate limited. Deleted
+    messages are removed from the thread mirror and prefetched pages.
+
+    Args:
+        thread_id: (REQUIRED) The ID of the thread the messages belong to
+        message_ids: (REQUIRED) The IDs of the messages to delete
+        max_concurrency: Number of deletions run at once (default 8)
+
+    Returns:
+        BatchResult containing:
+        - succeeded: Number of messages deleted
+        - failed: Number of deletions that failed
+        - skipped: Number of repeated IDs not attempted after a failure
+        - items: One entry per ID, in request order, with index, group
+          (the message ID), status, result (DeleteMessageResponse) and error
+    """
+    return await anyio.to_thread.run_sync(
+        partial(
+            tools_delete_messages,
+            thread_id=thread_id,
+            message_ids=message_ids,
+            max_concurrency=max_concurrency,
+        )
+    )
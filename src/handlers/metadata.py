@@ -0,0 +1,68 @@
+"""Bulk metadata MCP tools."""
+
+from functools import partial
+from typing import Dict, List, Literal, Optional
+
+import anyio
+
+from ..app import mcp
+from ..tools import BatchResult
+from ..tools.metadata import MetadataTarget
+from ..tools.metadata import patch_metadata as tools_patch_metadata
+from ..tools.projection import Shaped, shape
+
+__all__ = [
+    "patch_metadata",
+]
+
+
+@mcp.tool()
+async def patch_metadata(
+    object_type: Literal["thread", "message", "run"],
+    targets: List[MetadataTarget],
+    metadata: Dict[str, Optional[str]],
+    max_concurrency: Optional[int] = None,
+) -> Shaped[BatchResult]:
+    """
+    Set or remove metadata keys on many threads, messages or runs at once.
+
+    Use this to tag results, e.g. metadata={"reviewed": "true"}, instead of
+    calling modify_thread, modify_message or modify_run per object. The patch
+    is merged into each object's existing metadata, so other keys are kept
+    and no prior get call is needed. Existing metadata is read from the
+    thread mirror only for finished messages and runs or threads synced
+    within THREAD_MIRROR_MAX_AGE_SECONDS (default 30); otherwise the object
+    is fetched before merging. Key, value and 16-pair limits are checked
+    before anything is sent, and objects the patch would not change are not
+    updated.
+
+    Args:
+        object_type: (REQUIRED) Kind of object to patch: 'thread', 'message'
+            or 'run'
+        targets: (REQUIRED) Objects to patch. Each item has:
+            - thread_id: (REQUIRED) The thread ID, or the thread the object
+              belongs to
+            - object_id: The message or run ID (required unless patching
+              threads)
+        metadata: (REQUIRED) Keys to set; a null value removes the key
+        max_concurrency: Number of updates run at once (default 8)
+
+    Returns:
+        BatchResult containing:
+        - succeeded: Number of objects patched or already up to date
+        - failed: Number of objects that could not be patched
+        - skipped: Always 0 for this tool
+        - items: One entry per target, in request order, with index, group
+          (the object ID), status, result (the updated object) and error
+    """
+    return shape(
+        await anyio.to_thread.run_sync(
+            partial(
+                tools_patch_metadata,
+                object_type=object_type,
+                targets=targets,
+                metadata=metadata,
+                max_concurrency=max_concurrency,
+            )
+        )
+    )
@@ -0,0 +1,83 @@
+"""Thread mirror MCP tools."""
+
+from functools import partial
+from typing import Any, Dict
+
+import anyio
+
+from ..app import mcp
+from ..mirror.sync import get_thread_transcript as mirror_get_thread_transcript
+from ..mirror.sync import sync_thread as mirror_sync_thread
+from ..tools.projection import shape
+
+__all__ = [
+    "get_thread_transcript",
+    "sync_thread_mirror",
+]
+
+
+@mcp.tool()
+async def get_thread_transcript(
+    thread_id: str,
+    sync: bool = True,
+    include_runs: bool = True,
+) -> Dict[str, Any]:
+    """
+    Get a whole thread from the local mirror.
+
+    Use this instead of paging through list_messages, list_runs and
+    list_run_steps when reading full threads repeatedly. Only changes since
+    the last read are fetched from the API.
+
+    Args:
+        thread_id: (REQUIRED) The ID of the thread to read
+        sync: Fetch changes since the last sync before reading (default True)
+        include_runs: Include runs and run steps (default True)
+
+    Returns:
+        Dict containing:
+        - thread_id: The ID of the thread
+        - messages: All MessageObject items, oldest first
+        - runs: All RunObject items, oldest first (if include_runs)
+        - steps: RunStepObject items keyed by run ID (if include_runs)
+        - synced_at: Unix timestamp of the last sync
+    """
+    return shape(
+        await anyio.to_thread.run_sync(
+            partial(
+                mirror_get_thread_transcript,
+                thread_id,
+                sync=sync,
+                include_runs=include_runs,
+            )
+        )
+    )
+
+
+@mcp.tool()
+async def sync_thread_mirror(
+    thread_id: str, include_runs: bool = True
+) -> Dict[str, Any]:
+    """
+    Sync a thread into the local mirror without returning its contents.
+
+    Args:
+        thread_id: (REQUIRED) The ID of the thread to sync
+        include_runs: Also mirror runs and run steps (default True)
+
+    Returns:
+        Dict containing:
+        - thread_id: The ID of the thread
+        - messages: Number of mirrored messages
+        - runs: Number of mirrored runs
+        - synced_at: Unix timestamp of the sync
+    """
+    transcript = await anyio.to_thread.run_sync(
+        partial(mirror_sync_thread, thread_id, include_runs=include_runs)
+    )
+    return {
+        "thread_id": thread_id,
+        "messages": len(transcript.messages),
+        "runs": len(transcript.runs),
+        "synced_at": transcript.synced_at,
+    }
@@ -0,0 +1,34 @@
+"""Result continuation MCP tools."""
+
+from ..app import mcp
+from ..encoding import get_continuation
+
+__all__ = [
+    "get_result_continuation",
+]
+
+
+@mcp.tool()
+def get_result_continuation(token: str) -> str:
+    """
+    Get the next slice of a tool result that was split at MAX_RESULT_BYTES.
+
+    Split results carry a continuation object; call this with its token until
+    the token is null. Slices are held for RESULT_CONTINUATION_TTL_SECONDS.
+
+    Args:
+        token: (REQUIRED) The continuation.token of the previous slice
+
+    Returns:
+        str: JSON of the next slice, shaped like the original result with part
+        of its largest list, or a "partial" piece of JSON text when one item
+        alone is over the cap, plus:
+        - value: For a partial piece, which split value it belongs to
+        - part: For a partial piece, its position within that value (0-based)
+        - final: For a partial piece, whether it is the last part of the value
+        - continuation: Object containing:
+            - token: Token for the following slice, null on the last slice
+            - slice: Position of this slice (1-based)
+            - slices: Total number of slices
+    """
+    return get_continuation(token)
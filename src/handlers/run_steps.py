@@ -0,0 +1,130 @@
+"""Run step MCP tools."""
+
+from typing import List, Literal, Optional
+
+from openai.pagination import SyncCursorPage
+from openai.types.beta.threads.runs import RunStepInclude
+from openai.types.beta.threads.runs.run_step import RunStep
+
+from ..app import mcp
+from ..tools.projection import Shaped, shape
+from ..tools.run_steps import get_run_step as tools_get_run_step
+from ..tools.run_steps import list_run_steps as tools_list_run_steps
+
+__all__ = [
+    "list_run_steps",
+    "get_run_step",
+]
+
+
+@mcp.tool()
+def list_run_steps(
+    thread_id: str,
+    run_id: str,
+    limit: Optional[int] = None,
+    order: Optional[Literal["asc", "desc"]] = None,
+    after: Optional[str] = None,
+    before: Optional[str] = None,
+    include: Optional[List[RunStepInclude]] = None,
+    fields: Optional[List[str]] = None,
+    compact: Optional[bool] = None,
+) -> Shaped[SyncCursorPage[RunStep]]:
+    """
+    List run steps for a run.
+
+    Use this to view the sequence of steps taken during a run.
+
+    Args:
+        thread_id: (REQUIRED) The ID of the thread the run belongs to
+        run_id: (REQUIRED) The ID of the run to list steps for
+        limit: Limit on number of steps (1-100, default 20)
+        order: Sort order ('asc' or 'desc', default 'desc')
+        after: Cursor for pagination (get steps after this ID)
+        before: Cursor for pagination (get steps before this ID)
+        include: List of additional fields to include in the response
+                Currently only supports
+                'step_details.tool_calls[*].file_search.results[*].content'
+        fields: Only return these fields, e.g. ["id", "status", "usage.total_tokens"];
+            dotted paths select nested fields
+        compact: Drop null fields, defaults and empty lists from the result
+            (default COMPACT_RESPONSES)
+
+    Returns:
+        RunStepListResponse: The list of run steps containing:
+        - object: Always "list"
+        - data: Array of RunStepObject items
+        - first_id: The ID of the first run step in the list
+        - last_id: The ID of the last run step in the list
+        - has_more: Whether there are more run steps to fetch
+    """
+    return shape(
+        tools_list_run_steps(
+            thread_id=thread_id,
+            run_id=run_id,
+            limit=limit,
+            order=order,
+            after=after,
+            before=before,
+            include=include,
+        ),
+        fields,
+        compact,
+    )
+
+
+@mcp.tool()
+def get_run_step(
+    thread_id: str,
+    run_id: str,
+    step_id: str,
+    include: Optional[List[RunStepInclude]] = None,
+    fields: Optional[List[str]] = None,
+    compact: Optional[bool] = None,
+) -> Shaped[RunStep]:
+    """
+    Get run step by ID.
+
+    Use this to retrieve details about a specific step in a run.
+
+    Args:
+        thread_id: (REQUIRED) The ID of the thread the run belongs to
+        run_id: (REQUIRED) The ID of the run the step belongs to
+        step_id: (REQUIRED) The ID of the run step to retrieve
+        include: List of additional fields to include in the response
+                Currently only supports
+                'step_details.tool_calls[*].file_search.results[*].content'
+        fields: Only return these fields, e.g. ["id", "status", "usage.total_tokens"];
+            dotted paths select nested fields
+        compact: Drop null fields, defaults and empty lists from the result
+            (default COMPACT_RESPONSES)
+
+    Returns:
+        RunStepObject: The run step containing:
+        - id: The unique identifier for the run step
+        - object: Always "thread.run.step"
+        - created_at: Unix timestamp when the run step was created
+        - run_id: The ID of the run this step is a part of
+        - assistant_id: The ID of the assistant associated with this run step
+        - thread_id: The ID of the thread this run step is a part of
+        - type: The type of run step (message_creation/tool_calls)
+        - status: The status of the run step
+                (in_progress/cancelled/failed/completed/expired)
+        - cancelled_at: Unix timestamp when the run step was cancelled
+        - completed_at: Unix timestamp when the run step was completed
+        - expired_at: Unix timestamp when the run step expired
+        - failed_at: Unix timestamp when the run step failed
+        - last_error: The last error associated with this run step
+        - metadata: Key-value pairs attached to the run step
+        - step_details: The details of the run step (message creation or tool calls)
+        - usage: Usage statistics related to the run step
+    """
+    return shape(
+        tools_get_run_step(
+            thread_id=thread_id,
+            run_id=run_id,
+            step_id=step_id,
+            include=include,
+        ),
+        fields,
+        compact,
+    )
@@ -0,0 +1,631 @@
+"""Run MCP tools."""
+
+import json
+from functools import partial
+from typing import Any, Dict, List, Literal, Optional, Union
+
+import anyio
+from mcp.server.fastmcp import Context
+from openai.pagination import SyncCursorPage
+from openai.types.beta.threads.run import Run
+
+from ..app import mcp
+from ..tools import BatchResult, ResponseFormat
+from ..tools.projection import Shaped, shape, shape_json
+from ..tools.runs import RunTool, ToolChoice, TruncationStrategy
+from ..tools.runs import cancel_run as tools_cancel_run
+from ..tools.runs import create_run as tools_create_run
+from ..tools.runs import create_thread_and_run as tools_create_thread_and_run
+from ..tools.runs import fan_out_runs as tools_fan_out_runs
+from ..tools.runs import get_run as tools_get_run
+from ..tools.runs import get_runs as tools_get_runs
+from ..tools.runs import list_runs as tools_list_runs
+from ..tools.runs import list_runs_raw as tools_list_runs_raw
+from ..tools.runs import modify_run as tools_modify_run
+from ..tools.runs import submit_tool_outputs as tools_submit_tool_outputs
+
+__all__ = [
+    "create_run",
+    "create_thread_and_run",
+    "list_runs",
+    "get_run",
+    "get_runs",
+    "modify_run",
+    "submit_tool_outputs",
+    "cancel_run",
+    "fan_out_runs",
+]
+
+
+@mcp.tool()
+def create_run(
+    thread_id: str,
+    assistant_id: str,
+    model: Optional[str] = None,
+    instructions: Optional[str] = None,
+    additional_instructions: Optional[str] = None,
+    tools: Optional[List[RunTool]] = None,
+    metadata: Optional[Dict[str, str]] = None,
+    stream: Optional[bool] = None,
+    temperature: Optional[float] = None,
+    top_p: Optional[float] = None,
+    max_completion_tokens: Optional[int] = None,
+    max_prompt_tokens: Optional[int] = None,
+    response_format: Optional[ResponseFormat] = None,
+    tool_choice: Optional[
+        Union[Literal["none", "auto", "required"], ToolChoice]
+    ] = None,
+    truncation_strategy: Optional[TruncationStrategy] = None,
+    parallel_tool_calls: Optional[bool] = None,
+) -> Shaped[Run]:
+    """
+    Create a run.
+
+    This starts a new run with the specified assistant in a thread.
+    A run represents the assistant processing messages and performing actions.
+
+    Args:
+        thread_id: (REQUIRED) The ID of the thread to run
+        assistant_id: (REQUIRED) The ID of the assistant to use
+        model: Model override for this run
+        instructions: Instructions override for this run
+        additional_instructions: Additional instructions for this run
+        tools: List of tools for this run
+        metadata: Key-value pairs (max 16 pairs)
+        stream: Boolean for streaming mode
+        temperature: Sampling temperature (0-2)
+        top_p: Nucleus sampling value (0-1)
+        max_completion_tokens: Maximum completion tokens
+        max_prompt_tokens: Maximum prompt tokens
+        response_format: Response format configuration
+        tool_choice: Tool choice configuration
+        truncation_strategy: Truncation strategy
+        parallel_tool_calls: Boolean for parallel tool calls
+
+    Returns:
+        RunObject: The created run containing:
+        - id: The unique identifier for the run
+        - object: Always "thread.run"
+        - created_at: Unix timestamp when the run was created
+        - thread_id: The ID of the thread being executed on
+        - assistant_id: The ID of the assistant used for execution
+        - status: Current status
+                (queued/in_progress/requires_action/cancelling/cancelled/
+                failed/completed/incomplete/expired)
+        - required_action: Details on action required to continue the run
+        - last_error: The last error associated with this run
+        - expires_at: Unix timestamp when the run will expire
+        - started_at: Unix timestamp when the run was started
+        - cancelled_at: Unix timestamp when the run was cancelled
+        - failed_at: Unix timestamp when the run failed
+        - completed_at: Unix timestamp when the run was completed
+        - model: The model that the assistant used for this run
+        - instructions: The instructions that the assistant used for this run
+        - tools: List of tools that the assistant used for this run
+        - file_ids: List of File IDs the assistant used for this run
+        - metadata: Key-value pairs attached to the run
+        - usage: Usage statistics (completion_tokens, prompt_tokens, total_tokens)
+        - parallel_tool_calls: Whether parallel function calling is enabled
+        - max_completion_tokens: Maximum completion tokens specified
+        - max_prompt_tokens: Maximum prompt tokens specified
+        - temperature: Sampling temperature used for this run
+        - top_p: Nucleus sampling value used for this run
+        - response_format: Format specification for model output
+        - tool_choice: Controls which tool is called by the model
+        - truncation_strategy: Controls for thread truncation prior to run
+        - incomplete_details: Details on why the run is incomplete
+    """
+    return shape(
+        tools_create_run(
+            thread_id=thread_id,
+            assistant_id=assistant_id,
+            model=model,
+            instructions=instructions,
+            additional_instructions=additional_instructions,
+            tools=tools,
+            metadata=metadata,
+            stream=stream,
+            temperature=temperature,
+            top_p=top_p,
+            max_completion_tokens=max_completion_tokens,
+            max_prompt_tokens=max_prompt_tokens,
+            response_format=response_format,
+            tool_choice=tool_choice,
+            truncation_strategy=truncation_strategy,
+            parallel_tool_calls=parallel_tool_calls,
+        )
+    )
+
+
+@mcp.tool()
+def create_thread_and_run(
+    assistant_id: str,
+    thread: Optional[Dict[str, Any]] = None,
+    model: Optional[str] = None,
+    instructions: Optional[str] = None,
+    tools: Optional[List[RunTool]] = None,
+    metadata: Optional[Dict[str, str]] = None,
+    stream: Optional[bool] = None,
+    temperature: Optional[float] = None,
+    top_p: Optional[float] = None,
+    max_completion_tokens: Optional[int] = None,
+    max_prompt_tokens: Optional[int] = None,
+    response_format: Optional[ResponseFormat] = None,
+    tool_choice: Optional[
+        Union[Literal["none", "auto", "required"], ToolChoice]
+    ] = None,
+    truncation_strategy: Optional[TruncationStrategy] = None,
+    parallel_tool_calls: Optional[bool] = None,
+) -> Shaped[Run]:
+    """
+    Create a thread and run it in one request.
+
+    This combines creating a new thread and starting a run into a single operation.
+    Useful when you want to start a fresh conversation with an assistant.
+
+    Args:
+        assistant_id: (REQUIRED) The ID of the assistant to use
+        thread: Thread configuration
+        model: Model override for this run
+        instructions: Instructions override for this run
+        tools: List of tools for this run
+        metadata: Key-value pairs (max 16 pairs)
+        stream: Boolean for streaming mode
+        temperature: Sampling temperature (0-2)
+        top_p: Nucleus sampling value (0-1)
+        max_completion_tokens: Maximum completion tokens
+        max_prompt_tokens: Maximum prompt tokens
+        response_format: Response format configuration
+        tool_choice: Tool choice configuration
+        truncation_strategy: Truncation strategy
+        parallel_tool_calls: Boolean for parallel tool calls
+
+    Returns:
+        RunObject: The created run containing:
+        - id: The unique identifier for the run
+        - object: Always "thread.run"
+        - created_at: Unix timestamp when the run was created
+        - thread_id: The ID of the thread being executed on
+        - assistant_id: The ID of the assistant used for execution
+        - status: Current status
+                (queued/in_progress/requires_action/cancelling/cancelled/
+                failed/completed/incomplete/expired)
+        - required_action: Details on action required to continue the run
+        - last_error: The last error associated with this run
+        - expires_at: Unix timestamp when the run will expire
+        - started_at: Unix timestamp when the run was started
+        - cancelled_at: Unix timestamp when the run was cancelled
+        - failed_at: Unix timestamp when the run failed
+        - completed_at: Unix timestamp when the run was completed
+        - model: The model that the assistant used for this run
+        - instructions: The instructions that the assistant used for this run
+        - tools: List of tools that the assistant used for this run
+        - file_ids: List of File IDs the assistant used for this run
+        - metadata: Key-value pairs attached to the run
+        - usage: Usage statistics (completion_tokens, prompt_tokens, total_tokens)
+        - parallel_tool_calls: Whether parallel function calling is enabled
+        - max_completion_tokens: Maximum completion tokens specified
+        - max_prompt_tokens: Maximum prompt tokens specified
+        - temperature: Sampling temperature used for this run
+        - top_p: Nucleus sampling value used for this run
+        - response_format: Format specification for model output
+        - tool_choice: Controls which tool is called by the model
+        - truncation_strategy: Controls for thread truncation prior to run
+        - incomplete_details: Details on why the run is incomplete
+    """
+    return shape(
+        tools_create_thread_and_run(
+            assistant_id=assistant_id,
+            thread=thread,
+            model=model,
+            instructions=instructions,
+            tools=tools,
+            metadata=metadata,
+            stream=stream,
+            temperature=temperature,
+            top_p=top_p,
+            max_completion_tokens=max_completion_tokens,
+            max_prompt_tokens=max_prompt_tokens,
+            response_format=response_format,
+            tool_choice=tool_choice,
+            truncation_strategy=truncation_strategy,
+            parallel_tool_calls=parallel_tool_calls,
+        )
+    )
+
+
+@mcp.tool()
+def list_runs(
+    thread_id: str,
+    limit: Optional[int] = None,
+    order: Optional[Literal["asc", "desc"]] = None,
+    after: Optional[str] = None,
+    before: Optional[str] = None,
+    fields: Optional[List[str]] = None,
+    compact: Optional[bool] = None,
+    raw: bool = False,
+) -> Union[Shaped[SyncCursorPage[Run]], str]:
+    """
+    List runs for a thread.
+
+    Use this to view the history of runs in a thread.
+
+    Args:
+        thread_id: (REQUIRED) The ID of the thread to list runs for
+        limit: Limit on number of runs (1-100, default 20)
+        order: Sort order ('asc' or 'desc', default 'desc')
+        after: Cursor for pagination (get runs after this ID)
+        before: Cursor for pagination (get runs before this ID)
+        fields: Only return these fields, e.g. ["id", "status", "usage"];
+            dotted paths select nested fields
+        compact: Drop null fields, defaults and empty lists from the result
+            (default COMPACT_RESPONSES)
+        raw: Forward the API response body as text without building SDK
+            objects; faster for large pages
+
+    Returns:
+        RunListResponse: The list of runs containing:
+        - object: Always "list"
+        - data: Array of RunObject items
+        - first_id: The ID of the first run in the list
+        - last_id: The ID of the last run in the list
+        - has_more: Whether there are more runs available
+        With raw=True, the same list as JSON text
+    """
+    if raw:
+        return shape_json(
+            tools_list_runs_raw(
+                thread_id=thread_id,
+                limit=limit,
+                order=order,
+                after=after,
+                before=before,
+            ),
+            fields,
+            compact,
+        )
+
+    return shape(
+        tools_list_runs(
+            thread_id=thread_id,
+            limit=limit,
+            order=order,
+            after=after,
+            before=before,
+        ),
+        fields,
+        compact,
+    )
+
+
+@mcp.tool()
+def get_run(
+    thread_id: str,
+    run_id: str,
+    fields: Optional[List[str]] = None,
+    compact: Optional[bool] = None,
+) -> Shaped[Run]:
+    """
+    Get run by ID.
+
+    Use this to retrieve details about a specific run.
+
+    Args:
+        thread_id: (REQUIRED) The ID of the thread the run belongs to
+        run_id: (REQUIRED) The ID of the run to retrieve
+        fields: Only return these fields, e.g. ["id", "status", "usage"];
+            dotted paths select nested fields
+        compact: Drop null fields, defaults and empty lists from the result
+            (default COMPACT_RESPONSES)
+
+    Returns:
+        RunObject: The created run containing:
+        - id: The unique identifier for the run
+        - object: Always "thread.run"
+        - created_at: Unix timestamp when the run was created
+        - thread_id: The ID of the thread being executed on
+        - assistant_id: The ID of the assistant used for execution
+        - status: Current status
+                (queued/in_progress/requires_action/cancelling/cancelled/
+                failed/completed/incomplete/expired)
+        - required_action: Details on action required to continue the run
+        - last_error: The last error associated with this run
+        - expires_at: Unix timestamp when the run will expire
+        - started_at: Unix timestamp when the run was started
+        - cancelled_at: Unix timestamp when the run was cancelled
+        - failed_at: Unix timestamp when the run failed
+        - completed_at: Unix timestamp when the run was completed
+        - model: The model that the assistant used for this run
+        - instructions: The instructions that the assistant used for this run
+        - tools: List of tools that the assistant used for this run
+        - file_ids: List of File IDs the assistant used for this run
+        - metadata: Key-value pairs attached to the run
+        - usage: Usage statistics (completion_tokens, prompt_tokens, total_tokens)
+        - parallel_tool_calls: Whether parallel function calling is enabled
+        - max_completion_tokens: Maximum completion tokens specified
+        - max_prompt_tokens: Maximum prompt tokens specified
+        - temperature: Sampling temperature used for this run
+        - top_p: Nucleus sampling value used for this run
+        - response_format: Format specification for model output
+        - tool_choice: Controls which tool is called by the model
+        - truncation_strategy: Controls for thread truncation prior to run
+        - incomplete_details: Details on why the run is incomplete
+    """
+    return shape(tools_get_run(thread_id=thread_id, run_id=run_id), fields, compact)
+
+
+@mcp.tool()
+async def get_runs(
+    thread_id: str,
+    run_ids: List[str],
+    max_concurrency: Optional[int] = None,
+    fields: Optional[List[str]] = None,
+    compact: Optional[bool] = None,
+) -> Shaped[BatchResult]:
+    """
+    Retrieve many runs in one call.
+
+    Use this to show several runs at once instead of calling get_run
+    once per ID. Repeated IDs are fetched once, finished runs in the thread
+    mirror are served locally, and the rest are fetched concurrently.
+
+    Args:
+        thread_id: (REQUIRED) The ID of the thread the runs belong to
+        run_ids: (REQUIRED) The IDs of the runs to retrieve
+        max_concurrency: Number of requests run at once (default 8)
+        fields: Only return these fields, e.g. ["id", "status", "usage"];
+            dotted paths select nested fields
+        compact: Drop null fields, defaults and empty lists from the result
+            (default COMPACT_RESPONSES)
+
+    Returns:
+        BatchResult containing:
+        - succeeded: Number of IDs retrieved
+        - failed: Number of IDs that could not be retrieved
+        - skipped: Always 0 for this tool
+        - items: One entry per requested ID, in request order, with index,
+          group (the ID), status, result (RunObject) and error
+    """
+    return shape(
+        await anyio.to_thread.run_sync(
+            partial(
+                tools_get_runs,
+                thread_id=thread_id,
+                run_ids=run_ids,
+                max_concurrency=max_concurrency,
+            )
+        ),
+        fields,
+        compact,
+    )
+
+
+@mcp.tool()
+def modify_run(
+    thread_id: str,
+    run_id: str,
+    metadata: Optional[Dict[str, str]] = None,
+) -> Shaped[Run]:
+    """
+    Modify a run.
+
+    Use this to update a run's metadata.
+
+    Args:
+        thread_id: (REQUIRED) The ID of the thread the run belongs to
+        run_id: (REQUIRED) The ID of the run to modify
+        metadata: Key-value pairs (max 16 pairs)
+
+    Returns:
+        RunObject: The created run containing:
+        - id: The unique identifier for the run
+        - object: Always "thread.run"
+        - created_at: Unix timestamp when the run was created
+        - thread_id: The ID of the thread being executed on
+        - assistant_id: The ID of the assistant used for execution
+        - status: Current status
+                (queued/in_progress/requires_action/cancelling/cancelled/
+                failed/completed/incomplete/expired)
+        - required_action: Details on action required to continue the run
+        - last_error: The last error associated with this run
+        - expires_at: Unix timestamp when the run will expire
+        - started_at: Unix timestamp when the run was started
+        - cancelled_at: Unix timestamp when the run was cancelled
+        - failed_at: Unix timestamp when the run failed
+        - completed_at: Unix timestamp when the run was completed
+        - model: The model that the assistant used for this run
+        - instructions: The instructions that the assistant used for this run
+        - tools: List of tools that the assistant used for this run
+        - file_ids: List of File IDs the assistant used for this run
+        - metadata: Key-value pairs attached to the run
+        - usage: Usage statistics (completion_tokens, prompt_tokens, total_tokens)
+        - parallel_tool_calls: Whether parallel function calling is enabled
+        - max_completion_tokens: Maximum completion tokens specified
+        - max_prompt_tokens: Maximum prompt tokens specified
+        - temperature: Sampling temperature used for this run
+        - top_p: Nucleus sampling value used for this run
+        - response_format: Format specification for model output
+        - tool_choice: Controls which tool is called by the model
+        - truncation_strategy: Controls for thread truncation prior to run
+        - incomplete_details: Details on why the run is incomplete
+    """
+    return shape(
+        tools_modify_run(thread_id=thread_id, run_id=run_id, metadata=metadata)
+    )
+
+
+@mcp.tool()
+def submit_tool_outputs(
+    thread_id: str,
+    run_id: str,
+    tool_outputs: List[Dict[str, str]],
+    stream: Optional[bool] = None,
+) -> Shaped[Run]:
+    """
+    Submit outputs for tool calls.
+
+    Use this to provide the results of tool calls back to the assistant.
+
+    Args:
+        thread_id: (REQUIRED) The ID of the thread the run belongs to
+        run_id: (REQUIRED) The ID of the run to submit outputs for
+        tool_outputs: (REQUIRED) List of tool outputs with tool_call_id and output
+        stream: Boolean for streaming mode
+
+    Returns:
+        RunObject: The created run containing:
+        - id: The unique identifier for the run
+        - object: Always "thread.run"
+        - created_at: Unix timestamp when the run was created
+        - thread_id: The ID of the thread being executed on
+        - assistant_id: The ID of the assistant used for execution
+        - status: Current status
+                (queued/in_progress/requires_action/cancelling/cancelled/
+                failed/completed/incomplete/expired)
+        - required_action: Details on action required to continue the run
+        - last_error: The last error associated with this run
+        - expires_at: Unix timestamp when the run will expire
+        - started_at: Unix timestamp when the run was started
+        - cancelled_at: Unix timestamp when the run was cancelled
+        - failed_at: Unix timestamp when the run failed
+        - completed_at: Unix timestamp when the run was completed
+        - model: The model that the assistant used for this run
+        - instructions: The instructions that the assistant used for this run
+        - tools: List of tools that the assistant used for this run
+        - file_ids: List of File IDs the assistant used for this run
+        - metadata: Key-value pairs attached to the run
+        - usage: Usage statistics (completion_tokens, prompt_tokens, total_tokens)
+        - parallel_tool_calls: Whether parallel function calling is enabled
+        - max_completion_tokens: Maximum completion tokens specified
+        - max_prompt_tokens: Maximum prompt tokens specified
+        - temperature: Sampling temperature used for this run
+        - top_p: Nucleus sampling value used for this run
+        - response_format: Format specification for model output
+        - tool_choice: Controls which tool is called by the model
+        - truncation_strategy: Controls for thread truncation prior to run
+        - incomplete_details: Details on why the run is incomplete
+    """
+    return shape(
+        tools_submit_tool_outputs(
+            thread_id=thread_id,
+            run_id=run_id,
+            tool_outputs=tool_outputs,
+            stream=stream,
+        )
+    )
+
+
+@mcp.tool()
+def cancel_run(thread_id: str, run_id: str) -> Shaped[Run]:
+    """
+    Cancel a run.
+
+    Use this to stop a run that is in progress.
+
+    Args:
+        thread_id: (REQUIRED) The ID of the thread the run belongs to
+        run_id: (REQUIRED) The ID of the run to cancel
+
+    Returns:
+        RunObject: The created run containing:
+        - id: The unique identifier for the run
+        - object: Always "thread.run"
+        - created_at: Unix timestamp when the run was created
+        - thread_id: The ID of the thread being executed on
+        - assistant_id: The ID of the assistant used for execution
+        - status: Current status
+                (queued/in_progress/requires_action/cancelling/cancelled/
+                failed/completed/incomplete/expired)
+        - required_action: Details on action required to continue the run
+        - last_error: The last error associated with this run
+        - expires_at: Unix timestamp when the run will expire
+        - started_at: Unix timestamp when the run was started
+        - cancelled_at: Unix timestamp when the run was cancelled
+        - failed_at: Unix timestamp when the run failed
+        - completed_at: Unix timestamp when the run was completed
+        - model: The model that the assistant used for this run
+        - instructions: The instructions that the assistant used for this run
+        - tools: List of tools that the assistant used for this run
+        - file_ids: List of File IDs the assistant used for this run
+        - metadata: Key-value pairs attached to the run
+        - usage: Usage statistics (completion_tokens, prompt_tokens, total_tokens)
+        - parallel_tool_calls: Whether parallel function calling is enabled
+        - max_completion_tokens: Maximum completion tokens specified
+        - max_prompt_tokens: Maximum prompt tokens specified
+        - temperature: Sampling temperature used for this run
+        - top_p: Nucleus sampling value used for this run
+        - response_format: Format specification for model output
+        - tool_choice: Controls which tool is called by the model
+        - truncation_strategy: Controls for thread truncation prior to run
+        - incomplete_details: Details on why the run is incomplete
+    """
+    return shape(tools_cancel_run(thread_id=thread_id, run_id=run_id))
+
+
+@mcp.tool()
+async def fan_out_runs(
+    ctx: Context,
+    assistant_id: str,
+    thread_ids: List[str],
+    model: Optional[str] = None,
+    instructions: Optional[str] = None,
+    additional_instructions: Optional[str] = None,
+    metadata: Optional[Dict[str, str]] = None,
+    max_concurrency: Optional[int] = None,
+    poll_interval: Optional[float] = None,
+    timeout: Optional[float] = None,
+) -> Dict[str, Any]:
+    """
+    Run one assistant on many threads and wait for all runs to finish.
+
+    Use this for evaluations over prepared threads instead of calling
+    create_run and get_run per thread. At most max_concurrency runs are active
+    at once and all of them are tracked by one shared poller. Each run is
+    reported as soon as it settles: a progress notification carries the
+    number of settled runs out of the total, and an info log message carries
+    the run summary as JSON. Runs that reach requires_action are reported and
+    left for the caller to continue with submit_tool_outputs.
+
+    Args:
+        assistant_id: (REQUIRED) The ID of the assistant to use
+        thread_ids: (REQUIRED) The IDs of the threads to run
+        model: Model override for the runs
+        instructions: Instructions override for the runs
+        additional_instructions: Additional instructions for the runs
+        metadata: Key-value pairs attached to every run (max 16 pairs)
+        max_concurrency: Number of runs active at once (default 8)
+        poll_interval: Seconds between status polls (default 1)
+        timeout: Seconds to wait for all runs before giving up (default none)
+
+    Returns:
+        Dict containing:
+        - assistant_id: The assistant that was run
+        - runs: Number of threads processed
+        - status_counts: Number of runs per final status (not_started when
+          the run could not be created or timeout passed first, poll_failed
+          when its status could not be retrieved 5 times in a row, timed_out
+          when it was still active at timeout)
+        - usage: Summed prompt_tokens, completion_tokens and total_tokens
+        - duration_seconds: wall (whole fan-out), mean and max run duration
+        - results: One summary per thread, in input order, with index,
+          thread_id, run_id, status, duration_seconds, usage and error
+    """
+
+    async def report_run(summary: Dict[str, Any], settled: int) -> None:
+        await ctx.report_progress(settled, len(thread_ids))
+        await ctx.info(json.dumps(summary))
+
+    return shape(
+        await tools_fan_out_runs(
+            assistant_id=assistant_id,
+            thread_ids=thread_ids,
+            model=model,
+            instructions=instructions,
+            additional_instructions=additional_instructions,
+            metadata=metadata,
+            max_concurrency=max_concurrency,
+            poll_interval=poll_interval,
+            timeout=timeout,
+            on_complete=report_run,
+        )
+    )
@@ -0,0 +1,241 @@
+"""Thread MCP tools."""
+
+from functools import partial
+from typing import Any, Dict, List, Optional, Union
+
+import anyio
+from openai.types.beta.thread import Thread
+from openai.types.beta.thread_deleted import ThreadDeleted
+
+from ..app import mcp
+from ..tools import BatchResult, ToolResources
+from ..tools.projection import Shaped, shape
+from ..tools.threads import CreateThreadRequest
+from ..tools.threads import create_thread as tools_create_thread
+from ..tools.threads import create_threads as tools_create_threads
+from ..tools.threads import delete_thread as tools_delete_thread
+from ..tools.threads import delete_threads as tools_delete_threads
+from ..tools.threads import get_thread as tools_get_thread
+from ..tools.threads import get_threads as tools_get_threads
+from ..tools.threads import modify_thread as tools_modify_thread
+
+__all__ = [
+    "create_thread",
+    "create_threads",
+    "get_thread",
+    "get_threads",
+    "modify_thread",
+    "delete_thread",
+    "delete_threads",
+]
+
+
+@mcp.tool()
+def create_thread(
+    messages: Optional[List[Dict[str, Any]]] = None,
+    metadata: Optional[Dict[str, str]] = None,
+    tool_resources: Optional[Union[Dict[str, Any], ToolResources]] = None,
+) -> Shaped[Thread]:
+    """
+    Create a thread.
+
+    This is done after creating an assistant and before adding messages.
+    A thread maintains the conversation state between the assistant and user.
+
+    Args:
+        messages: List of messages to start the thread with
+        metadata: Key-value pairs (max 16 pairs)
+        tool_resources: Resources for tools
+
+    Returns:
+        ThreadObject: The created thread containing:
+        - id: The unique identifier for the thread
+        - object: Always "thread"
+        - created_at: Unix timestamp when the thread was created
+        - metadata: Key-value pairs attached to the thread
+        - tool_resources: Resources made available to assistant's tools in this thread
+    """
+    return shape(tools_create_thread(messages, metadata, tool_resources))
+
+
+@mcp.tool()
+async def create_threads(
+    threads: List[CreateThreadRequest],
+    max_concurrency: Optional[int] = None,
+) -> Shaped[BatchResult]:
+    """
+    Create many threads in one call.
+
+    Use this to set up threads for evaluation or import jobs instead of
+    calling create_thread once per thread. Threads are created concurrently.
+    A thread may have any number of initial messages: the first 32 are sent
+    with the create request and the rest are appended in order.
+
+    Args:
+        threads: (REQUIRED) Threads to create. Each item has:
+            - messages: List of messages to start the thread with
+            - metadata: Key-value pairs (max 16 pairs)
+            - tool_resources: Resources for tools
+        max_concurrency: Number of threads created at once (default 8)
+
+    Returns:
+        BatchResult containing:
+        - succeeded: Number of threads created with all their messages
+        - failed: Number of threads that failed
+        - skipped: Always 0 for this tool
+        - items: One entry per thread, in request order, with index, group
+          (the same index), status, result (the created ThreadObject) and error
+    """
+    return shape(
+        await anyio.to_thread.run_sync(
+            partial(
+                tools_create_threads, threads=threads, max_concurrency=max_concurrency
+            )
+        )
+    )
+
+
+@mcp.tool()
+def get_thread(
+    thread_id: str, fields: Optional[List[str]] = None, compact: Optional[bool] = None
+) -> Shaped[Thread]:
+    """
+    Get thread by ID.
+
+    Use this to retrieve a thread's details after creation.
+
+    Args:
+        thread_id: (REQUIRED) The ID of the thread to retrieve
+        fields: Only return these fields, e.g. ["id", "metadata"];
+            dotted paths select nested fields
+        compact: Drop null fields, defaults and empty lists from the result
+            (default COMPACT_RESPONSES)
+
+    Returns:
+        ThreadObject: The thread containing:
+        - id: The unique identifier for the thread
+        - object: Always "thread"
+        - created_at: Unix timestamp when the thread was created
+        - metadata: Key-value pairs attached to the thread
+        - tool_resources: Resources made available to assistant's tools in this thread
+    """
+    return shape(tools_get_thread(thread_id), fields, compact)
+
+
+@mcp.tool()
+async def get_threads(
+    thread_ids: List[str],
+    max_concurrency: Optional[int] = None,
+    fields: Optional[List[str]] = None,
+    compact: Optional[bool] = None,
+) -> Shaped[BatchResult]:
+    """
+    Retrieve many threads in one call.
+
+    Use this to show several threads at once instead of calling get_thread
+    once per ID. Threads are fetched concurrently, and each repeated ID only
+    once.
+
+    Args:
+        thread_ids: (REQUIRED) The IDs of the threads to retrieve
+        max_concurrency: Number of requests run at once (default 8)
+        fields: Only return these fields, e.g. ["id", "metadata"];
+            dotted paths select nested fields
+        compact: Drop null fields, defaults and empty lists from the result
+            (default COMPACT_RESPONSES)
+
+    Returns:
+        BatchResult containing:
+        - succeeded: Number of IDs retrieved
+        - failed: Number of IDs that could not be retrieved
+        - skipped: Always 0 for this tool
+        - items: One entry per requested ID, in request order, with index,
+          group (the ID), status, result (ThreadObject) and error
+    """
+    return shape(
+        await anyio.to_thread.run_sync(
+            partial(
+                tools_get_threads,
+                thread_ids=thread_ids,
+                max_concurrency=max_concurrency,
+            )
+        ),
+        fields,
+        compact,
+    )
+
+
+@mcp.tool()
+def modify_thread(
+    thread_id: str,
+    metadata: Optional[Dict[str, str]] = None,
+    tool_resources: Optional[Union[Dict[str, Any], ToolResources]] = None,
+) -> Shaped[Thread]:
+    """
+    Modify a thread.
+
+    Use this to update a thread's metadata or tool resources.
+
+    Args:
+        thread_id: (REQUIRED) The ID of the thread to modify
+        metadata: Key-value pairs (max 16 pairs)
+        tool_resources: Resources for tools
+
+    Returns:
+        ThreadObject: The modified thread containing:
+        - id: The unique identifier for the thread
+        - object: Always "thread"
+        - created_at: Unix timestamp when the thread was created
+        - metadata: Key-value pairs attached to the thread
+        - tool_resources: Resources made available to assistant's tools in this thread
+    """
+    return shape(tools_modify_thread(thread_id, metadata, tool_resources))
+
+
+@mcp.tool()
+def delete_thread(thread_id: str) -> ThreadDeleted:
+    """
+    Delete a thread.
+
+    Permanently removes a thread and all its messages.
+
+    Args:
+        thread_id: (REQUIRED) The ID of the thread to delete
+
+    Returns:
+        ThreadDeleted: The deletion confirmation containing:
+        - id: The ID of the deleted thread
+        - object: Always "thread.deleted"
+        - deleted: Boolean indicating whether the thread was successfully deleted
+    """
+    return tools_delete_thread(thread_id)
+
+
+@mcp.tool()
+async def delete_threads(
+    thread_ids: List[str], max_concurrency: Optional[int] = None
+) -> BatchResult:
+    """
+    Delete many threads in one call.
+
+    Use this for cleanup jobs instead of calling delete_thread once per ID.
+    Deletions run concurrently and pause together when rate limited. Mirrored
+    transcripts and prefetched pages of deleted threads are evicted.
+
+    Args:
+        thread_ids: (REQUIRED) The IDs of the threads to delete
+        max_concurrency: Number of deletions run at once (default 8)
+
+    Returns:
+        BatchResult containing:
+        - succeeded: Number of threads deleted
+        - failed: Number of deletions that failed
+        - skipped: Number of repeated IDs not attempted after a failure
+        - items: One entry per ID, in request order, with index, group
+          (the thread ID), status, result (ThreadDeleted) and error
+    """
+    return await anyio.to_thread.run_sync(
+        partial(
+            tools_delete_threads, thread_ids=thread_ids, max_concurrency=max_concurrency
+        )
+    )
@@ -0,0 +1,9 @@
+"""Metrics package."""
+
+from .counters import get_metrics, increment, reset_metrics
+
+__all__ = [
+    "get_metrics",
+    "increment",
+    "reset_metrics",
+]
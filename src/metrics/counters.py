@@ -0,0 +1,25 @@
+"""Process-wide counters for server metrics."""
+import threading
+from collections import defaultdict
+from typing import DefaultDict, Dict
+
+_counters: DefaultDict[str, float] = defaultdict(float)
+_lock = threading.Lock()
+
+
+def increment(name: str, value: float = 1) -> None:
+    """Add ``value`` to the counter called ``name``."""
+    with _lock:
+        _counters[name] += value
+
+
+def get_metrics() -> Dict[str, float]:
+    """Return a snapshot of all counters."""
+    with _lock:
+        return dict(_counters)
+
+
+def reset_metrics() -> None:
+    """Reset all counters to zero."""
+    with _lock:
+        _counters.clear()
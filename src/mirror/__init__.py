@@ -0,0 +1,23 @@
+"""Thread transcript mirror package."""
+
+from .store import (
+    ThreadTranscript,
+    forget_message,
+    forget_thread,
+    mirrored_message,
+    mirrored_run,
+    refresh_mirrored,
+    thread_lock,
+    thread_mirror,
+)
+
+__all__ = [
+    "ThreadTranscript",
+    "forget_message",
+    "forget_thread",
+    "mirrored_message",
+    "mirrored_run",
+    "refresh_mirrored",
+    "thread_lock",
+    "thread_mirror",
+]
@@ -0,0 +1,132 @@
+"""Local store of mirrored thread transcripts.
+
+A transcript holds the messages, runs and run steps of one thread as returned
+by the API, in ascending creation order. Transcripts live in a registered
+cache so operators can inspect and flush them like any other cache; with
+CACHE_ENABLED off nothing is kept and every read syncs the whole thread.
+
+Transcripts are changed in place, so every access goes through the thread's
+lock and every change is stored again to keep the cache's byte count exact.
+"""
+
+import threading
+from typing import Any, Dict, Optional, Set, TypeVar
+
+from openai.types.beta.threads.message import Message
+from openai.types.beta.threads.run import Run
+from openai.types.beta.threads.runs.run_step import RunStep
+from pydantic import BaseModel, Field
+
+from src.cache import TTLCache, register_cache
+from src.config.settings import Settings
+
+settings = Settings()
+
+MirroredObject = TypeVar("MirroredObject", Message, Run, RunStep)
+
+TERMINAL_RUN_STATUSES = ("completed", "failed", "cancelled", "expired", "incomplete")
+
+
+class ThreadTranscript(BaseModel):
+    """Mirrored contents of a single thread."""
+
+    thread_id: str = Field(description="The ID of the mirrored thread")
+    messages: Dict[str, Message] = Field(
+        default_factory=dict, description="Messages keyed by ID, oldest first"
+    )
+    runs: Dict[str, Run] = Field(
+        default_factory=dict, description="Runs keyed by ID, oldest first"
+    )
+    steps: Dict[str, Dict[str, RunStep]] = Field(
+        default_factory=dict, description="Run steps keyed by run ID and step ID"
+    )
+    complete_step_runs: Set[str] = Field(
+        default_factory=set,
+        description="IDs of terminal runs whose steps are fully mirrored",
+    )
+    size: int = Field(default=0, description="Estimated size of mirrored objects")
+    synced_at: Optional[float] = Field(
+        default=None, description="Unix timestamp of the last successful sync"
+    )
+
+    def put(self, items: Dict[str, MirroredObject], item: MirroredObject) -> None:
+        """Insert or replace an object, keeping the size estimate current."""
+        previous = items.get(item.id)
+        if previous is not None:
+            self.size -= len(previous.model_dump_json())
+        items[item.id] = item
+        self.size += len(item.model_dump_json())
+
+    def newest_id(self, items: Dict[str, MirroredObject]) -> Optional[str]:
+        """Return the ID of the most recently created mirrored object."""
+        return next(reversed(items), None) if items else None
+
+
+thread_mirror: TTLCache[ThreadTranscript] = register_cache(
+    "thread_mirror",
+    max_entries=settings.THREAD_MIRROR_MAX_THREADS,
+    ttl_seconds=0,
+    max_bytes=settings.THREAD_MIRROR_MAX_BYTES,
+    enabled=settings.CACHE_ENABLED,
+    sizeof=lambda transcript: transcript.size,
+)
+
+_thread_locks: Dict[str, threading.Lock] = {}
+_thread_locks_guard = threading.Lock()
+
+
+def thread_lock(thread_id: str) -> threading.Lock:
+    """Return the lock serializing access to one thread's transcript."""
+    with _thread_locks_guard:
+        return _thread_locks.setdefault(thread_id, threading.Lock())
+
+
+def forget_thread(thread_id: str) -> None:
+    """Drop a thread's transcript from the mirror."""
+    with thread_lock(thread_id):
+        thread_mirror.pop(thread_id)
+
+
+def forget_message(thread_id: str, message_id: str) -> None:
+    """Drop a single message from a mirrored transcript."""
+    with thread_lock(thread_id):
+        transcript = thread_mirror.peek(thread_id)
+        if transcript is None or message_id not in transcript.messages:
+            return
+        transcript.size -= len(transcript.messages.pop(message_id).model_dump_json())
+        thread_mirror.set(thread_id, transcript)
+
+
+def refresh_mirrored(thread_id: str, item: Any) -> None:
+    """Replace a mirrored message or run with a newer copy, e.g. after an update."""
+    with thread_lock(thread_id):
+        transcript = thread_mirror.peek(thread_id)
+        if transcript is None:
+            return
+        if isinstance(item, Message) and item.id in transcript.messages:
+            transcript.put(transcript.messages, item)
+        elif isinstance(item, Run) and item.id in transcript.runs:
+            transcript.put(transcript.runs, item)
+        else:
+            return
+        thread_mirror.set(thread_id, transcript)
+
+
+def mirrored_message(thread_id: str, message_id: str) -> Optional[Message]:
+    """Return a mirrored message that can no longer change, if present."""
+    with thread_lock(thread_id):
+        transcript = thread_mirror.peek(thread_id)
+        message = transcript.messages.get(message_id) if transcript else None
+    if message is None or message.status == "in_progress":
+        return None
+    return message
+
+
+def mirrored_run(thread_id: str, run_id: str) -> Optional[Run]:
+    """Return a mirrored run that has reached a terminal status, if present."""
+    with thread_lock(thread_id):
+        transcript = thread_mirror.peek(thread_id)
+        run = transcript.runs.get(run_id) if transcript else None
+    if run is None or run.status not in TERMINAL_RUN_STATUSES:
+        return None
+    return run
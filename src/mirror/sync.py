@@ -0,0 +1,149 @@
+"""Incremental sync of thread transcripts into the local mirror.
+
+Each sync lists only objects newer than the newest mirrored ID (ascending
+order with an ``after`` cursor) and re-fetches the few objects that were still
+in progress last time. A thread that has not changed costs one small list
+request per object type.
+"""
+
+import logging
+import time
+from typing import Any, Dict, Optional
+
+from src.tools.messages.tools import get_message, list_messages
+from src.tools.pagination import iter_items
+from src.tools.run_steps.tools import list_run_steps
+from src.tools.runs.tools import get_run, list_runs
+
+from .store import TERMINAL_RUN_STATUSES, ThreadTranscript, thread_lock, thread_mirror
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_RUN_STATUSES = ("queued", "in_progress", "requires_action", "cancelling")
+
+
+def _sync_messages(transcript: ThreadTranscript) -> None:
+    """Mirror new messages and refresh messages still being written."""
+    thread_id = transcript.thread_id
+    pending = [
+        message_id
+        for message_id, message in transcript.messages.items()
+        if message.status == "in_progress"
+    ]
+    for message in iter_items(
+        list_messages,
+        transcript.newest_id(transcript.messages),
+        thread_id=thread_id,
+        order="asc",
+    ):
+        transcript.put(transcript.messages, message)
+    for message_id in pending:
+        transcript.put(transcript.messages, get_message(thread_id, message_id))
+
+
+def _sync_runs(transcript: ThreadTranscript) -> None:
+    """Mirror new runs and refresh runs that had not finished."""
+    thread_id = transcript.thread_id
+    active = [
+        run_id
+        for run_id, run in transcript.runs.items()
+        if run.status in ACTIVE_RUN_STATUSES
+    ]
+    for run in iter_items(
+        list_runs,
+        transcript.newest_id(transcript.runs),
+        thread_id=thread_id,
+        order="asc",
+    ):
+        transcript.put(transcript.runs, run)
+    for run_id in active:
+        transcript.put(transcript.runs, get_run(thread_id=thread_id, run_id=run_id))
+
+
+def _sync_steps(transcript: ThreadTranscript) -> None:
+    """Mirror steps of every run whose steps are not fully mirrored yet."""
+    thread_id = transcript.thread_id
+    for run_id, run in transcript.runs.items():
+        if run_id in transcript.complete_step_runs:
+            continue
+        steps = transcript.steps.setdefault(run_id, {})
+        # Steps of an unfinished run may still change, so they are listed from
+        # the start until the run is terminal and its final steps are mirrored
+        for step in iter_items(
+            list_run_steps, thread_id=thread_id, run_id=run_id, order="asc"
+        ):
+            transcript.put(steps, step)
+        if run.status in TERMINAL_RUN_STATUSES:
+            transcript.complete_step_runs.add(run_id)
+
+
+def _sync_locked(
+    thread_id: str, transcript: Optional[ThreadTranscript], include_runs: bool
+) -> ThreadTranscript:
+    """Sync a transcript while holding its thread lock and store it again."""
+    transcript = transcript or ThreadTranscript(thread_id=thread_id)
+    try:
+        _sync_messages(transcript)
+        if include_runs:
+            _sync_runs(transcript)
+            _sync_steps(transcript)
+        transcript.synced_at = time.time()
+    finally:
+        # Store even a partial sync so the cache counts the bytes it added
+        thread_mirror.set(thread_id, transcript)
+    return transcript
+
+
+def sync_thread(thread_id: str, include_runs: bool = True) -> ThreadTranscript:
+    """
+    Bring a thread's mirrored transcript up to date.
+
+    Args:
+        thread_id: (REQUIRED) The ID of the thread to sync
+        include_runs: Also mirror runs and run steps (default True)
+
+    Returns:
+        ThreadTranscript: The updated transcript
+    """
+    logger.info(f"Syncing thread mirror for {thread_id}")
+
+    with thread_lock(thread_id):
+        return _sync_locked(thread_id, thread_mirror.get(thread_id), include_runs)
+
+
+def get_thread_transcript(
+    thread_id: str,
+    sync: bool = True,
+    include_runs: bool = True,
+) -> Dict[str, Any]:
+    """
+    Get a thread's messages, runs and run steps from the local mirror.
+
+    Args:
+        thread_id: (REQUIRED) The ID of the thread to read
+        sync: Fetch changes since the last sync before reading (default True)
+        include_runs: Include runs and run steps (default True)
+
+    Returns:
+        Dict with thread_id, messages, runs, steps (keyed by run ID) and
+        synced_at, with objects in ascending creation order
+    """
+    logger.info(f"Reading thread transcript for {thread_id}")
+
+    with thread_lock(thread_id):
+        transcript = thread_mirror.get(thread_id)
+        if sync or transcript is None:
+            transcript = _sync_locked(thread_id, transcript, include_runs)
+
+        result: Dict[str, Any] = {
+            "thread_id": thread_id,
+            "messages": list(transcript.messages.values()),
+            "synced_at": transcript.synced_at,
+        }
+        if include_runs:
+            result["runs"] = list(transcript.runs.values())
+            result["steps"] = {
+                run_id: list(steps.values())
+                for run_id, steps in transcript.steps.items()
+            }
+    return result
@@ -2,6 +2,8 @@
 
 from .models import (  # Common Models
     AssistantFileSearchTool,
+    BatchItemResult,
+    BatchResult,
     CodeInterpreterResource,
     CodeInterpreterTool,
     FileSearchConfig,
@@ -18,11 +20,14 @@ from .models import (  # Common Models
     TextResponseFormat,
     Tool,
     ToolResources,
+    request_params,
 )
 
 __all__ = [
     # Common Models
     "AssistantFileSearchTool",
+    "BatchItemResult",
+    "BatchResult",
     "CodeInterpreterResource",
     "CodeInterpreterTool",
     "FileSearchConfig",
@@ -39,4 +44,6 @@ __all__ = [
     "TextResponseFormat",
     "Tool",
     "ToolResources",
+    # Request building
+    "request_params",
 ]
@@ -9,20 +9,37 @@ from .models import (
     ModifyAssistantRequest,
 )
 from .tools import (
+    assistant_cache,
     create_assistant,
     delete_assistant,
+    delete_assistants,
     get_assistant,
+    get_assistants,
+    iter_assistant_pages,
+    list_all_assistants,
     list_assistants,
     modify_assistant,
+    start_assistant_cache_refresh,
+    stop_assistant_cache_refresh,
+    warm_assistant_cache,
 )
 
 __all__ = [
     # Tools
     "create_assistant",
     "get_assistant",
+    "get_assistants",
     "list_assistants",
+    "list_all_assistants",
+    "iter_assistant_pages",
     "modify_assistant",
     "delete_assistant",
+    "delete_assistants",
+    # Cache
+    "assistant_cache",
+    "start_assistant_cache_refresh",
+    "stop_assistant_cache_refresh",
+    "warm_assistant_cache",
     # Models
     "AssistantListResponse",
     "AssistantObject",
@@ -1,21 +1,223 @@
 """OpenAI Assistant API tools implementation."""
+import json
 import logging
-from typing import Dict, List, Literal, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Literal, Optional
 
-from openai import OpenAI
+import anyio
+from openai import NOT_GIVEN, OpenAI
 from openai.pagination import SyncCursorPage
 from openai.types.beta.assistant import Assistant
 from openai.types.beta.assistant_deleted import AssistantDeleted
 
+from src.cache import TTLCache, register_cache
 from src.config.settings import Settings
+from src.metrics import increment
 
-from ..models import ResponseFormat, Tool, ToolResources
+from ..batch import fetch_many, run_grouped
+from ..models import BatchResult, ResponseFormat, Tool, ToolResources, request_params
+from ..pagination import LIST_PAGE_LIMIT, iter_pages
 from .models import CreateAssistantRequest, ModifyAssistantRequest
 
 logger = logging.getLogger(__name__)
 settings = Settings()
 client = OpenAI(api_key=settings.OPENAI_API_KEY)
 
+assistant_cache: TTLCache[Assistant] = register_cache(
+    "assistants",
+    max_entries=settings.ASSISTANT_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.ASSISTANT_CACHE_TTL_SECONDS,
+    enabled=settings.CACHE_ENABLED,
+)
+
+# Evictions plus invalidations of assistant_cache when it last held the full
+# assistant list. None means the cache may be partial and listings must go
+# upstream.
+_assistant_index_removals: Optional[int] = None
+_refresh_stop = threading.Event()
+_refresh_thread: Optional[threading.Thread] = None
+
+DEFAULT_LIST_LIMIT = 20
+# Rankers the API reports for file_search tools sent without ranking options
+DEFAULT_RANKERS = ("auto", "default_2024_08_21")
+
+
+def _cache_assistant(assistant: Assistant) -> None:
+    """Store an assistant returned by the API in the assistant cache."""
+    if assistant_cache.enabled:
+        assistant_cache.set(assistant.id, assistant)
+
+
+def _normalize_tool(tool: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop tool settings the API fills in with defaults when they are left out."""
+    tool = dict(tool)
+    function = tool.get("function")
+    if isinstance(function, dict) and not function.get("strict"):
+        tool["function"] = {k: v for k, v in function.items() if k != "strict"}
+    file_search = tool.get("file_search")
+    if isinstance(file_search, dict):
+        ranking = file_search.get("ranking_options") or {}
+        if (
+            not ranking.get("score_threshold")
+            and ranking.get("ranker", "auto") in DEFAULT_RANKERS
+        ):
+            file_search = {
+                k: v for k, v in file_search.items() if k != "ranking_options"
+            }
+        if file_search:
+            tool["file_search"] = file_search
+        else:
+            del tool["file_search"]
+    return tool
+
+
+def _normalize_field(key: str, value: Any) -> Any:
+    """Return a field value in the form used to compare request and assistant."""
+    if key == "tools" and isinstance(value, list):
+        return [_normalize_tool(tool) for tool in value]
+    return value
+
+
+def _changed_fields(cached: Assistant, request: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the request fields whose values differ from the cached assistant."""
+    current = cached.model_dump(mode="json", exclude_none=True)
+    return {
+        key: value
+        for key, value in request.items()
+        if _normalize_field(key, current.get(key)) != _normalize_field(key, value)
+    }
+
+
+def _assistant_index_complete() -> bool:
+    """Check whether the cache still holds every assistant from the last sync."""
+    return (
+        assistant_cache.enabled
+        and _assistant_index_removals is not None
+        and _assistant_index_removals
+        == assistant_cache.evictions + assistant_cache.invalidations
+    )
+
+
+def _page_assistants(
+    order: Literal["asc", "desc"],
+    seen: Dict[str, Assistant],
+    lock: threading.Lock,
+    done: threading.Event,
+) -> None:
+    """Page through assistants in one direction until meeting the other scan."""
+    after: Optional[str] = None
+    while not done.is_set():
+        page = client.beta.assistants.list(
+            limit=LIST_PAGE_LIMIT,
+            order=order,
+            after=after if after is not None else NOT_GIVEN,
+        )
+        with lock:
+            overlap = any(assistant.id in seen for assistant in page.data)
+            for assistant in page.data:
+                seen[assistant.id] = assistant
+        if overlap or not page.has_more or not page.data:
+            done.set()
+            return
+        after = page.data[-1].id
+
+
+def warm_assistant_cache() -> int:
+    """
+    Load every assistant into the assistant cache.
+
+    Cursor pagination is serial, so the list is scanned from both ends at once
+    (ascending and descending) and the scans stop when they meet, halving the
+    number of sequential round trips for large organizations.
+
+    Returns:
+        Number of assistants cached
+    """
+    if not assistant_cache.enabled:
+        return 0
+    logger.info("Warming assistant cache")
+
+    seen: Dict[str, Assistant] = {}
+    lock = threading.Lock()
+    done = threading.Event()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        scans = [
+            executor.submit(_page_assistants, order, seen, lock, done)
+            for order in ("desc", "asc")
+        ]
+        for scan in scans:
+            scan.result()
+
+    _replace_assistant_index(list(seen.values()))
+    logger.info(f"Assistant cache warmed with {len(seen)} assistants")
+    return len(seen)
+
+
+def _replace_assistant_index(assistants: List[Assistant]) -> None:
+    """Make the assistant cache hold exactly ``assistants`` as the full list."""
+    global _assistant_index_removals
+
+    if not assistant_cache.enabled:
+        return
+    listed = set(assistant.id for assistant in assistants)
+    for assistant_id in set(a.id for a in assistant_cache.values()) - listed:
+        assistant_cache.pop(assistant_id)
+    for assistant in assistants:
+        _cache_assistant(assistant)
+
+    if len(assistants) <= assistant_cache.max_entries:
+        _assistant_index_removals = (
+            assistant_cache.evictions + assistant_cache.invalidations
+        )
+    else:
+        _assistant_index_removals = None
+
+
+def _refresh_assistant_cache_loop(interval: float) -> None:
+    """Warm the assistant cache now and then every ``interval`` seconds."""
+    while not _refresh_stop.is_set():
+        try:
+            warm_assistant_cache()
+        except Exception as e:
+            logger.error(f"Failed to refresh assistant cache: {e}")
+        _refresh_stop.wait(interval)
+
+
+def start_assistant_cache_refresh(
+    interval: Optional[float] = None,
+) -> threading.Thread:
+    """
+    Start warming the assistant cache in a background thread.
+
+    The thread keeps the cache fresh by re-listing assistants at a low
+    frequency, so server startup never waits on the upstream list call.
+
+    Args:
+        interval: Seconds between refreshes (default ASSISTANT_CACHE_REFRESH_SECONDS)
+
+    Returns:
+        The running daemon thread
+    """
+    global _refresh_thread
+
+    if _refresh_thread is not None and _refresh_thread.is_alive():
+        return _refresh_thread
+    _refresh_stop.clear()
+    _refresh_thread = threading.Thread(
+        target=_refresh_assistant_cache_loop,
+        args=(interval or settings.ASSISTANT_CACHE_REFRESH_SECONDS,),
+        name="assistant-cache-refresh",
+        daemon=True,
+    )
+    _refresh_thread.start()
+    return _refresh_thread
+
+
+def stop_assistant_cache_refresh() -> None:
+    """Stop the background assistant cache refresh."""
+    _refresh_stop.set()
+
 
 def create_assistant(
     model: str,
@@ -65,13 +267,14 @@ def create_assistant(
         reasoning_effort=reasoning_effort,
     )
 
-    request_data = request.model_dump()
+    request_data = request_params(request)
     logger.info(f"Creating assistant with request data: {request_data}")
 
     response = client.beta.assistants.create(**request_data)
     logger.info(f"Got response from OpenAI: {response}")
     logger.info(f"Response type: {type(response)}")
 
+    _cache_assistant(response)
     return response
 
 
@@ -87,25 +290,175 @@ def get_assistant(assistant_id: str) -> Assistant:
     """
     logger.info(f"Getting assistant {assistant_id}")
 
+    cached = assistant_cache.get(assistant_id)
+    if cached is not None:
+        return cached
+
     response = client.beta.assistants.retrieve(assistant_id)
+    assistant_cache.set(assistant_id, response)
     return response
 
 
-def list_assistants() -> SyncCursorPage[Assistant]:
+def get_assistants(
+    assistant_ids: List[str], max_concurrency: Optional[int] = None
+) -> BatchResult:
+    """
+    Retrieve many assistants by ID.
+
+    Repeated IDs are fetched once, assistants in the assistant cache are served
+    locally, and the rest are fetched concurrently.
+
+    Args:
+        assistant_ids: (REQUIRED) The IDs of the assistants to retrieve
+        max_concurrency: Requests run at once (default BATCH_MAX_CONCURRENCY)
+
+    Returns:
+        BatchResult with the Assistant or error for every ID, in request order
+    """
+    logger.info(f"Getting {len(assistant_ids)} assistants")
+
+    return fetch_many(
+        assistant_ids,
+        fetch=get_assistant,
+        cached=assistant_cache.get,
+        max_concurrency=max_concurrency,
+    )
+
+
+def _list_cached_assistants(
+    limit: Optional[int],
+    order: Optional[Literal["asc", "desc"]],
+    after: Optional[str],
+    before: Optional[str],
+) -> Optional[SyncCursorPage[Assistant]]:
+    """
+    Build a list page from the assistant cache.
+
+    Returns:
+        The page, or None if the cache is partial or a cursor is not cached
+    """
+    if not _assistant_index_complete():
+        return None
+    assistants = sorted(
+        assistant_cache.values(),
+        key=lambda a: (a.created_at, a.id),
+        reverse=order != "asc",
+    )
+    ids = [assistant.id for assistant in assistants]
+    if (after is not None and after not in ids) or (
+        before is not None and before not in ids
+    ):
+        return None
+
+    start = ids.index(after) + 1 if after is not None else 0
+    end = ids.index(before) if before is not None else len(ids)
+    limit = limit or DEFAULT_LIST_LIMIT
+    if before is not None and after is None:
+        # A before cursor selects the page immediately preceding it
+        page_start = max(start, end - limit)
+        return SyncCursorPage[Assistant](
+            data=assistants[page_start:end], has_more=page_start > start
+        )
+    stop = min(end, start + limit)
+    return SyncCursorPage[Assistant](data=assistants[start:stop], has_more=stop < end)
+
+
+def list_assistants(
+    limit: Optional[int] = None,
+    order: Optional[Literal["asc", "desc"]] = None,
+    after: Optional[str] = None,
+    before: Optional[str] = None,
+) -> SyncCursorPage[Assistant]:
     """
     List assistants.
 
-    This is an MCP resource since it takes no arguments.
+    When the assistant cache holds the full list (see warm_assistant_cache)
+    the page is served locally.
+
+    Args:
+        limit: Limit on number of assistants (1-100, default 20)
+        order: Sort order by created_at ('asc' or 'desc', default 'desc')
+        after: Cursor for pagination (get assistants after this ID)
+        before: Cursor for pagination (get assistants before this ID)
 
     Returns:
         SyncCursorPage[Assistant] from OpenAI SDK
     """
     logger.info("Listing assistants")
 
-    response = client.beta.assistants.list()
+    cached_page = _list_cached_assistants(limit, order, after, before)
+    if cached_page is not None:
+        return cached_page
+
+    params = {
+        "limit": limit,
+        "order": order,
+        "after": after,
+        "before": before,
+    }
+    # Remove None values
+    params = {k: v for k, v in params.items() if v is not None}
+
+    response = client.beta.assistants.list(**params)
+    for assistant in response.data:
+        _cache_assistant(assistant)
     return response
 
 
+def iter_assistant_pages(
+    order: Literal["asc", "desc"] = "desc",
+) -> Iterator[SyncCursorPage[Assistant]]:
+    """
+    Iterate over every page of assistants using the maximum page size.
+
+    A complete iteration also refreshes the assistant cache with the full list.
+
+    Args:
+        order: Sort order by created_at ('asc' or 'desc', default 'desc')
+
+    Yields:
+        SyncCursorPage[Assistant] pages from OpenAI SDK
+    """
+    logger.info("Listing all assistants")
+
+    assistants: List[Assistant] = []
+    for page in iter_pages(list_assistants, order=order):
+        assistants.extend(page.data)
+        yield page
+    _replace_assistant_index(assistants)
+
+
+async def list_all_assistants(
+    order: Literal["asc", "desc"] = "desc",
+    on_page: Optional[
+        Callable[[SyncCursorPage[Assistant], int], Awaitable[None]]
+    ] = None,
+) -> SyncCursorPage[Assistant]:
+    """
+    List every assistant, reporting each page as it arrives.
+
+    Pages are fetched in a worker thread so the event loop stays free to
+    deliver progress notifications while the listing runs.
+
+    Args:
+        order: Sort order by created_at ('asc' or 'desc', default 'desc')
+        on_page: Awaited with each page and the running assistant count
+
+    Returns:
+        SyncCursorPage[Assistant] holding all assistants
+    """
+    assistants: List[Assistant] = []
+    pages = iter_assistant_pages(order=order)
+    while True:
+        page = await anyio.to_thread.run_sync(next, pages, None)
+        if page is None:
+            break
+        assistants.extend(page.data)
+        if on_page is not None:
+            await on_page(page, len(assistants))
+    return SyncCursorPage[Assistant](data=assistants, has_more=False)
+
+
 def modify_assistant(
     assistant_id: str,
     model: Optional[str] = None,
@@ -123,6 +476,9 @@ def modify_assistant(
     """
     Modify an assistant.
 
+    When the assistant is cached, only fields that differ from the cached copy
+    are sent, and the upstream call is skipped if nothing changed.
+
     Args:
         assistant_id: (REQUIRED) The ID of the assistant to modify
         model: ID of the model to use
@@ -156,7 +512,24 @@ def modify_assistant(
         reasoning_effort=reasoning_effort,
     ).model_dump(exclude_none=True)
 
+    cached = assistant_cache.get(assistant_id)
+    if cached is not None:
+        changed = _changed_fields(cached, request)
+        unchanged = {k: v for k, v in request.items() if k not in changed}
+        if unchanged:
+            increment("assistant_modify.fields_skipped", len(unchanged))
+            increment(
+                "assistant_modify.bytes_saved",
+                len(json.dumps(unchanged, default=str).encode("utf-8")),
+            )
+        if not changed:
+            logger.info(f"Assistant {assistant_id} unchanged, skipping update")
+            increment("assistant_modify.calls_skipped")
+            return cached
+        request = changed
+
     response = client.beta.assistants.update(assistant_id, **request)
+    _cache_assistant(response)
     return response
 
 
@@ -173,4 +546,28 @@ def delete_assistant(assistant_id: str) -> AssistantDeleted:
     logger.info(f"Deleting assistant {assistant_id}")
 
     response = client.beta.assistants.delete(assistant_id)
+    assistant_cache.pop(assistant_id)
     return response
+
+
+def delete_assistants(
+    assistant_ids: List[str], max_concurrency: Optional[int] = None
+) -> BatchResult:
+    """
+    Delete many assistants concurrently.
+
+    Args:
+        assistant_ids: (REQUIRED) The IDs of the assistants to delete
+        max_concurrency: Deletions run at once (default BATCH_MAX_CONCURRENCY)
+
+    Returns:
+        BatchResult with the AssistantDeleted status or error for every ID
+    """
+    logger.info(f"Deleting {len(assistant_ids)} assistants in batch")
+
+    return run_grouped(
+        assistant_ids,
+        group=lambda assistant_id: assistant_id,
+        action=delete_assistant,
+        max_concurrency=max_concurrency,
+    )
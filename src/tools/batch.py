@@ -0,0 +1,190 @@
+"""Runner for batch tools that write many objects in one call.
+
+Items sharing a group key (usually a thread ID) are applied one after another
+in request order; different groups run concurrently on a bounded pool. When
+the API answers with a rate limit error, every worker pauses for the
+advertised delay before the item is retried.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, TypeVar
+
+from openai import RateLimitError
+
+from src.config.settings import Settings
+from src.metrics import increment
+
+from .models import BatchItemResult, BatchResult
+
+logger = logging.getLogger(__name__)
+settings = Settings()
+
+T = TypeVar("T")
+
+
+class _RateLimitGate:
+    """Shared pause that all workers of a batch honour after a 429."""
+
+    def __init__(self) -> None:
+        self._resume_at = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        with self._lock:
+            delay = self._resume_at - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    def back_off(self, delay: float) -> None:
+        with self._lock:
+            self._resume_at = max(self._resume_at, time.monotonic() + delay)
+
+
+def _retry_delay(error: RateLimitError, attempt: int) -> float:
+    """Use the server's retry-after header, else exponential backoff."""
+    retry_after = error.response.headers.get("retry-after")
+    try:
+        return float(retry_after)
+    except (TypeError, ValueError):
+        return float(settings.BATCH_RATE_LIMIT_BACKOFF_SECONDS * 2**attempt)
+
+
+def _call_with_backoff(
+    action: Callable[[T], Any], item: T, gate: _RateLimitGate
+) -> Any:
+    """Run ``action``, retrying rate-limited calls up to the configured limit."""
+    attempt = 0
+    while True:
+        gate.wait()
+        try:
+            return action(item)
+        except RateLimitError as e:
+            if attempt >= settings.BATCH_RATE_LIMIT_RETRIES:
+                raise
+            delay = _retry_delay(e, attempt)
+            logger.warning(f"Rate limited, pausing batch for {delay:.1f}s")
+            gate.back_off(delay)
+            attempt += 1
+
+
+def run_grouped(
+    items: Sequence[T],
+    group: Callable[[T], str],
+    action: Callable[[T], Any],
+    max_concurrency: Optional[int] = None,
+) -> BatchResult:
+    """
+    Apply ``action`` to every item, keeping order within each group.
+
+    Once an item fails, the rest of its group is skipped so that later items
+    never land ahead of an earlier one. Other groups are unaffected.
+    Rate-limited calls are retried after a pause shared by all workers.
+
+    Args:
+        items: Items to process, in request order
+        group: Returns the ordering key of an item
+        action: Performs the request for one item and returns its result
+        max_concurrency: Groups processed at once (default BATCH_MAX_CONCURRENCY)
+
+    Returns:
+        BatchResult with one entry per item, in request order
+    """
+    groups: Dict[str, List[int]] = {}
+    for index, item in enumerate(items):
+        groups.setdefault(group(item), []).append(index)
+    results: List[Optional[BatchItemResult]] = [None] * len(items)
+    gate = _RateLimitGate()
+
+    def run_group(key: str, indices: List[int]) -> None:
+        failed_index: Optional[int] = None
+        for index in indices:
+            if failed_index is not None:
+                results[index] = BatchItemResult(
+                    index=index,
+                    group=key,
+                    status="skipped",
+                    error=f"Not attempted after item {failed_index} failed",
+                )
+                continue
+            try:
+                result = _call_with_backoff(action, items[index], gate)
+            except Exception as e:
+                logger.warning(f"Batch item {index} for {key} failed: {e}")
+                failed_index = index
+                results[index] = BatchItemResult(
+                    index=index, group=key, status="failed", error=str(e)
+                )
+            else:
+                results[index] = BatchItemResult(
+                    index=index, group=key, status="succeeded", result=result
+                )
+
+    workers = min(max_concurrency or settings.BATCH_MAX_CONCURRENCY, len(groups))
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+        futures = [executor.submit(run_group, k, v) for k, v in groups.items()]
+        for future in futures:
+            future.result()
+
+    done = [result for result in results if result is not None]
+    return BatchResult(
+        succeeded=sum(result.status == "succeeded" for result in done),
+        failed=sum(result.status == "failed" for result in done),
+        skipped=sum(result.status == "skipped" for result in done),
+        items=done,
+    )
+
+
+def fetch_many(
+    ids: Sequence[str],
+    fetch: Callable[[str], Any],
+    cached: Optional[Callable[[str], Any]] = None,
+    max_concurrency: Optional[int] = None,
+) -> BatchResult:
+    """
+    Fetch objects by ID, deduplicating and serving cached ones locally.
+
+    Args:
+        ids: Object IDs in request order; repeats are fetched once
+        fetch: Retrieves one object from the API
+        cached: Returns a locally held object or None
+        max_concurrency: Requests run at once (default BATCH_MAX_CONCURRENCY)
+
+    Returns:
+        BatchResult with one entry per requested ID, in request order
+    """
+    unique = list(dict.fromkeys(ids))
+    hits = {}
+    if cached is not None:
+        for object_id in unique:
+            value = cached(object_id)
+            if value is not None:
+                hits[object_id] = value
+    misses = [object_id for object_id in unique if object_id not in hits]
+    increment("batch_get.cache_hits", len(hits))
+    increment("batch_get.duplicates", len(ids) - len(unique))
+
+    fetched = run_grouped(
+        misses,
+        group=lambda object_id: object_id,
+        action=fetch,
+        max_concurrency=max_concurrency,
+    )
+    by_id = {item.group: item for item in fetched.items}
+    items = []
+    for index, object_id in enumerate(ids):
+        if object_id in hits:
+            item = BatchItemResult(
+                index=index, group=object_id, status="succeeded", result=hits[object_id]
+            )
+        else:
+            item = by_id[object_id].model_copy(update={"index": index})
+        items.append(item)
+    return BatchResult(
+        succeeded=sum(item.status == "succeeded" for item in items),
+        failed=sum(item.status == "failed" for item in items),
+        skipped=0,
+        items=items,
+    )
@@ -0,0 +1,10 @@
+"""Cache introspection and control tools module for MCP server."""
+
+from .tools import flush_caches, get_cache_stats, invalidate_cache
+
+__all__ = [
+    # Tools
+    "flush_caches",
+    "get_cache_stats",
+    "invalidate_cache",
+]
@@ -0,0 +1,79 @@
+"""Cache introspection and control tools implementation."""
+import logging
+from typing import Any, Dict, List, Optional
+
+from src.cache import TTLCache, get_cache, list_caches
+from src.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+
+def _select_caches(name: Optional[str]) -> List[TTLCache]:
+    """Return the named cache, or every registered cache when name is None."""
+    if name is None:
+        return list_caches()
+    return [get_cache(name)]
+
+
+def get_cache_stats(name: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Get cache statistics.
+
+    Args:
+        name: Name of a single cache to report (default all caches)
+
+    Returns:
+        Dict with per-cache stats (entries, bytes, hit rate, evictions,
+        age distribution) and the server metrics counters
+    """
+    logger.info(f"Getting cache stats for {name or 'all caches'}")
+
+    return {
+        "caches": {cache.name: cache.stats() for cache in _select_caches(name)},
+        "metrics": get_metrics(),
+    }
+
+
+def invalidate_cache(
+    name: str,
+    object_id: Optional[str] = None,
+    prefix: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Invalidate cache entries by object ID or key prefix.
+
+    Args:
+        name: (REQUIRED) Name of the cache to invalidate entries in
+        object_id: ID of the object to drop
+        prefix: Drop every entry whose key starts with this prefix
+
+    Returns:
+        Dict with the cache name and number of entries invalidated
+    """
+    if object_id is None and prefix is None:
+        raise ValueError("Either object_id or prefix must be provided")
+
+    logger.info(f"Invalidating cache {name} (id={object_id}, prefix={prefix})")
+
+    cache = get_cache(name)
+    invalidated = 0
+    if object_id is not None:
+        invalidated += int(cache.invalidate(object_id))
+    if prefix is not None:
+        invalidated += cache.invalidate_prefix(prefix)
+    return {"name": name, "invalidated": invalidated}
+
+
+def flush_caches(name: Optional[str] = None) -> Dict[str, int]:
+    """
+    Remove every entry from one or all caches.
+
+    Args:
+        name: Name of a single cache to flush (default all caches)
+
+    Returns:
+        Dict mapping cache name to number of entries removed
+    """
+    logger.info(f"Flushing {name or 'all caches'}")
+
+    return {cache.name: cache.clear() for cache in _select_caches(name)}
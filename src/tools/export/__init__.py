@@ -0,0 +1,9 @@
+"""Thread export tools module for MCP server."""
+
+from .tools import export_thread, export_threads
+
+__all__ = [
+    # Tools
+    "export_thread",
+    "export_threads",
+]
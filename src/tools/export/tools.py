@@ -0,0 +1,145 @@
+"""Thread export tools implementation.
+
+Records are written to disk one at a time as pages arrive, so exporting a
+thread needs memory for a single page regardless of the thread's length.
+"""
+import gzip
+import json
+import logging
+import os
+from typing import IO, Any, Dict, List, Optional
+
+from pydantic import BaseModel
+
+from ..batch import run_grouped
+from ..messages import list_messages
+from ..models import BatchResult
+from ..pagination import iter_items
+from ..paths import check_object_id, export_path
+from ..run_steps import list_run_steps
+from ..run_steps.tools import FILE_SEARCH_CONTENT_INCLUDE
+from ..runs import list_runs
+from ..threads import get_thread
+
+logger = logging.getLogger(__name__)
+
+
+def _open_output(path: str, compress: bool) -> IO[str]:
+    """Open a text file for writing, optionally gzip-compressed."""
+    if compress:
+        return gzip.open(path, "wt", encoding="utf-8")
+    return open(path, "w", encoding="utf-8")
+
+
+def _write(output: IO[str], record_type: str, item: BaseModel) -> None:
+    """Write one record as a JSON line."""
+    output.write(
+        json.dumps({"type": record_type, "data": item.model_dump(mode="json")})
+    )
+    output.write("\n")
+
+
+def export_thread(
+    thread_id: str, output_path: str, include_steps: bool = True
+) -> Dict[str, Any]:
+    """
+    Export a thread with its messages, runs and run steps to a JSONL file.
+
+    Each line is {"type": ..., "data": ...} with type thread, message, run or
+    run_step. Run steps include file_search result content. Paths ending in
+    .gz are gzip-compressed. The file is written under a temporary name and
+    only renamed to output_path once the export is complete.
+
+    Args:
+        thread_id: (REQUIRED) The ID of the thread to export
+        output_path: (REQUIRED) File to write inside EXPORT_DIR,
+            e.g. 'thread.jsonl.gz'
+        include_steps: Whether to export run steps (default True)
+
+    Returns:
+        Dict with thread_id, the resolved output_path, the number of messages,
+        runs and run_steps written, and the file size in bytes
+
+    Raises:
+        ValueError: If output_path is outside EXPORT_DIR
+    """
+    output_path = export_path(output_path)
+    logger.info(f"Exporting thread {thread_id} to {output_path}")
+
+    counts = {"messages": 0, "runs": 0, "run_steps": 0}
+    partial_path = f"{output_path}.partial"
+    try:
+        with _open_output(partial_path, output_path.endswith(".gz")) as output:
+            _write(output, "thread", get_thread(thread_id))
+            for message in iter_items(list_messages, thread_id=thread_id, order="asc"):
+                _write(output, "message", message)
+                counts["messages"] += 1
+            for run in iter_items(list_runs, thread_id=thread_id, order="asc"):
+                _write(output, "run", run)
+                counts["runs"] += 1
+                if not include_steps:
+                    continue
+                for step in iter_items(
+                    list_run_steps,
+                    thread_id=thread_id,
+                    run_id=run.id,
+                    order="asc",
+                    include=[FILE_SEARCH_CONTENT_INCLUDE],
+                ):
+                    _write(output, "run_step", step)
+                    counts["run_steps"] += 1
+        os.replace(partial_path, output_path)
+    except BaseException:
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+        raise
+
+    return {
+        "thread_id": thread_id,
+        "output_path": output_path,
+        **counts,
+        "bytes": os.path.getsize(output_path),
+    }
+
+
+def export_threads(
+    thread_ids: List[str],
+    output_dir: str,
+    compress: bool = True,
+    include_steps: bool = True,
+    max_concurrency: Optional[int] = None,
+) -> BatchResult:
+    """
+    Export many threads concurrently, one file per thread.
+
+    Args:
+        thread_ids: (REQUIRED) The IDs of the threads to export
+        output_dir: (REQUIRED) Directory inside EXPORT_DIR to write
+            '<thread_id>.jsonl[.gz]' into
+        compress: Whether to gzip the files (default True)
+        include_steps: Whether to export run steps (default True)
+        max_concurrency: Threads exported at once (default BATCH_MAX_CONCURRENCY)
+
+    Returns:
+        BatchResult with the export summary or error for every thread
+
+    Raises:
+        ValueError: If output_dir is outside EXPORT_DIR or a thread ID is not
+            a plain ID
+    """
+    for thread_id in thread_ids:
+        check_object_id(thread_id)
+    output_dir = export_path(output_dir, directory=True)
+    logger.info(f"Exporting {len(thread_ids)} threads to {output_dir}")
+
+    suffix = ".jsonl.gz" if compress else ".jsonl"
+    return run_grouped(
+        thread_ids,
+        group=lambda thread_id: thread_id,
+        action=lambda thread_id: export_thread(
+            thread_id,
+            os.path.join(output_dir, f"{thread_id}{suffix}"),
+            include_steps=include_steps,
+        ),
+        max_concurrency=max_concurrency,
+    )
@@ -5,6 +5,7 @@ This module provides models and utilities for interacting with the OpenAI Messag
 
 from .models import (
     AttachmentTool,
+    BatchMessage,
     CreateMessageRequest,
     DeleteMessageResponse,
     FileCitationAnnotation,
@@ -27,20 +28,36 @@ from .models import (
     TextContent,
 )
 from .tools import (
+    batch_create_messages,
+    compact_message,
     create_message,
+    create_message_from,
     delete_message,
+    delete_messages,
     get_message,
+    get_messages,
+    iter_message_pages,
+    iter_thread_messages,
     list_messages,
+    list_messages_raw,
     modify_message,
 )
 
 __all__ = [
     # Tools
     "create_message",
+    "create_message_from",
     "delete_message",
+    "delete_messages",
     "get_message",
+    "get_messages",
     "list_messages",
+    "list_messages_raw",
     "modify_message",
+    "compact_message",
+    "iter_message_pages",
+    "iter_thread_messages",
+    "batch_create_messages",
     # Models
     "ImageFileContent",
     "MessageImageFile",
@@ -58,6 +75,7 @@ __all__ = [
     "AttachmentTool",
     "MessageAttachment",
     "CreateMessageRequest",
+    "BatchMessage",
     "ModifyMessageRequest",
     "MessageIncompleteDetails",
     "MessageObject",
@@ -4,7 +4,7 @@ This module provides type-safe models for interacting with the OpenAI Message AP
 including models for message content, annotations, and message-specific operations.
 """
 
-from typing import List, Literal, Optional, Union
+from typing import Annotated, List, Literal, Optional, Union
 
 from pydantic import BaseModel, Field
 
@@ -99,7 +99,12 @@ class TextContent(BaseModel):
     """Model for text content."""
 
     value: str = Field(description="The data that makes up the text")
-    annotations: List[Union[FileCitationAnnotation, FilePathAnnotation]] = Field(
+    annotations: List[
+        Annotated[
+            Union[FileCitationAnnotation, FilePathAnnotation],
+            Field(discriminator="type"),
+        ]
+    ] = Field(
         default_factory=list,
         description="Annotations providing additional context or references",
     )
@@ -127,10 +132,15 @@ class MessageRefusal(BaseModel):
     refusal: RefusalContent
 
 
-MessageContent = Union[MessageText, MessageImageFile, MessageImageUrl, MessageRefusal]
+MessageContent = Annotated[
+    Union[MessageText, MessageImageFile, MessageImageUrl, MessageRefusal],
+    Field(discriminator="type"),
+]
 
 
-AttachmentTool = Union[CodeInterpreterTool, FileSearchTool]
+AttachmentTool = Annotated[
+    Union[CodeInterpreterTool, FileSearchTool], Field(discriminator="type")
+]
 
 
 class MessageAttachment(BaseModel):
@@ -163,6 +173,12 @@ class CreateMessageRequest(BaseModel):
     )
 
 
+class BatchMessage(CreateMessageRequest):
+    """A message to create as part of a batch."""
+
+    thread_id: str = Field(description="The ID of the thread to add the message to")
+
+
 class ModifyMessageRequest(BaseModel):
     """Model for modifying an existing message."""
 
@@ -1,17 +1,37 @@
 """OpenAI Message API tools implementation."""
+import json
 import logging
-from typing import Any, Dict, List, Literal, Optional, Union
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Union,
+)
 
+import anyio
 from openai import OpenAI
 from openai.pagination import SyncCursorPage
 from openai.types.beta.threads.message import Message
 from openai.types.beta.threads.message_deleted import MessageDeleted
+from openai.types.beta.threads.text import Text
+from pydantic import BaseModel
 
 from src.config.settings import Settings
+from src.mirror import forget_message, mirrored_message, refresh_mirrored
 
+from ..batch import fetch_many, run_grouped
+from ..models import BatchResult, request_params
+from ..pagination import iter_pages
+from ..paths import export_path
+from ..prefetch import fetch_page, invalidate_pages
 from .models import (
+    BatchMessage,
     CreateMessageRequest,
-    MessageAttachment,
     MessageContent,
     ModifyMessageRequest,
 )
@@ -44,35 +64,73 @@ def create_message(
     """
     logger.info(f"Creating message in thread {thread_id}")
 
-    # Convert raw attachment dicts to MessageAttachment objects if provided
-    message_attachments = None
-    if attachments:
-        message_attachments = [
-            MessageAttachment.model_validate(attachment) for attachment in attachments
-        ]
-
-    # Convert content to proper format if it's a list
-    if isinstance(content, list):
-        # Assuming content is already a list of MessageContent objects
-        # since we updated the type hint
-        pass
-
-    request = CreateMessageRequest(
-        role=role,
-        content=content,
-        attachments=message_attachments,
-        metadata=metadata,
+    request = CreateMessageRequest.model_validate(
+        {
+            "role": role,
+            "content": content,
+            "attachments": attachments,
+            "metadata": metadata,
+        }
     )
+    return create_message_from(thread_id, request)
+
+
+def create_message_from(thread_id: str, request: BaseModel) -> Message:
+    """
+    Create a message from an already validated request.
+
+    Only the fields of CreateMessageRequest are sent, so batch items and thread
+    messages can be passed without copying them into a new request.
+
+    Args:
+        thread_id: (REQUIRED) The ID of the thread to create a message for
+        request: (REQUIRED) Validated message, e.g. a CreateMessageRequest
 
-    request_data = request.model_dump(exclude_none=True)
+    Returns:
+        MessageObject: The created message
+    """
+    request_data = {
+        name: value
+        for name, value in request_params(request).items()
+        if name in CreateMessageRequest.model_fields
+    }
     logger.info(f"Creating message with request data: {request_data}")
 
     response = client.beta.threads.messages.create(thread_id=thread_id, **request_data)
+    invalidate_pages("messages", thread_id)
     logger.info(f"Got response from OpenAI: {response}")
 
     return response
 
 
+def batch_create_messages(
+    messages: List[BatchMessage],
+    max_concurrency: Optional[int] = None,
+) -> BatchResult:
+    """
+    Create many messages across one or more threads.
+
+    Messages for the same thread are created one after another in the given
+    order; different threads are written concurrently. After a failure the
+    remaining messages of that thread are skipped.
+
+    Args:
+        messages: (REQUIRED) Messages to create, each with its thread_id
+        max_concurrency: Threads written at once (default BATCH_MAX_CONCURRENCY)
+
+    Returns:
+        BatchResult with the created Message or error for every item
+    """
+    logger.info(f"Creating {len(messages)} messages in batch")
+
+    return run_grouped(
+        messages,
+        group=lambda message: message.thread_id,
+        action=lambda message: create_message_from(message.thread_id, message),
+        max_concurrency=max_concurrency,
+    )
+
+
 def list_messages(
     thread_id: str,
     limit: Optional[int] = None,
@@ -107,10 +165,202 @@ def list_messages(
     # Remove None values
     params = {k: v for k, v in params.items() if v is not None}
 
-    response = client.beta.threads.messages.list(thread_id=thread_id, **params)
+    response = fetch_page(
+        "messages",
+        thread_id,
+        params,
+        lambda **page_params: client.beta.threads.messages.list(
+            thread_id=thread_id, **page_params
+        ),
+    )
     return response
 
 
+def list_messages_raw(
+    thread_id: str,
+    limit: Optional[int] = None,
+    order: Optional[str] = None,
+    after: Optional[str] = None,
+    before: Optional[str] = None,
+    run_id: Optional[str] = None,
+) -> str:
+    """
+    List messages for a thread as the upstream JSON body.
+
+    The response is not parsed into SDK models, which saves parsing and
+    re-encoding large pages. Pages are fetched directly, without prefetch.
+
+    Args:
+        thread_id: (REQUIRED) The ID of the thread to list messages for
+        limit: Limit on number of messages (1-100, default 20)
+        order: Sort order ('asc' or 'desc', default 'desc')
+        after: Cursor for pagination (get messages after this ID)
+        before: Cursor for pagination (get messages before this ID)
+        run_id: Filter for messages from a specific run
+
+    Returns:
+        str: The list response body as returned by the API
+    """
+    logger.info(f"Listing raw messages for thread {thread_id}")
+
+    params: Dict[str, Any] = {
+        "limit": limit,
+        "order": order,
+        "after": after,
+        "before": before,
+        "run_id": run_id,
+    }
+    # Remove None values
+    params = {k: v for k, v in params.items() if v is not None}
+
+    response = client.beta.threads.messages.with_raw_response.list(
+        thread_id=thread_id, **params
+    )
+    return response.text
+
+
+def _cite(text: Text, sources: Dict[str, int]) -> str:
+    """Replace annotation spans in message text with numbered markers."""
+    value = text.value
+    parts: List[str] = []
+    cursor = 0
+    for annotation in sorted(text.annotations, key=lambda a: a.start_index):
+        start, end = annotation.start_index, annotation.end_index
+        if value[start:end] != annotation.text:
+            # Indices can drift from the text; fall back to the span's text
+            start = value.find(annotation.text, cursor)
+        if not annotation.text or start < cursor:
+            continue
+        if annotation.type == "file_citation":
+            file_id = annotation.file_citation.file_id
+        else:
+            file_id = annotation.file_path.file_id
+        number = sources.setdefault(file_id, len(sources) + 1)
+        parts += [value[cursor:start], f"[{number}]"]
+        cursor = start + len(annotation.text)
+    parts.append(value[cursor:])
+    return "".join(parts)
+
+
+def compact_message(message: Message, citations: bool = False) -> Dict[str, Any]:
+    """
+    Reduce a message to the fields needed to read a conversation.
+
+    Text parts are kept as plain strings and other parts are replaced by a
+    short placeholder naming the referenced file or URL.
+
+    Args:
+        message: Message object from OpenAI SDK
+        citations: Replace file citation and file path annotations with [n]
+            markers and list the cited file IDs after the text
+
+    Returns:
+        Dict with id, role, created_at, run_id and content
+    """
+    content: List[str] = []
+    sources: Dict[str, int] = {}
+    for part in message.content:
+        if part.type == "text":
+            content.append(_cite(part.text, sources) if citations else part.text.value)
+        elif part.type == "image_file":
+            content.append(f"[image_file {part.image_file.file_id}]")
+        elif part.type == "image_url":
+            content.append(f"[image_url {part.image_url.url}]")
+        elif part.type == "refusal":
+            content.append(f"[refusal {part.refusal}]")
+    if sources:
+        content.append("")
+        content += [f"[{number}] {file_id}" for file_id, number in sources.items()]
+    return {
+        "id": message.id,
+        "role": message.role,
+        "created_at": message.created_at,
+        "run_id": message.run_id,
+        "content": "\n".join(content),
+    }
+
+
+def iter_message_pages(
+    thread_id: str,
+    order: Literal["asc", "desc"] = "asc",
+    run_id: Optional[str] = None,
+) -> Iterator[SyncCursorPage[Message]]:
+    """
+    Iterate over every page of messages in a thread using the maximum page size.
+
+    Args:
+        thread_id: (REQUIRED) The ID of the thread to list messages for
+        order: Sort order ('asc' or 'desc', default 'asc')
+        run_id: Filter for messages from a specific run
+
+    Yields:
+        SyncCursorPage[Message] pages from OpenAI SDK
+    """
+    yield from iter_pages(
+        list_messages, thread_id=thread_id, order=order, run_id=run_id
+    )
+
+
+async def iter_thread_messages(
+    thread_id: str,
+    order: Literal["asc", "desc"] = "asc",
+    run_id: Optional[str] = None,
+    output_path: Optional[str] = None,
+    on_chunk: Optional[Callable[[List[Dict[str, Any]], int], Awaitable[None]]] = None,
+) -> Dict[str, Any]:
+    """
+    Stream every message of a thread in compact form, one page at a time.
+
+    Each page is converted with compact_message, handed to ``on_chunk`` and
+    optionally appended to a JSONL file, then dropped, so memory use does not
+    grow with the length of the thread.
+
+    Args:
+        thread_id: (REQUIRED) The ID of the thread to read
+        order: Sort order ('asc' or 'desc', default 'asc')
+        run_id: Filter for messages from a specific run
+        output_path: File inside EXPORT_DIR to write one compact message per
+            line to
+        on_chunk: Awaited with each compact page and the running message count
+
+    Returns:
+        Dict with thread_id, messages, pages and the resolved output_path
+
+    Raises:
+        ValueError: If output_path is outside EXPORT_DIR
+    """
+    if output_path is not None:
+        output_path = export_path(output_path)
+    logger.info(f"Streaming messages for thread {thread_id}")
+
+    count = 0
+    pages_read = 0
+    pages = iter_message_pages(thread_id, order=order, run_id=run_id)
+    output = open(output_path, "w", encoding="utf-8") if output_path else None
+    try:
+        while True:
+            page = await anyio.to_thread.run_sync(next, pages, None)
+            if page is None:
+                break
+            chunk = [compact_message(message) for message in page.data]
+            count += len(chunk)
+            pages_read += 1
+            if output is not None:
+                output.writelines(json.dumps(item) + "\n" for item in chunk)
+            if on_chunk is not None:
+                await on_chunk(chunk, count)
+    finally:
+        if output is not None:
+            output.close()
+
+    return {
+        "thread_id": thread_id,
+        "messages": count,
+        "pages": pages_read,
+        "output_path": output_path,
+    }
+
+
 def get_message(thread_id: str, message_id: str) -> Message:
     """
     Get message by ID.
@@ -130,6 +380,35 @@ def get_message(thread_id: str, message_id: str) -> Message:
     return response
 
 
+def get_messages(
+    thread_id: str,
+    message_ids: List[str],
+    max_concurrency: Optional[int] = None,
+) -> BatchResult:
+    """
+    Retrieve many messages by ID.
+
+    Repeated IDs are fetched once, settled messages held in the thread mirror
+    are served locally, and the rest are fetched concurrently.
+
+    Args:
+        thread_id: (REQUIRED) The ID of the thread the messages belong to
+        message_ids: (REQUIRED) The IDs of the messages to retrieve
+        max_concurrency: Requests run at once (default BATCH_MAX_CONCURRENCY)
+
+    Returns:
+        BatchResult with the Message or error for every ID, in request order
+    """
+    logger.info(f"Getting {len(message_ids)} messages from thread {thread_id}")
+
+    return fetch_many(
+        message_ids,
+        fetch=lambda message_id: get_message(thread_id, message_id),
+        cached=lambda message_id: mirrored_message(thread_id, message_id),
+        max_concurrency=max_concurrency,
+    )
+
+
 def modify_message(
     thread_id: str,
     message_id: str,
@@ -153,6 +432,7 @@ def modify_message(
     response = client.beta.threads.messages.update(
         thread_id=thread_id, message_id=message_id, **request
     )
+    refresh_mirrored(thread_id, response)
     return response
 
 
@@ -172,4 +452,30 @@ def delete_message(thread_id: str, message_id: str) -> MessageDeleted:
     response = client.beta.threads.messages.delete(
         thread_id=thread_id, message_id=message_id
     )
+    forget_message(thread_id, message_id)
+    invalidate_pages("messages", thread_id)
     return response
+
+
+def delete_messages(
+    thread_id: str, message_ids: List[str], max_concurrency: Optional[int] = None
+) -> BatchResult:
+    """
+    Delete many messages of a thread concurrently.
+
+    Args:
+        thread_id: (REQUIRED) The ID of the thread the messages belong to
+        message_ids: (REQUIRED) The IDs of the messages to delete
+        max_concurrency: Deletions run at once (default BATCH_MAX_CONCURRENCY)
+
+    Returns:
+        BatchResult with the MessageDeleted status or error for every ID
+    """
+    logger.info(f"Deleting {len(message_ids)} messages from thread {thread_id}")
+
+    return run_grouped(
+        message_ids,
+        group=lambda message_id: message_id,
+        action=lambda message_id: delete_message(thread_id, message_id),
+        max_concurrency=max_concurrency,
+    )
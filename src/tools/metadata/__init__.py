@@ -0,0 +1,13 @@
+"""Bulk metadata tools module for MCP server."""
+
+from .models import MetadataTarget
+from .tools import merge_metadata, patch_metadata, validate_metadata
+
+__all__ = [
+    # Tools
+    "merge_metadata",
+    "patch_metadata",
+    "validate_metadata",
+    # Models
+    "MetadataTarget",
+]
@@ -0,0 +1,22 @@
+"""Pydantic models for bulk metadata updates."""
+
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+# Limits the API enforces on metadata
+METADATA_MAX_PAIRS = 16
+METADATA_MAX_KEY_LENGTH = 64
+METADATA_MAX_VALUE_LENGTH = 512
+
+
+class MetadataTarget(BaseModel):
+    """An object whose metadata should be patched."""
+
+    thread_id: str = Field(
+        description="The ID of the thread, or of the thread the object belongs to"
+    )
+    object_id: Optional[str] = Field(
+        default=None,
+        description="The ID of the message or run; omitted when patching threads",
+    )
@@ -0,0 +1,157 @@
+"""Bulk metadata patch tools implementation."""
+import logging
+import time
+from typing import Any, Dict, List, Literal, Mapping, Optional
+
+from src.config.settings import Settings
+from src.metrics import increment
+from src.mirror import mirrored_message, mirrored_run, thread_lock, thread_mirror
+
+from ..batch import run_grouped
+from ..messages import get_message, modify_message
+from ..models import BatchResult
+from ..runs import get_run, modify_run
+from ..threads import get_thread, modify_thread
+from .models import (
+    METADATA_MAX_KEY_LENGTH,
+    METADATA_MAX_PAIRS,
+    METADATA_MAX_VALUE_LENGTH,
+    MetadataTarget,
+)
+
+logger = logging.getLogger(__name__)
+settings = Settings()
+
+ObjectType = Literal["thread", "message", "run"]
+
+
+def validate_metadata(metadata: Mapping[str, Optional[str]]) -> None:
+    """Raise ValueError if metadata breaks the API's key, value or pair limits."""
+    pairs = sum(value is not None for value in metadata.values())
+    if pairs > METADATA_MAX_PAIRS:
+        raise ValueError(
+            f"Metadata has {pairs} pairs, at most {METADATA_MAX_PAIRS} are allowed"
+        )
+    for key, value in metadata.items():
+        if len(key) > METADATA_MAX_KEY_LENGTH:
+            raise ValueError(
+                f"Metadata key {key!r} is longer than "
+                f"{METADATA_MAX_KEY_LENGTH} characters"
+            )
+        if value is not None and len(value) > METADATA_MAX_VALUE_LENGTH:
+            raise ValueError(
+                f"Metadata value for {key!r} is longer than "
+                f"{METADATA_MAX_VALUE_LENGTH} characters"
+            )
+
+
+def merge_metadata(
+    current: Optional[Dict[str, str]], patch: Dict[str, Optional[str]]
+) -> Dict[str, str]:
+    """Apply a patch to metadata; a None value removes the key."""
+    merged = {**(current or {}), **patch}
+    return {key: value for key, value in merged.items() if value is not None}
+
+
+def _mirrored(object_type: ObjectType, thread_id: str, object_id: str) -> Any:
+    """
+    Return a mirrored message or run whose metadata can be merged into.
+
+    Objects that can no longer change are trusted as mirrored; others only if
+    the thread was synced within THREAD_MIRROR_MAX_AGE_SECONDS.
+    """
+    finished: Any
+    if object_type == "message":
+        finished = mirrored_message(thread_id, object_id)
+    else:
+        finished = mirrored_run(thread_id, object_id)
+    if finished is not None:
+        return finished
+    with thread_lock(thread_id):
+        transcript = thread_mirror.peek(thread_id)
+        if (
+            transcript is None
+            or transcript.synced_at is None
+            or time.time() - transcript.synced_at
+            > settings.THREAD_MIRROR_MAX_AGE_SECONDS
+        ):
+            return None
+        if object_type == "message":
+            return transcript.messages.get(object_id)
+        return transcript.runs.get(object_id)
+
+
+def _current(object_type: ObjectType, target: MetadataTarget) -> Any:
+    """Return the object from the thread mirror when trusted, or fetch it."""
+    if object_type == "thread":
+        return get_thread(target.thread_id)
+    object_id = target.object_id or ""
+    mirrored = _mirrored(object_type, target.thread_id, object_id)
+    if mirrored is not None:
+        return mirrored
+    if object_type == "message":
+        return get_message(target.thread_id, object_id)
+    return get_run(target.thread_id, object_id)
+
+
+def _apply(
+    object_type: ObjectType, target: MetadataTarget, metadata: Dict[str, str]
+) -> Any:
+    """Send the merged metadata for one target."""
+    if object_type == "thread":
+        return modify_thread(target.thread_id, metadata=metadata)
+    object_id = target.object_id or ""
+    if object_type == "message":
+        return modify_message(target.thread_id, object_id, metadata=metadata)
+    return modify_run(target.thread_id, object_id, metadata=metadata)
+
+
+def patch_metadata(
+    object_type: ObjectType,
+    targets: List[MetadataTarget],
+    metadata: Dict[str, Optional[str]],
+    max_concurrency: Optional[int] = None,
+) -> BatchResult:
+    """
+    Merge a metadata patch into many threads, messages or runs.
+
+    The patch is merged client-side into each object's current metadata. A
+    mirrored copy is used for messages and runs that can no longer change or
+    whose thread was synced within THREAD_MIRROR_MAX_AGE_SECONDS; anything
+    else is fetched first. Limits are
+    checked before any request is sent, objects the patch would not change
+    are left alone, and updates run concurrently.
+
+    Args:
+        object_type: (REQUIRED) 'thread', 'message' or 'run'
+        targets: (REQUIRED) Objects to patch; object_id is required for
+            messages and runs
+        metadata: (REQUIRED) Keys to set; a None value removes the key
+        max_concurrency: Updates run at once (default BATCH_MAX_CONCURRENCY)
+
+    Returns:
+        BatchResult with the updated object or error for every target
+    """
+    logger.info(f"Patching metadata of {len(targets)} {object_type}s")
+
+    validate_metadata(metadata)
+    if object_type != "thread":
+        missing = [i for i, target in enumerate(targets) if not target.object_id]
+        if missing:
+            raise ValueError(f"object_id is required for {object_type}s: {missing}")
+
+    def patch(target: MetadataTarget) -> Any:
+        current = _current(object_type, target)
+        merged = merge_metadata(current.metadata, metadata)
+        if merged == (current.metadata or {}):
+            increment("metadata_patch.calls_skipped")
+            return current
+        validate_metadata(merged)
+        return _apply(object_type, target, merged)
+
+    return run_grouped(
+        targets,
+        group=lambda target: target.object_id or target.thread_id,
+        action=patch,
+        max_concurrency=max_concurrency,
+    )
@@ -4,9 +4,9 @@ This module provides common models used by multiple OpenAI API tools,
 such as metadata, tool resources, and common tools.
 """
 
-from typing import Dict, List, Literal, Optional, Union
+from typing import Annotated, Any, Dict, List, Literal, Optional, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 # Metadata type
 MetadataKey = str
@@ -181,12 +181,92 @@ class JsonSchemaResponseFormat(BaseModel):
     )
 
 
+# Unions are discriminated by type so a value is checked against one member only
 ResponseFormat = Union[
     Literal["auto"],
-    TextResponseFormat,
-    JsonObjectResponseFormat,
-    JsonSchemaResponseFormat,
+    Annotated[
+        Union[TextResponseFormat, JsonObjectResponseFormat, JsonSchemaResponseFormat],
+        Field(discriminator="type"),
+    ],
 ]
 
 
-Tool = Union[CodeInterpreterTool, AssistantFileSearchTool, FunctionTool]
+Tool = Annotated[
+    Union[CodeInterpreterTool, AssistantFileSearchTool, FunctionTool],
+    Field(discriminator="type"),
+]
+
+# Validator for response formats passed to tools as plain dicts, built once
+response_format_adapter: TypeAdapter[ResponseFormat] = TypeAdapter(ResponseFormat)
+
+
+# Batch results
+class BatchItemResult(BaseModel):
+    """Outcome of one item of a batch operation."""
+
+    index: int = Field(description="Position of the item in the request")
+    group: str = Field(description="Key the item was ordered by, e.g. the thread ID")
+    status: Literal["succeeded", "failed", "skipped"] = Field(
+        description="succeeded, failed, or skipped because an earlier item "
+        "in the same group failed"
+    )
+    result: Optional[Any] = Field(
+        default=None, description="The object returned for a succeeded item"
+    )
+    error: Optional[str] = Field(
+        default=None, description="Error message for a failed or skipped item"
+    )
+
+
+class BatchResult(BaseModel):
+    """Per-item results and totals of a batch operation."""
+
+    succeeded: int = Field(description="Number of items that succeeded")
+    failed: int = Field(description="Number of items that failed")
+    skipped: int = Field(description="Number of items that were not attempted")
+    items: List[BatchItemResult] = Field(
+        description="Results in the same order as the request"
+    )
+
+
+# Request building
+def _without_none(value: Any) -> Any:
+    """Return ``value`` with None dropped from nested models, lists and dicts."""
+    if isinstance(value, BaseModel):
+        fields = {
+            name: _without_none(getattr(value, name))
+            for name in value.model_fields_set
+            if getattr(value, name) is not None
+        }
+        return type(value).model_construct(_fields_set=set(fields), **fields)
+    if isinstance(value, list):
+        return [_without_none(item) for item in value]
+    if isinstance(value, dict):
+        return {
+            key: _without_none(item) for key, item in value.items() if item is not None
+        }
+    return value
+
+
+def request_params(request: BaseModel) -> Dict[str, Any]:
+    """
+    Return the fields set on a validated request as SDK keyword arguments.
+
+    Nested models are passed as they are: the SDK serializes a model in one
+    pass when building the HTTP body, whereas a dumped dict would be walked
+    again against the SDK's parameter types. The SDK keeps every field that
+    was set, so nested fields set to None are dropped first rather than sent
+    as explicit nulls.
+
+    Args:
+        request: Validated request model
+
+    Returns:
+        Dict of the fields that were set and are not None
+    """
+    params = {}
+    for name in request.model_fields_set:
+        value = getattr(request, name)
+        if value is not None:
+            params[name] = _without_none(value)
+    return params
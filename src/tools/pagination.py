@@ -0,0 +1,45 @@
+"""Cursor pagination over the list endpoints.
+
+Listings are walked with the ``after`` cursor set to the last ID of the
+previous page, at the largest page size the API accepts.
+"""
+
+from typing import Any, Callable, Iterator, Optional
+
+from openai.pagination import SyncCursorPage
+
+# Maximum page size accepted by the list endpoints
+LIST_PAGE_LIMIT = 100
+
+PageLister = Callable[..., SyncCursorPage[Any]]
+
+
+def iter_pages(
+    list_fn: PageLister, after: Optional[str] = None, **params: Any
+) -> Iterator[SyncCursorPage[Any]]:
+    """
+    Iterate over every page of a listing using the maximum page size.
+
+    Args:
+        list_fn: (REQUIRED) List tool accepting ``limit``, ``after`` and
+            ``params``, e.g. list_messages
+        after: Cursor to start after (default the start of the listing)
+        **params: Other list parameters, e.g. thread_id and order
+
+    Yields:
+        SyncCursorPage pages from OpenAI SDK
+    """
+    while True:
+        page = list_fn(limit=LIST_PAGE_LIMIT, after=after, **params)
+        yield page
+        if not page.has_more or not page.data:
+            return
+        after = page.data[-1].id
+
+
+def iter_items(
+    list_fn: PageLister, after: Optional[str] = None, **params: Any
+) -> Iterator[Any]:
+    """Yield every object of a listing page by page, see ``iter_pages``."""
+    for page in iter_pages(list_fn, after, **params):
+        yield from page.data
@@ -0,0 +1,60 @@
+"""Confinement of files written by tools to the export directory.
+
+Output paths come from MCP callers, so they are resolved inside EXPORT_DIR
+and rejected if they would land anywhere else, e.g. through '..' or a symlink.
+"""
+
+import os
+import re
+
+from src.config.settings import Settings
+
+settings = Settings()
+
+# IDs the API hands out, such as thread_abc123
+_OBJECT_ID = re.compile(r"^[A-Za-z0-9_-]+$")
+
+
+def check_object_id(object_id: str) -> str:
+    """
+    Check that an object ID is safe to use as a file name.
+
+    Args:
+        object_id: (REQUIRED) ID of an API object, e.g. a thread ID
+
+    Returns:
+        ``object_id`` unchanged
+
+    Raises:
+        ValueError: If the ID contains anything but letters, digits, _ and -
+    """
+    if not _OBJECT_ID.match(object_id):
+        raise ValueError(f"Invalid object ID: {object_id!r}")
+    return object_id
+
+
+def export_path(path: str, directory: bool = False) -> str:
+    """
+    Resolve a caller-supplied output path inside EXPORT_DIR.
+
+    Relative paths are taken relative to EXPORT_DIR; absolute paths must
+    already point inside it. Missing directories are created.
+
+    Args:
+        path: (REQUIRED) Output file or directory requested by the caller
+        directory: Whether ``path`` is a directory, which may be EXPORT_DIR itself
+
+    Returns:
+        The resolved absolute path
+
+    Raises:
+        ValueError: If the path resolves outside EXPORT_DIR
+    """
+    root = os.path.realpath(settings.EXPORT_DIR)
+    resolved = os.path.realpath(os.path.join(root, path))
+    if os.path.commonpath([root, resolved]) != root or (
+        resolved == root and not directory
+    ):
+        raise ValueError(f"Output path {path!r} is outside the export directory {root}")
+    os.makedirs(resolved if directory else os.path.dirname(resolved), exist_ok=True)
+    return resolved
@@ -0,0 +1,151 @@
+"""Background prefetch of the next page for cursor-paginated list tools.
+
+When a list page has more results, the page after it is fetched in a worker
+thread and held briefly. A follow-up call with ``after`` set to the last ID of
+the previous page is then served from memory. Held pages are single-use and
+bounded by count, bytes and age.
+"""
+
+import json
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from openai.pagination import SyncCursorPage
+
+from src.cache import TTLCache, register_cache
+from src.config.settings import Settings
+from src.metrics import increment
+
+logger = logging.getLogger(__name__)
+settings = Settings()
+
+prefetch_cache: TTLCache[SyncCursorPage] = register_cache(
+    "list_prefetch",
+    max_entries=settings.LIST_PREFETCH_MAX_PAGES,
+    ttl_seconds=settings.LIST_PREFETCH_TTL_SECONDS,
+    max_bytes=settings.LIST_PREFETCH_MAX_BYTES,
+    enabled=settings.LIST_PREFETCH_ENABLED,
+)
+
+_executor = ThreadPoolExecutor(
+    max_workers=settings.LIST_PREFETCH_WORKERS, thread_name_prefix="list-prefetch"
+)
+_inflight: Dict[str, Future] = {}
+# Bumped by invalidate_pages so pages fetched before a change are discarded
+_generations: Dict[str, int] = {}
+_lock = threading.Lock()
+
+PageFetcher = Callable[..., SyncCursorPage]
+
+
+def _scope_prefix(kind: str, scope: str) -> str:
+    """Return the key prefix shared by all pages of one listing."""
+    return f"{kind}:{scope}:"
+
+
+def _page_key(kind: str, scope: str, params: Dict[str, Any]) -> str:
+    """Build the key for a page; the scope prefix allows per-thread invalidation."""
+    return _scope_prefix(kind, scope) + json.dumps(params, sort_keys=True, default=str)
+
+
+def _take(key: str) -> Optional[SyncCursorPage]:
+    """Return and drop a prefetched page, waiting for it if still in flight."""
+    if not prefetch_cache.enabled:
+        return None
+    with _lock:
+        future = _inflight.pop(key, None)
+    if future is not None:
+        try:
+            future.result()
+        except Exception as e:
+            logger.warning(f"Prefetch of {key} failed: {e}")
+            return None
+    page = prefetch_cache.pop(key) if key in prefetch_cache else None
+    if page is not None:
+        increment("list_prefetch.hits")
+    return page
+
+
+def _fetch_into_cache(
+    key: str, prefix: str, generation: int, fetch: PageFetcher, params: Dict[str, Any]
+) -> None:
+    """Fetch a page in the background and hold it for a follow-up call."""
+    page = fetch(**params)
+    with _lock:
+        if _generations.get(prefix, 0) != generation:
+            increment("list_prefetch.discarded")
+            return
+        prefetch_cache.set(key, page)
+
+
+def _schedule_next(
+    kind: str,
+    scope: str,
+    params: Dict[str, Any],
+    page: SyncCursorPage,
+    fetch: PageFetcher,
+) -> None:
+    """Start fetching the page after ``page`` if there is one."""
+    if not prefetch_cache.enabled or not page.has_more or not page.data:
+        return
+    if params.get("before") is not None:
+        return
+    next_params = {**params, "after": page.data[-1].id}
+    prefix = _scope_prefix(kind, scope)
+    key = _page_key(kind, scope, next_params)
+    with _lock:
+        for done_key in [k for k, f in _inflight.items() if f.done()]:
+            del _inflight[done_key]
+        if key in _inflight or len(_inflight) >= prefetch_cache.max_entries:
+            return
+        _inflight[key] = _executor.submit(
+            _fetch_into_cache,
+            key,
+            prefix,
+            _generations.get(prefix, 0),
+            fetch,
+            next_params,
+        )
+
+
+def invalidate_pages(kind: str, scope: str) -> int:
+    """
+    Drop held pages of one listing after its contents changed.
+
+    Pages still being fetched are forgotten as well and discarded when their
+    fetch finishes, since they may predate the change.
+    """
+    prefix = _scope_prefix(kind, scope)
+    with _lock:
+        _generations[prefix] = _generations.get(prefix, 0) + 1
+        for key in [k for k in _inflight if k.startswith(prefix)]:
+            _inflight.pop(key).cancel()
+    return prefetch_cache.invalidate_prefix(prefix)
+
+
+def fetch_page(
+    kind: str,
+    scope: str,
+    params: Dict[str, Any],
+    fetch: PageFetcher,
+) -> SyncCursorPage:
+    """
+    Fetch a list page, using a prefetched copy when one is held.
+
+    Args:
+        kind: Object type being listed, e.g. 'messages'
+        scope: Parent object ID (thread or run) the listing belongs to
+        params: List parameters without None values
+        fetch: Callable performing the API request with ``params``
+
+    Returns:
+        SyncCursorPage from OpenAI SDK
+    """
+    key = _page_key(kind, scope, params)
+    page = _take(key)
+    if page is None:
+        page = fetch(**params)
+    _schedule_next(kind, scope, params, page, fetch)
+    return page
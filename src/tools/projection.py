@@ -0,0 +1,187 @@
+"""Field projection and compaction of tool results.
+
+Get and list tools accept a ``fields`` list such as ``["id", "status",
+"usage.total_tokens"]``. Only the top-level fields named are serialized from
+SDK models; dotted paths then narrow nested objects, and lists are projected
+item by item. List pages keep ``has_more`` and batch results keep their
+per-item status so pagination and error handling still work.
+
+Compact mode serializes SDK objects without null fields, fields left at their
+default and empty lists or dicts. It is on for every tool when
+``COMPACT_RESPONSES`` is set and can be chosen per call on get and list tools.
+
+Raw list bodies are shaped as plain JSON, without building SDK models.
+"""
+
+import json
+from typing import Any, Callable, Dict, List, Optional, TypeVar, Union, cast
+
+from openai.pagination import SyncCursorPage
+from pydantic import BaseModel
+
+from src.config.settings import Settings
+
+from .models import BatchResult
+
+settings = Settings()
+
+FieldTree = Dict[str, Union["FieldTree", bool]]
+
+T = TypeVar("T")
+# What shape returns for a value of type T: T itself, or its JSON-ready dict
+Shaped = Union[T, Dict[str, Any]]
+
+
+def field_tree(fields: List[str]) -> FieldTree:
+    """Turn dotted field paths into a nested tree; True keeps a whole subtree."""
+    tree: FieldTree = {}
+    for path in fields:
+        node = tree
+        *parents, leaf = path.split(".")
+        for name in parents:
+            child = node.get(name)
+            if child is True:
+                break
+            if child is None:
+                child = node[name] = {}
+            node = child  # type: ignore[assignment]
+        else:
+            node[leaf] = True
+    return tree
+
+
+def _prune(value: Any, tree: Union[FieldTree, bool]) -> Any:
+    """Keep only the branches of ``value`` named in ``tree``."""
+    if tree is True:
+        return value
+    if isinstance(value, list):
+        return [_prune(item, tree) for item in value]
+    if isinstance(value, dict):
+        return {
+            name: _prune(value[name], subtree)
+            for name, subtree in tree.items()  # type: ignore[union-attr]
+            if name in value
+        }
+    return value
+
+
+def _strip_empty(value: Any) -> Any:
+    """Drop None values and empty lists or dicts from nested dicts."""
+    if isinstance(value, dict):
+        stripped = {}
+        for name, item in value.items():
+            item = _strip_empty(item)
+            if item is not None and item != [] and item != {}:
+                stripped[name] = item
+        return stripped
+    if isinstance(value, list):
+        return [_strip_empty(item) for item in value]
+    return value
+
+
+def _project_object(value: Any, tree: FieldTree) -> Any:
+    """Project a single SDK object or plain dict."""
+    if isinstance(value, BaseModel):
+        value = value.model_dump(mode="json", include=set(tree))
+    return _prune(value, tree)
+
+
+def _compact_object(value: Any) -> Any:
+    """Serialize a single SDK object or plain dict without nulls and empties."""
+    if isinstance(value, BaseModel):
+        value = value.model_dump(mode="json", exclude_none=True, exclude_defaults=True)
+    return _strip_empty(value)
+
+
+def _map_objects(value: Any, convert: Callable[[Any], Any]) -> Any:
+    """Apply ``convert`` to each API object held by a tool result."""
+    if isinstance(value, SyncCursorPage):
+        return {
+            "data": [convert(item) for item in value.data],
+            "has_more": value.has_more,
+        }
+    if isinstance(value, BatchResult):
+        dumped = value.model_dump(
+            mode="json", exclude={"items": {"__all__": {"result"}}}
+        )
+        for item, result in zip(dumped["items"], value.items):
+            item["result"] = convert(result.result)
+        return dumped
+    if isinstance(value, dict) and isinstance(value.get("data"), list):
+        return {**value, "data": [convert(item) for item in value["data"]]}
+    return convert(value)
+
+
+def project(value: Any, fields: Optional[List[str]]) -> Any:
+    """
+    Project a tool result onto ``fields``.
+
+    Args:
+        value: SDK object, list page, BatchResult or plain dict
+        fields: Field paths to keep; None or empty returns ``value`` unchanged
+
+    Returns:
+        ``value`` itself, or a JSON-ready dict holding only the requested fields
+    """
+    if not fields:
+        return value
+    tree = field_tree(fields)
+    return _map_objects(value, lambda item: _project_object(item, tree))
+
+
+def shape(
+    value: T,
+    fields: Optional[List[str]] = None,
+    compact: Optional[bool] = None,
+) -> Shaped[T]:
+    """
+    Project and optionally compact a tool result before it is serialized.
+
+    Args:
+        value: SDK object, list page, BatchResult or plain dict
+        fields: Field paths to keep (default all fields)
+        compact: Drop nulls, defaults and empty collections
+            (default COMPACT_RESPONSES)
+
+    Returns:
+        ``value`` itself when nothing is requested, otherwise a JSON-ready dict
+    """
+    if compact is None:
+        compact = settings.COMPACT_RESPONSES
+    if not compact:
+        return cast(Shaped[T], project(value, fields))
+    if value is None or isinstance(value, (str, bytes)):
+        return value
+    if fields:
+        tree = field_tree(fields)
+        shaped = _map_objects(
+            value, lambda item: _strip_empty(_project_object(item, tree))
+        )
+    else:
+        shaped = _map_objects(value, _compact_object)
+    if isinstance(value, BatchResult):
+        shaped = _strip_empty(shaped)
+    return cast(Shaped[T], shaped)
+
+
+def shape_json(
+    body: str,
+    fields: Optional[List[str]] = None,
+    compact: Optional[bool] = None,
+) -> str:
+    """
+    Project and optionally compact a raw JSON response body.
+
+    Args:
+        body: Response body as returned by the API
+        fields: Field paths to keep (default all fields)
+        compact: Drop nulls and empty collections (default COMPACT_RESPONSES)
+
+    Returns:
+        ``body`` itself when nothing is requested, otherwise the shaped JSON
+    """
+    if compact is None:
+        compact = settings.COMPACT_RESPONSES
+    if not fields and not compact:
+        return body
+    return json.dumps(shape(json.loads(body), fields, compact))
@@ -19,12 +19,14 @@ from .models import (
     ToolCallFunction,
     ToolCallsStepDetails,
 )
-from .tools import get_run_step, list_run_steps
+from .tools import get_run_step, list_run_steps, run_step_content_cache
 
 __all__ = [
     # Tools
     "get_run_step",
     "list_run_steps",
+    # Cache
+    "run_step_content_cache",
     # Models
     "MessageCreationStepDetails",
     "ToolCallFunction",
@@ -1,18 +1,80 @@
 """OpenAI Run Steps API tools implementation."""
 import logging
-from typing import List, Literal, Optional
+import zlib
+from typing import Any, Dict, List, Literal, Optional
 
 from openai import NOT_GIVEN, OpenAI
 from openai.pagination import SyncCursorPage
 from openai.types.beta.threads.runs import RunStepInclude
 from openai.types.beta.threads.runs.run_step import RunStep
 
+from src.cache import TTLCache, register_cache
 from src.config.settings import Settings
 
+from ..prefetch import fetch_page
+
 logger = logging.getLogger(__name__)
 settings = Settings()
 client = OpenAI(api_key=settings.OPENAI_API_KEY)
 
+FILE_SEARCH_CONTENT_INCLUDE: RunStepInclude = (
+    "step_details.tool_calls[*].file_search.results[*].content"
+)
+TERMINAL_STEP_STATUSES = ("completed", "failed", "cancelled", "expired")
+
+# Run steps fetched with file_search result content, stored zlib-compressed.
+# Only terminal steps are cached since their content can no longer change.
+run_step_content_cache: TTLCache[bytes] = register_cache(
+    "run_step_content",
+    max_entries=100_000,
+    ttl_seconds=settings.RUN_STEP_CONTENT_CACHE_TTL_SECONDS,
+    max_bytes=settings.RUN_STEP_CONTENT_CACHE_MAX_BYTES,
+    enabled=settings.CACHE_ENABLED,
+)
+
+# IDs of runs with steps in the content cache, so runs with nothing cached are
+# listed with content straight away
+run_step_content_runs: TTLCache[bool] = register_cache(
+    "run_step_content_runs",
+    max_entries=10_000,
+    ttl_seconds=settings.RUN_STEP_CONTENT_CACHE_TTL_SECONDS,
+    enabled=settings.CACHE_ENABLED,
+)
+
+
+def _has_file_search(step: RunStep) -> bool:
+    """Check whether a run step contains file_search tool calls."""
+    details = step.step_details
+    return details.type == "tool_calls" and any(
+        tool_call.type == "file_search" for tool_call in details.tool_calls
+    )
+
+
+def _wants_content(include: Optional[List[RunStepInclude]]) -> bool:
+    """Check whether file_search result content was requested."""
+    return (
+        run_step_content_cache.enabled
+        and include is not None
+        and FILE_SEARCH_CONTENT_INCLUDE in include
+    )
+
+
+def _cache_step_content(step: RunStep) -> None:
+    """Compress and cache a terminal run step that has file_search results."""
+    if step.status in TERMINAL_STEP_STATUSES and _has_file_search(step):
+        run_step_content_cache.set(
+            step.id, zlib.compress(step.model_dump_json().encode("utf-8"))
+        )
+        run_step_content_runs.set(step.run_id, True)
+
+
+def _cached_step_content(step_id: str) -> Optional[RunStep]:
+    """Return a cached run step with file_search content, if present."""
+    compressed = run_step_content_cache.get(step_id)
+    if compressed is None:
+        return None
+    return RunStep.model_validate_json(zlib.decompress(compressed))
+
 
 def list_run_steps(
     thread_id: str,
@@ -26,6 +88,11 @@ def list_run_steps(
     """
     List run steps for a run.
 
+    When file_search content is requested, caching is enabled and steps of
+    this run are already cached, steps are listed without content and filled
+    from the content cache; if any file_search step on the page is not cached
+    yet, the page is listed once more with content instead.
+
     Args:
         thread_id: (REQUIRED) The ID of the thread the run belongs to
         run_id: (REQUIRED) The ID of the run to list steps for
@@ -42,18 +109,103 @@ def list_run_steps(
     """
     logger.info(f"Listing run steps for run {run_id} in thread {thread_id}")
 
-    response = client.beta.threads.runs.steps.list(
+    if _wants_content(include):
+        cached_page = _list_run_steps_from_content_cache(
+            thread_id, run_id, limit, order, after, before
+        )
+        if cached_page is not None:
+            return cached_page
+
+    params = {
+        "limit": limit,
+        "order": order,
+        "after": after,
+        "before": before,
+        "include": include,
+    }
+    # Remove None values
+    params = {k: v for k, v in params.items() if v is not None}
+
+    response = _fetch_steps_page(thread_id, run_id, params)
+    logger.info(f"Got response from OpenAI: {response}")
+
+    if _wants_content(include):
+        for step in response.data:
+            _cache_step_content(step)
+    return response
+
+
+def _fetch_steps_page(
+    thread_id: str, run_id: str, params: Dict[str, Any]
+) -> SyncCursorPage[RunStep]:
+    """Fetch one page of run steps through the page cache."""
+    return fetch_page(
+        "run_steps",
+        run_id,
+        params,
+        lambda **page_params: _list_steps_page(thread_id, run_id, **page_params),
+    )
+
+
+def _list_steps_page(
+    thread_id: str, run_id: str, **params: Any
+) -> SyncCursorPage[RunStep]:
+    """Request one page of run steps, leaving unset parameters NOT_GIVEN."""
+    return client.beta.threads.runs.steps.list(
         thread_id=thread_id,
         run_id=run_id,
-        limit=limit if limit is not None else NOT_GIVEN,
-        order=order if order is not None else NOT_GIVEN,
-        after=after if after is not None else NOT_GIVEN,
-        before=before if before is not None else NOT_GIVEN,
-        include=include if include is not None else NOT_GIVEN,
+        limit=params.get("limit", NOT_GIVEN),
+        order=params.get("order", NOT_GIVEN),
+        after=params.get("after", NOT_GIVEN),
+        before=params.get("before", NOT_GIVEN),
+        include=params.get("include", NOT_GIVEN),
     )
-    logger.info(f"Got response from OpenAI: {response}")
 
-    return response
+
+def _list_run_steps_from_content_cache(
+    thread_id: str,
+    run_id: str,
+    limit: Optional[int],
+    order: Optional[Literal["asc", "desc"]],
+    after: Optional[str],
+    before: Optional[str],
+) -> Optional[SyncCursorPage[RunStep]]:
+    """
+    List run steps without content and fill file_search steps from the cache.
+
+    If any file_search step is missing from the cache, the page is listed
+    again with content in a single request and its steps are cached.
+
+    Returns:
+        The page with content, or None if no step of the run is cached and the
+        page should be listed with content instead
+    """
+    if run_step_content_runs.get(run_id) is None:
+        return None
+    params: Dict[str, Any] = {
+        "limit": limit,
+        "order": order,
+        "after": after,
+        "before": before,
+    }
+    params = {k: v for k, v in params.items() if v is not None}
+    page = _fetch_steps_page(thread_id, run_id, params)
+    filled: List[RunStep] = []
+    for step in page.data:
+        if not _has_file_search(step):
+            filled.append(step)
+            continue
+        cached = _cached_step_content(step.id)
+        if cached is None:
+            logger.info(f"Run {run_id} has uncached steps, listing with content")
+            params["include"] = [FILE_SEARCH_CONTENT_INCLUDE]
+            page = _fetch_steps_page(thread_id, run_id, params)
+            for full_step in page.data:
+                _cache_step_content(full_step)
+            return page
+        filled.append(cached)
+    page.data = filled
+    return page
 
 
 def get_run_step(
@@ -78,6 +230,11 @@ def get_run_step(
     """
     logger.info(f"Getting run step {step_id} from run {run_id} in thread {thread_id}")
 
+    if _wants_content(include):
+        cached = _cached_step_content(step_id)
+        if cached is not None:
+            return cached
+
     response = client.beta.threads.runs.steps.retrieve(
         thread_id=thread_id,
         run_id=run_id,
@@ -86,4 +243,6 @@ def get_run_step(
     )
     logger.info(f"Got response from OpenAI: {response}")
 
+    if _wants_content(include):
+        _cache_step_content(response)
     return response
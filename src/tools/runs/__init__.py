@@ -9,6 +9,7 @@ from .models import (
     RunLastError,
     RunListResponse,
     RunObject,
+    RunTool,
     RunUsage,
     SubmitToolOutputs,
     ToolCall,
@@ -20,8 +21,11 @@ from .tools import (
     cancel_run,
     create_run,
     create_thread_and_run,
+    fan_out_runs,
     get_run,
+    get_runs,
     list_runs,
+    list_runs_raw,
     modify_run,
     submit_tool_outputs,
 )
@@ -31,8 +35,11 @@ __all__ = [
     "cancel_run",
     "create_run",
     "create_thread_and_run",
+    "fan_out_runs",
     "get_run",
+    "get_runs",
     "list_runs",
+    "list_runs_raw",
     "modify_run",
     "submit_tool_outputs",
     # Models
@@ -47,4 +54,5 @@ __all__ = [
     "TruncationStrategy",
     "RunUsage",
     "RunObject",
+    "RunTool",
 ]
@@ -4,9 +4,9 @@ This module provides type-safe models for interacting with the OpenAI Run API,
 including models for run status, errors, and run-specific operations.
 """
 
-from typing import List, Literal, Optional, Union
+from typing import Annotated, List, Literal, Optional, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 from ..models import (
     CodeInterpreterTool,
@@ -16,6 +16,14 @@ from ..models import (
     ResponseFormat,
 )
 
+RunTool = Annotated[
+    Union[CodeInterpreterTool, FileSearchTool, FunctionTool],
+    Field(discriminator="type"),
+]
+
+# Validator for run tools passed as models or plain dicts, built once per process
+run_tools_adapter: TypeAdapter[List[RunTool]] = TypeAdapter(List[RunTool])
+
 
 class RunIncompleteDetails(BaseModel):
     """Model for incomplete run details."""
@@ -171,7 +179,7 @@ class RunObject(BaseModel):
         default=None,
         description="The instructions that the assistant used for this run",
     )
-    tools: List[Union[CodeInterpreterTool, FileSearchTool, FunctionTool]] = Field(
+    tools: List[RunTool] = Field(
         description="The list of tools that the assistant used for this run"
     )
     file_ids: List[str] = Field(
@@ -209,7 +217,7 @@ class RunObject(BaseModel):
         description="The nucleus sampling value used for this run. "
         "Defaults to 1 if not set",
     )
-    response_format: Optional[Union[Literal["auto"], ResponseFormat]] = Field(
+    response_format: Optional[ResponseFormat] = Field(
         default="auto",
         description="Specifies the format that the model must output",
     )
@@ -1,20 +1,38 @@
 """OpenAI Run API tools implementation."""
 import logging
-from typing import Any, Dict, List, Literal, Optional, Union
+import time
+from collections import Counter
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, List, Literal, Optional, Tuple, Union
 
+import anyio
 from openai import OpenAI
 from openai.pagination import SyncCursorPage
 from openai.types.beta.threads.run import Run
 
 from src.config.settings import Settings
+from src.mirror import mirrored_run, refresh_mirrored
 
-from ..models import CodeInterpreterTool, FileSearchTool, FunctionTool, ResponseFormat
-from .models import ToolChoice, TruncationStrategy
+from ..batch import fetch_many
+from ..models import BatchResult, ResponseFormat, response_format_adapter
+from ..prefetch import fetch_page, invalidate_pages
+from .models import RunTool, ToolChoice, TruncationStrategy, run_tools_adapter
 
 logger = logging.getLogger(__name__)
 settings = Settings()
 client = OpenAI(api_key=settings.OPENAI_API_KEY)
 
+# Statuses after which a fan-out stops polling a run; requires_action is
+# included because tool outputs cannot be submitted on the caller's behalf
+SETTLED_RUN_STATUSES = (
+    "completed",
+    "failed",
+    "cancelled",
+    "expired",
+    "incomplete",
+    "requires_action",
+)
+
 
 def create_run(
     thread_id: str,
@@ -22,16 +40,14 @@ def create_run(
     model: Optional[str] = None,
     instructions: Optional[str] = None,
     additional_instructions: Optional[str] = None,
-    tools: Optional[
-        List[Union[CodeInterpreterTool, FileSearchTool, FunctionTool]]
-    ] = None,
+    tools: Optional[List[RunTool]] = None,
     metadata: Optional[Dict[str, str]] = None,
     stream: Optional[bool] = None,
     temperature: Optional[float] = None,
     top_p: Optional[float] = None,
     max_completion_tokens: Optional[int] = None,
     max_prompt_tokens: Optional[int] = None,
-    response_format: Optional[Union[Literal["auto"], ResponseFormat]] = None,
+    response_format: Optional[ResponseFormat] = None,
     tool_choice: Optional[
         Union[Literal["none", "auto", "required"], ToolChoice]
     ] = None,
@@ -64,10 +80,14 @@ def create_run(
     """
     logger.info(f"Creating run for thread {thread_id} with assistant {assistant_id}")
 
-    # Convert tool models to dictionaries if provided
+    # Validate tools given as dicts and convert tool models to dictionaries
     tools_data = None
     if tools:
-        tools_data = [tool.model_dump() for tool in tools]
+        tools_data = [
+            tool.model_dump() for tool in run_tools_adapter.validate_python(tools)
+        ]
+    if isinstance(response_format, dict):
+        response_format = response_format_adapter.validate_python(response_format)
 
     request_data = {
         "assistant_id": assistant_id,
@@ -92,6 +112,8 @@ def create_run(
     logger.info(f"Creating run with request data: {request_data}")
 
     response = client.beta.threads.runs.create(thread_id=thread_id, **request_data)
+    invalidate_pages("runs", thread_id)
+    invalidate_pages("messages", thread_id)
     logger.info(f"Got response from OpenAI: {response}")
 
     return response
@@ -102,16 +124,14 @@ def create_thread_and_run(
     thread: Optional[Dict[str, Any]] = None,
     model: Optional[str] = None,
     instructions: Optional[str] = None,
-    tools: Optional[
-        List[Union[CodeInterpreterTool, FileSearchTool, FunctionTool]]
-    ] = None,
+    tools: Optional[List[RunTool]] = None,
     metadata: Optional[Dict[str, str]] = None,
     stream: Optional[bool] = None,
     temperature: Optional[float] = None,
     top_p: Optional[float] = None,
     max_completion_tokens: Optional[int] = None,
     max_prompt_tokens: Optional[int] = None,
-    response_format: Optional[Union[Literal["auto"], ResponseFormat]] = None,
+    response_format: Optional[ResponseFormat] = None,
     tool_choice: Optional[
         Union[Literal["none", "auto", "required"], ToolChoice]
     ] = None,
@@ -143,10 +163,14 @@ def create_thread_and_run(
     """
     logger.info(f"Creating thread and run with assistant {assistant_id}")
 
-    # Convert tool models to dictionaries if provided
+    # Validate tools given as dicts and convert tool models to dictionaries
     tools_data = None
     if tools:
-        tools_data = [tool.model_dump() for tool in tools]
+        tools_data = [
+            tool.model_dump() for tool in run_tools_adapter.validate_python(tools)
+        ]
+    if isinstance(response_format, dict):
+        response_format = response_format_adapter.validate_python(response_format)
 
     request_data = {
         "assistant_id": assistant_id,
@@ -207,12 +231,59 @@ def list_runs(
     # Remove None values
     params = {k: v for k, v in params.items() if v is not None}
 
-    response = client.beta.threads.runs.list(thread_id=thread_id, **params)
+    response = fetch_page(
+        "runs",
+        thread_id,
+        params,
+        lambda **page_params: client.beta.threads.runs.list(
+            thread_id=thread_id, **page_params
+        ),
+    )
     logger.info(f"Got response from OpenAI: {response}")
 
     return response
 
 
+def list_runs_raw(
+    thread_id: str,
+    limit: Optional[int] = None,
+    order: Optional[Literal["asc", "desc"]] = None,
+    after: Optional[str] = None,
+    before: Optional[str] = None,
+) -> str:
+    """
+    List runs for a thread as the upstream JSON body.
+
+    The response is not parsed into SDK models, which saves parsing and
+    re-encoding large pages. Pages are fetched directly, without prefetch.
+
+    Args:
+        thread_id: (REQUIRED) The ID of the thread to list runs for
+        limit: Limit on number of runs (1-100, default 20)
+        order: Sort order ('asc' or 'desc', default 'desc')
+        after: Cursor for pagination (get runs after this ID)
+        before: Cursor for pagination (get runs before this ID)
+
+    Returns:
+        str: The list response body as returned by the API
+    """
+    logger.info(f"Listing raw runs for thread {thread_id}")
+
+    params: Dict[str, Any] = {
+        "limit": limit,
+        "order": order,
+        "after": after,
+        "before": before,
+    }
+    # Remove None values
+    params = {k: v for k, v in params.items() if v is not None}
+
+    response = client.beta.threads.runs.with_raw_response.list(
+        thread_id=thread_id, **params
+    )
+    return response.text
+
+
 def get_run(thread_id: str, run_id: str) -> Run:
     """
     Get run by ID.
@@ -230,6 +301,35 @@ def get_run(thread_id: str, run_id: str) -> Run:
     return response
 
 
+def get_runs(
+    thread_id: str,
+    run_ids: List[str],
+    max_concurrency: Optional[int] = None,
+) -> BatchResult:
+    """
+    Retrieve many runs by ID.
+
+    Repeated IDs are fetched once, terminal runs held in the thread mirror are
+    served locally, and the rest are fetched concurrently.
+
+    Args:
+        thread_id: (REQUIRED) The ID of the thread the runs belong to
+        run_ids: (REQUIRED) The IDs of the runs to retrieve
+        max_concurrency: Requests run at once (default BATCH_MAX_CONCURRENCY)
+
+    Returns:
+        BatchResult with the Run or error for every ID, in request order
+    """
+    logger.info(f"Getting {len(run_ids)} runs from thread {thread_id}")
+
+    return fetch_many(
+        run_ids,
+        fetch=lambda run_id: get_run(thread_id, run_id),
+        cached=lambda run_id: mirrored_run(thread_id, run_id),
+        max_concurrency=max_concurrency,
+    )
+
+
 def modify_run(
     thread_id: str,
     run_id: str,
@@ -251,6 +351,7 @@ def modify_run(
     response = client.beta.threads.runs.update(
         thread_id=thread_id, run_id=run_id, metadata=metadata
     )
+    refresh_mirrored(thread_id, response)
     return response
 
 
@@ -302,3 +403,237 @@ def cancel_run(thread_id: str, run_id: str) -> Run:
 
     response = client.beta.threads.runs.cancel(thread_id=thread_id, run_id=run_id)
     return response
+
+
+def _run_summary(
+    index: int, thread_id: str, run: Run, started: float
+) -> Dict[str, Any]:
+    """Summarize a settled run for fan_out_runs."""
+    ended_at = run.completed_at or run.failed_at or run.cancelled_at
+    if ended_at:
+        duration = float(ended_at - (run.started_at or run.created_at))
+    else:
+        duration = time.monotonic() - started
+    return {
+        "index": index,
+        "thread_id": thread_id,
+        "run_id": run.id,
+        "status": run.status,
+        "duration_seconds": duration,
+        "usage": run.usage.model_dump() if run.usage else None,
+        "error": run.last_error.message if run.last_error else None,
+    }
+
+
+def _unsettled_summary(
+    index: int,
+    thread_id: str,
+    run_id: Optional[str],
+    status: str,
+    started: Optional[float],
+    error: str,
+) -> Dict[str, Any]:
+    """Summarize a run fan_out_runs stopped tracking before it settled."""
+    return {
+        "index": index,
+        "thread_id": thread_id,
+        "run_id": run_id,
+        "status": status,
+        "duration_seconds": time.monotonic() - started if started else 0.0,
+        "usage": None,
+        "error": error,
+    }
+
+
+async def fan_out_runs(
+    assistant_id: str,
+    thread_ids: List[str],
+    model: Optional[str] = None,
+    instructions: Optional[str] = None,
+    additional_instructions: Optional[str] = None,
+    metadata: Optional[Dict[str, str]] = None,
+    max_concurrency: Optional[int] = None,
+    poll_interval: Optional[float] = None,
+    timeout: Optional[float] = None,
+    on_complete: Optional[Callable[[Dict[str, Any], int], Awaitable[None]]] = None,
+) -> Dict[str, Any]:
+    """
+    Run one assistant on many threads and wait for every run to settle.
+
+    At most ``max_concurrency`` runs are active at once; a new run starts as
+    soon as one settles. All active runs are tracked by a single poller that
+    retrieves them concurrently every ``poll_interval`` seconds. A run whose
+    polls fail FAN_OUT_MAX_POLL_FAILURES times in a row is reported as
+    poll_failed. Once ``timeout`` has passed, runs still active are reported
+    as timed_out and runs not yet started as not_started; they are left as
+    they are upstream.
+
+    Args:
+        assistant_id: (REQUIRED) The ID of the assistant to use
+        thread_ids: (REQUIRED) The IDs of the threads to run
+        model: Model override for the runs
+        instructions: Instructions override for the runs
+        additional_instructions: Additional instructions for the runs
+        metadata: Key-value pairs attached to every run (max 16 pairs)
+        max_concurrency: Runs active at once (default BATCH_MAX_CONCURRENCY)
+        poll_interval: Seconds between polls (default FAN_OUT_POLL_SECONDS)
+        timeout: Seconds after which to stop waiting (default no limit)
+        on_complete: Awaited with each run summary and the settled count
+
+    Returns:
+        Dict with per-status counts, summed usage, durations and the
+        per-thread results in input order
+    """
+    logger.info(f"Fanning out assistant {assistant_id} over {len(thread_ids)} threads")
+
+    interval = poll_interval or settings.FAN_OUT_POLL_SECONDS
+    slots = anyio.Semaphore(max_concurrency or settings.BATCH_MAX_CONCURRENCY)
+    active: Dict[str, Tuple[int, str, float]] = {}
+    poll_failures: Counter = Counter()
+    results: List[Optional[Dict[str, Any]]] = [None] * len(thread_ids)
+    settled = 0
+    starts_done = anyio.Event()
+    fan_out_started = time.monotonic()
+    deadline = fan_out_started + timeout if timeout is not None else None
+
+    def expired() -> bool:
+        return deadline is not None and time.monotonic() >= deadline
+
+    async def settle(index: int, summary: Dict[str, Any]) -> None:
+        nonlocal settled
+        results[index] = summary
+        settled += 1
+        slots.release()
+        if on_complete is not None:
+            await on_complete(summary, settled)
+
+    async def start_runs() -> None:
+        for index, thread_id in enumerate(thread_ids):
+            await slots.acquire()
+            if expired():
+                await settle(
+                    index,
+                    _unsettled_summary(
+                        index,
+                        thread_id,
+                        None,
+                        "not_started",
+                        None,
+                        "Timed out before the run was started",
+                    ),
+                )
+                continue
+            started = time.monotonic()
+            try:
+                run = await anyio.to_thread.run_sync(
+                    partial(
+                        create_run,
+                        thread_id=thread_id,
+                        assistant_id=assistant_id,
+                        model=model,
+                        instructions=instructions,
+                        additional_instructions=additional_instructions,
+                        metadata=metadata,
+                    )
+                )
+            except Exception as e:
+                logger.warning(f"Failed to start run on thread {thread_id}: {e}")
+                await settle(
+                    index,
+                    _unsettled_summary(
+                        index, thread_id, None, "not_started", None, str(e)
+                    ),
+                )
+                continue
+            if run.status in SETTLED_RUN_STATUSES:
+                await settle(index, _run_summary(index, thread_id, run, started))
+            else:
+                active[run.id] = (index, thread_id, started)
+        starts_done.set()
+
+    async def poll_runs() -> None:
+        while not starts_done.is_set() or active:
+            if deadline is None:
+                await anyio.sleep(interval)
+            else:
+                await anyio.sleep(max(0.0, min(interval, deadline - time.monotonic())))
+            if expired():
+                for run_id, (index, thread_id, started) in list(active.items()):
+                    del active[run_id]
+                    await settle(
+                        index,
+                        _unsettled_summary(
+                            index,
+                            thread_id,
+                            run_id,
+                            "timed_out",
+                            started,
+                            f"Run had not settled after {timeout} seconds",
+                        ),
+                    )
+                # A run still being created lands in active once start_runs
+                # finishes, and is settled on the next pass
+                await starts_done.wait()
+                continue
+
+            polled: Dict[str, Run] = {}
+            errors: Dict[str, str] = {}
+
+            async def poll(run_id: str, thread_id: str) -> None:
+                try:
+                    polled[run_id] = await anyio.to_thread.run_sync(
+                        partial(get_run, thread_id=thread_id, run_id=run_id)
+                    )
+                except Exception as e:
+                    logger.warning(f"Failed to poll run {run_id}: {e}")
+                    errors[run_id] = str(e)
+
+            async with anyio.create_task_group() as group:
+                for run_id, (_, thread_id, _) in list(active.items()):
+                    group.start_soon(poll, run_id, thread_id)
+
+            for run_id, run in polled.items():
+                poll_failures.pop(run_id, None)
+                if run.status in SETTLED_RUN_STATUSES:
+                    index, thread_id, started = active.pop(run_id)
+                    await settle(index, _run_summary(index, thread_id, run, started))
+
+            for run_id, error in errors.items():
+                poll_failures[run_id] += 1
+                if poll_failures[run_id] < settings.FAN_OUT_MAX_POLL_FAILURES:
+                    continue
+                index, thread_id, started = active.pop(run_id)
+                await settle(
+                    index,
+                    _unsettled_summary(
+                        index,
+                        thread_id,
+                        run_id,
+                        "poll_failed",
+                        started,
+                        f"Polling failed {poll_failures[run_id]} times in a row: "
+                        f"{error}",
+                    ),
+                )
+
+    async with anyio.create_task_group() as group:
+        group.start_soon(start_runs)
+        group.start_soon(poll_runs)
+
+    summaries = [summary for summary in results if summary is not None]
+    usage: Counter = Counter()
+    for summary in summaries:
+        usage.update(summary["usage"] or {})
+    durations = [summary["duration_seconds"] for summary in summaries]
+    return {
+        "assistant_id": assistant_id,
+        "runs": len(summaries),
+        "status_counts": dict(Counter(summary["status"] for summary in summaries)),
+        "usage": dict(usage),
+        "duration_seconds": {
+            "wall": time.monotonic() - fan_out_started,
+            "mean": sum(durations) / len(durations) if durations else 0.0,
+            "max": max(durations, default=0.0),
+        },
+        "results": summaries,
+    }
@@ -7,14 +7,25 @@ from .models import (
     ThreadMessage,
     ThreadObject,
 )
-from .tools import create_thread, delete_thread, get_thread, modify_thread
+from .tools import (
+    create_thread,
+    create_threads,
+    delete_thread,
+    delete_threads,
+    get_thread,
+    get_threads,
+    modify_thread,
+)
 
 __all__ = [
     # Tools
     "create_thread",
+    "create_threads",
     "get_thread",
+    "get_threads",
     "modify_thread",
     "delete_thread",
+    "delete_threads",
     # Models
     "CreateThreadRequest",
     "DeleteThreadResponse",
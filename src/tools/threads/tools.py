@@ -7,10 +7,13 @@ from openai.types.beta.thread import Thread
 from openai.types.beta.thread_deleted import ThreadDeleted
 
 from src.config.settings import Settings
+from src.mirror import forget_thread
 
-from ..messages import MessageAttachment
-from ..models import ToolResources
-from .models import CreateThreadRequest, ModifyThreadRequest, ThreadMessage
+from ..batch import fetch_many, run_grouped
+from ..messages import create_message_from
+from ..models import BatchResult, ToolResources, request_params
+from ..prefetch import invalidate_pages
+from .models import CreateThreadRequest, ModifyThreadRequest
 
 logger = logging.getLogger(__name__)
 settings = Settings()
@@ -35,48 +38,65 @@ def create_thread(
     """
     logger.info("Creating thread")
 
-    # Convert raw message dicts to ThreadMessage objects if provided
-    thread_messages = None
-    if messages:
-        thread_messages = [
-            ThreadMessage(
-                content=msg["content"],
-                role=msg["role"],
-                file_ids=msg.get("file_ids"),
-                attachments=[
-                    MessageAttachment.model_validate(attachment)
-                    for attachment in msg.get("attachments", [])
-                ]
-                if msg.get("attachments")
-                else None,
-                metadata=msg.get("metadata"),
-            )
-            for msg in messages
-        ]
+    request = CreateThreadRequest.model_validate(
+        {"messages": messages, "metadata": metadata, "tool_resources": tool_resources}
+    )
+    return _create_thread(request)
 
-    # Convert tool_resources dict to ToolResources if needed
-    tool_resources_obj = None
-    if tool_resources:
-        if isinstance(tool_resources, dict):
-            tool_resources_obj = ToolResources.model_validate(tool_resources)
-        else:
-            tool_resources_obj = tool_resources
 
-    request = CreateThreadRequest(
-        messages=thread_messages,
-        metadata=metadata,
-        tool_resources=tool_resources_obj,
-    )
+def _create_thread(request: CreateThreadRequest) -> Thread:
+    """Create a thread, appending messages beyond the per-request limit."""
+    messages = request.messages or []
+    limit = settings.THREAD_CREATE_MAX_MESSAGES
 
-    request_data = request.model_dump(exclude_none=True)
+    request_data = request_params(request)
+    if len(messages) > limit:
+        request_data["messages"] = messages[:limit]
     logger.info(f"Creating thread with request data: {request_data}")
 
     response = client.beta.threads.create(**request_data)
     logger.info(f"Got response from OpenAI: {response}")
 
+    for position, message in enumerate(messages[limit:], start=limit):
+        try:
+            create_message_from(response.id, message)
+        except Exception as e:
+            raise RuntimeError(
+                f"Thread {response.id} created but appending message "
+                f"{position} failed: {e}"
+            ) from e
+
     return response
 
 
+def create_threads(
+    threads: List[CreateThreadRequest],
+    max_concurrency: Optional[int] = None,
+) -> BatchResult:
+    """
+    Create many threads concurrently.
+
+    Threads with more initial messages than THREAD_CREATE_MAX_MESSAGES are
+    created with the first messages and the rest are appended in order.
+
+    Args:
+        threads: (REQUIRED) Threads to create, each with optional messages,
+            metadata and tool_resources
+        max_concurrency: Threads created at once (default BATCH_MAX_CONCURRENCY)
+
+    Returns:
+        BatchResult with the created Thread or error for every item
+    """
+    logger.info(f"Creating {len(threads)} threads in batch")
+
+    return run_grouped(
+        list(enumerate(threads)),
+        group=lambda item: str(item[0]),
+        action=lambda item: _create_thread(item[1]),
+        max_concurrency=max_concurrency,
+    )
+
+
 def get_thread(thread_id: str) -> Thread:
     """
     Get thread by ID.
@@ -93,6 +113,30 @@ def get_thread(thread_id: str) -> Thread:
     return response
 
 
+def get_threads(
+    thread_ids: List[str], max_concurrency: Optional[int] = None
+) -> BatchResult:
+    """
+    Retrieve many threads by ID.
+
+    Threads are fetched concurrently, and each repeated ID only once.
+
+    Args:
+        thread_ids: (REQUIRED) The IDs of the threads to retrieve
+        max_concurrency: Requests run at once (default BATCH_MAX_CONCURRENCY)
+
+    Returns:
+        BatchResult with the Thread or error for every ID, in request order
+    """
+    logger.info(f"Getting {len(thread_ids)} threads")
+
+    return fetch_many(
+        thread_ids,
+        fetch=get_thread,
+        max_concurrency=max_concurrency,
+    )
+
+
 def modify_thread(
     thread_id: str,
     metadata: Optional[Dict[str, str]] = None,
@@ -141,4 +185,30 @@ def delete_thread(thread_id: str) -> ThreadDeleted:
     logger.info(f"Deleting thread {thread_id}")
 
     response = client.beta.threads.delete(thread_id)
+    forget_thread(thread_id)
+    invalidate_pages("messages", thread_id)
+    invalidate_pages("runs", thread_id)
     return response
+
+
+def delete_threads(
+    thread_ids: List[str], max_concurrency: Optional[int] = None
+) -> BatchResult:
+    """
+    Delete many threads concurrently.
+
+    Args:
+        thread_ids: (REQUIRED) The IDs of the threads to delete
+        max_concurrency: Deletions run at once (default BATCH_MAX_CONCURRENCY)
+
+    Returns:
+        BatchResult with the ThreadDeleted status or error for every ID
+    """
+    logger.info(f"Deleting {len(thread_ids)} threads in batch")
+
+    return run_grouped(
+        thread_ids,
+        group=lambda thread_id: thread_id,
+        action=delete_thread,
+        max_concurrency=max_concurrency,
+    )
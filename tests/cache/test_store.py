@@ -0,0 +1,73 @@
+"""Tests for the in-process TTL cache."""
+from unittest.mock import patch
+
+from src.cache import TTLCache, get_cache, register_cache
+
+
+def test_get_and_set():
+    """Test storing and retrieving a value."""
+    cache = TTLCache("test", max_entries=10, ttl_seconds=60)
+
+    cache.set("a", {"id": "a"})
+
+    assert cache.get("a") == {"id": "a"}
+    assert cache.get("b") is None
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_disabled_cache_stores_nothing():
+    """Test that a disabled cache never returns values."""
+    cache = TTLCache("test", max_entries=10, ttl_seconds=60, enabled=False)
+
+    cache.set("a", {"id": "a"})
+
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_lru_eviction():
+    """Test that the least recently used entry is evicted first."""
+    cache = TTLCache("test", max_entries=2, ttl_seconds=60)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.evictions == 1
+
+
+def test_byte_budget_eviction():
+    """Test that entries are evicted to stay under the byte budget."""
+    cache = TTLCache("test", max_entries=10, ttl_seconds=60, max_bytes=10)
+
+    cache.set("a", b"12345")
+    cache.set("b", b"12345")
+    cache.set("c", b"12345")
+
+    assert len(cache) == 2
+    assert cache.get("a") is None
+    assert cache.stats()["bytes"] == 10
+
+
+def test_ttl_expiry():
+    """Test that expired entries are dropped on access."""
+    cache = TTLCache("test", max_entries=10, ttl_seconds=5)
+
+    with patch("src.cache.store.time.monotonic", return_value=100.0):
+        cache.set("a", 1)
+    with patch("src.cache.store.time.monotonic", return_value=106.0):
+        assert cache.get("a") is None
+
+    assert cache.evictions == 1
+
+
+def test_registry():
+    """Test that registered caches can be looked up by name."""
+    cache = register_cache("test_registry", max_entries=1, ttl_seconds=1)
+
+    assert get_cache("test_registry") is cache
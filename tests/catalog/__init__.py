@@ -0,0 +1 @@
+"""Tool catalog tests."""
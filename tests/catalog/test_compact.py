@@ -0,0 +1,96 @@
+"""Tests for the compact tools/list catalog."""
+from unittest.mock import patch
+
+from src.catalog import catalog_size, compact_description, compact_schema
+from src.server import mcp
+
+SCHEMA = {
+    "$defs": {
+        "Tool": {
+            "properties": {"type": {"const": "function", "title": "Type"}},
+            "required": ["type"],
+            "title": "Tool",
+            "type": "object",
+        }
+    },
+    "properties": {
+        "title": {"title": "Title", "type": "string"},
+        "tools": {
+            "anyOf": [
+                {"items": {"$ref": "#/$defs/Tool"}, "type": "array"},
+                {"type": "null"},
+            ],
+            "default": None,
+            "title": "Tools",
+        },
+        "limit": {
+            "anyOf": [{"type": "integer"}, {"type": "null"}],
+            "default": 20,
+            "title": "Limit",
+        },
+    },
+    "required": ["title"],
+    "title": "create_toolArguments",
+    "type": "object",
+}
+
+
+def test_compact_schema():
+    """Test dropping titles and null branches but keeping real properties."""
+    assert compact_schema(SCHEMA) == {
+        "$defs": {
+            "Tool": {
+                "properties": {"type": {"const": "function"}},
+                "required": ["type"],
+                "type": "object",
+            }
+        },
+        "properties": {
+            "title": {"type": "string"},
+            "tools": {"items": {"$ref": "#/$defs/Tool"}, "type": "array"},
+            "limit": {
+                "anyOf": [{"type": "integer"}, {"type": "null"}],
+                "default": 20,
+            },
+        },
+        "required": ["title"],
+        "type": "object",
+    }
+
+
+def test_compact_description():
+    """Test cutting a docstring before its Returns section."""
+    doc = """
+    Get a run.
+
+    Args:
+        run_id: (REQUIRED) Run ID
+
+    Returns:
+        Run: The run
+    """
+    assert (
+        compact_description(doc) == "Get a run.\n\nArgs:\n    run_id: (REQUIRED) Run ID"
+    )
+
+
+async def test_catalog_sizes(record_property):
+    """Record the size of each catalog variant and check compact keeps tools."""
+    full = await mcp.list_tools()
+    with patch("src.server.settings.COMPACT_TOOL_CATALOG", True):
+        compact = await mcp.list_tools()
+
+    sizes = {"full": catalog_size(full), "compact": catalog_size(compact)}
+    for variant, size in sizes.items():
+        record_property(f"{variant}_bytes", size["bytes"])
+        record_property(f"{variant}_tokens", size["tokens"])
+        print(f"tools/list {variant}: {size['bytes']} bytes, ~{size['tokens']} tokens")
+
+    assert sizes["compact"]["bytes"] < 0.65 * sizes["full"]["bytes"]
+    assert [tool.name for tool in compact] == [tool.name for tool in full]
+    for before, after in zip(full, compact):
+        assert "Returns:" not in after.description
+        assert after.inputSchema.get("required") == before.inputSchema.get("required")
+        assert set(after.inputSchema["properties"]) == set(
+            before.inputSchema["properties"]
+        )
@@ -0,0 +1 @@
+"""Result encoding tests."""
@@ -0,0 +1,108 @@
+"""Tests for result size caps with continuation tokens."""
+import json
+from unittest.mock import patch
+
+import pytest
+
+from src.encoding import get_continuation, limit_result, split_result, to_content
+
+PAGE = {
+    "object": "list",
+    "data": [
+        {
+            "id": f"msg_{n:03d}",
+            "content": [{"type": "text", "text": {"value": "word " * 100}}],
+        }
+        for n in range(40)
+    ],
+    "has_more": True,
+}
+
+
+def follow(first: str):
+    """Return every slice starting from ``first``."""
+    slices = [json.loads(first)]
+    while slices[-1]["continuation"]["token"]:
+        slices.append(json.loads(get_continuation(slices[-1]["continuation"]["token"])))
+    return slices
+
+
+def test_split_between_list_items():
+    """Test that slices fit the cap and keep the object around their items."""
+    text = json.dumps(PAGE)
+    slices = split_result(text, 4096)
+
+    assert slices[0][0] is None
+    assert all(len(body.encode()) <= 4096 for _, body in slices)
+    bodies = [json.loads(body) for _, body in slices]
+    assert all(body["has_more"] is True for body in bodies)
+    assert [m for body in bodies for m in body["data"]] == PAGE["data"]
+    assert [body["continuation"]["slice"] for body in bodies] == list(
+        range(1, len(slices) + 1)
+    )
+    assert bodies[-1]["continuation"]["token"] is None
+
+
+def test_limit_result_holds_remaining_slices():
+    """Test that the first slice is returned and the rest are fetched by token."""
+    text = json.dumps(PAGE)
+    with patch("src.encoding.continuation.settings.MAX_RESULT_BYTES", 8192):
+        first = limit_result(text)
+        assert limit_result('{"id": "run_abc123"}') == '{"id": "run_abc123"}'
+
+    slices = follow(first)
+    assert len(slices) > 1
+    assert [m for body in slices for m in body["data"]] == PAGE["data"]
+
+
+def test_oversized_item_split_as_text():
+    """Test that an item over the cap is sent as partial JSON text."""
+    message = {"id": "msg_big", "content": "x" * 5000 + '"quoted"\n' * 200}
+    with patch("src.encoding.continuation.settings.MAX_RESULT_BYTES", 2048):
+        contents = to_content(message)
+
+    slices = follow(contents[0].text)
+    assert all(len(json.dumps(body).encode()) <= 2048 for body in slices)
+    assert json.loads("".join(body["partial"] for body in slices)) == message
+
+
+def test_adjacent_oversized_items_rebuilt_separately():
+    """Test that partial pieces mark where each oversized item ends."""
+    big = [{"id": f"msg_big{n}", "content": str(n) * 5000} for n in range(2)]
+    page = {"object": "list", "data": [{"id": "msg_a"}, *big, {"id": "msg_b"}]}
+    with patch("src.encoding.continuation.settings.MAX_RESULT_BYTES", 2048):
+        contents = to_content(page)
+
+    slices = follow(contents[0].text)
+    assert all(len(json.dumps(body).encode()) <= 2048 for body in slices)
+    items, parts = [], []
+    for body in slices:
+        if "partial" not in body:
+            items.extend(body["data"])
+            continue
+        assert body["part"] == len(parts)
+        parts.append(body)
+        if body["final"]:
+            assert len({part["value"] for part in parts}) == 1
+            value = json.loads("".join(part["partial"] for part in parts))
+            items.extend(value["data"])
+            parts = []
+    assert not parts
+    assert items == page["data"]
+
+
+def test_list_result_capped():
+    """Test that a plain list result is encoded and capped like an object."""
+    with patch("src.encoding.continuation.settings.MAX_RESULT_BYTES", 4096):
+        contents = to_content(PAGE["data"])
+
+    assert len(contents) == 1
+    slices = follow(contents[0].text)
+    assert len(slices) > 1
+    assert [m for body in slices for m in body["data"]] == PAGE["data"]
+
+
+def test_unknown_token():
+    """Test that an unknown or expired token raises ValueError."""
+    with pytest.raises(ValueError, match="unknown or has expired"):
+        get_continuation("not-a-token")
@@ -0,0 +1,67 @@
+"""Tests for tool result encoders."""
+import json
+from unittest.mock import patch
+
+import pytest
+from mcp.types import TextContent
+from openai.types.beta.threads.message import Message
+
+from src.encoding import (
+    available_encoders,
+    encode_orjson,
+    encode_stdlib,
+    get_encoder,
+    register_encoder,
+    to_content,
+)
+
+MESSAGE = Message(
+    id="msg_abc123",
+    object="thread.message",
+    created_at=1699012949,
+    thread_id="thread_abc123",
+    role="user",
+    status="completed",
+    content=[{"type": "text", "text": {"value": "Hello", "annotations": []}}],
+    attachments=[],
+    metadata={},
+)
+
+
+def test_encoders_agree():
+    """Test that orjson and the stdlib encode to the same JSON value."""
+    value = {"message": MESSAGE, "count": 1}
+
+    assert json.loads(encode_orjson(value)) == json.loads(encode_stdlib(value))
+
+
+def test_orjson_falls_back_on_unsupported_values():
+    """Test that values orjson rejects are encoded by the stdlib."""
+    assert json.loads(encode_orjson({"big": 2**70})) == {"big": 2**70}
+
+
+def test_auto_prefers_orjson():
+    """Test that auto picks orjson when it is installed."""
+    assert "orjson" in available_encoders()
+    assert get_encoder("auto") is encode_orjson
+
+
+def test_unknown_encoder():
+    """Test that an unknown encoder name is rejected."""
+    with pytest.raises(ValueError):
+        get_encoder("missing")
+
+
+def test_to_content_uses_configured_encoder():
+    """Test that tool results are encoded with RESULT_ENCODER."""
+    register_encoder("test_upper", lambda value: json.dumps(value).upper())
+
+    with patch("src.encoding.encoders.settings.RESULT_ENCODER", "test_upper"):
+        content = to_content({"id": "msg_abc123"})
+
+    assert content == [TextContent(type="text", text='{"ID": "MSG_ABC123"}')]
+
+
+def test_to_content_passes_strings_through():
+    """Test that string results are not encoded again."""
+    assert to_content('{"id": 1}') == [TextContent(type="text", text='{"id": 1}')]
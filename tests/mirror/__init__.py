@@ -0,0 +1 @@
+"""Thread mirror tests."""
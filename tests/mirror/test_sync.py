@@ -0,0 +1,162 @@
+"""Tests for incremental thread transcript sync."""
+from unittest.mock import Mock, patch
+
+import pytest
+from openai.pagination import SyncCursorPage
+from openai.types.beta.threads.message import Message
+from openai.types.beta.threads.run import Run
+
+from src.cache import TTLCache
+from src.mirror import forget_message, refresh_mirrored
+from src.mirror.sync import get_thread_transcript, sync_thread
+
+
+def _message(index, status="completed"):
+    """Build a message with an ID that sorts by creation order."""
+    return Message.model_validate(
+        {
+            "id": f"msg_{index:03d}",
+            "object": "thread.message",
+            "created_at": 1699000000 + index,
+            "thread_id": "thread_abc123",
+            "role": "user",
+            "content": [{"type": "text", "text": {"value": "Hi", "annotations": []}}],
+            "attachments": [],
+            "metadata": {},
+            "status": status,
+        }
+    )
+
+
+def _run(index, status="completed"):
+    """Build a run in the given status."""
+    return Run.model_construct(
+        id=f"run_{index:03d}",
+        object="thread.run",
+        thread_id="thread_abc123",
+        status=status,
+    )
+
+
+def _lister(items):
+    """Emulate an ascending cursor-paginated list endpoint over ``items``."""
+
+    def list_page(order="asc", limit=100, after=None, **params):
+        start = 0
+        if after is not None:
+            start = [item.id for item in items].index(after) + 1
+        stop = start + limit
+        return SyncCursorPage(data=items[start:stop], has_more=stop < len(items))
+
+    return Mock(side_effect=list_page)
+
+
+@pytest.fixture(autouse=True)
+def mirror(monkeypatch):
+    """Fixture providing an empty thread mirror."""
+    cache = TTLCache(
+        "thread_mirror", max_entries=10, ttl_seconds=0, sizeof=lambda t: t.size
+    )
+    monkeypatch.setattr("src.mirror.sync.thread_mirror", cache)
+    monkeypatch.setattr("src.mirror.store.thread_mirror", cache)
+    return cache
+
+
+def test_sync_thread_pages_then_fetches_delta():
+    """Test that a second sync only lists objects after the newest known ID."""
+    messages = [_message(i) for i in range(250)]
+    list_messages = _lister(messages)
+
+    with patch("src.mirror.sync.list_messages", list_messages):
+        sync_thread("thread_abc123", include_runs=False)
+        assert list_messages.call_count == 3
+
+        messages.append(_message(250))
+        list_messages.reset_mock()
+        transcript = sync_thread("thread_abc123", include_runs=False)
+
+    list_messages.assert_called_once()
+    assert list_messages.call_args.kwargs["after"] == "msg_249"
+    assert len(transcript.messages) == 251
+    assert transcript.size > 0
+
+
+def test_sync_thread_refreshes_active_runs_and_steps():
+    """Test that unfinished runs are refreshed and their steps re-listed."""
+    runs = [_run(1, status="in_progress")]
+    get_run = Mock(return_value=_run(1, status="completed"))
+    list_run_steps = _lister([])
+
+    with patch("src.mirror.sync.list_messages", _lister([])), patch(
+        "src.mirror.sync.list_runs", _lister(runs)
+    ), patch("src.mirror.sync.get_run", get_run), patch(
+        "src.mirror.sync.list_run_steps", list_run_steps
+    ):
+        sync_thread("thread_abc123")
+        transcript = sync_thread("thread_abc123")
+        sync_thread("thread_abc123")
+
+    get_run.assert_called_once_with(thread_id="thread_abc123", run_id="run_001")
+    assert transcript.runs["run_001"].status == "completed"
+    assert "run_001" in transcript.complete_step_runs
+    assert list_run_steps.call_count == 2
+
+
+def test_get_thread_transcript_without_sync(mirror):
+    """Test that reads without sync are served from the mirror."""
+    list_messages = _lister([_message(1)])
+
+    with patch("src.mirror.sync.list_messages", list_messages):
+        get_thread_transcript("thread_abc123", include_runs=False)
+        result = get_thread_transcript("thread_abc123", sync=False, include_runs=False)
+
+    list_messages.assert_called_once()
+    assert [m.id for m in result["messages"]] == ["msg_001"]
+
+
+def test_get_thread_transcript_looks_up_once(mirror):
+    """Test that a read counts a single cache lookup, synced or not."""
+    with patch("src.mirror.sync.list_messages", _lister([_message(1)])):
+        get_thread_transcript("thread_abc123", include_runs=False)
+        get_thread_transcript("thread_abc123", include_runs=False)
+        get_thread_transcript("thread_abc123", sync=False, include_runs=False)
+
+    assert mirror.stats()["misses"] == 1
+    assert mirror.stats()["hits"] == 2
+
+
+def test_mirror_changes_keep_cache_bytes(mirror):
+    """Test that edits to a mirrored transcript are counted by the cache."""
+    messages = [_message(1, status="in_progress"), _message(2)]
+    with patch("src.mirror.sync.list_messages", _lister(messages)):
+        transcript = sync_thread("thread_abc123", include_runs=False)
+
+    refresh_mirrored("thread_abc123", _message(1))
+    assert mirror.stats()["bytes"] == transcript.size
+    forget_message("thread_abc123", "msg_002")
+    assert list(transcript.messages) == ["msg_001"]
+    assert mirror.stats()["bytes"] == transcript.size
+
+
+def test_sync_thread_drops_transcript_over_budget(monkeypatch):
+    """Test that a transcript outgrowing the byte budget is not kept."""
+    cache = TTLCache(
+        "thread_mirror",
+        max_entries=10,
+        ttl_seconds=0,
+        max_bytes=5000,
+        sizeof=lambda t: t.size,
+    )
+    monkeypatch.setattr("src.mirror.sync.thread_mirror", cache)
+    messages = [_message(1)]
+
+    with patch("src.mirror.sync.list_messages", _lister(messages)):
+        sync_thread("thread_abc123", include_runs=False)
+        assert "thread_abc123" in cache
+
+        messages.extend(_message(i) for i in range(2, 50))
+        transcript = sync_thread("thread_abc123", include_runs=False)
+
+    assert transcript.size > 5000
+    assert "thread_abc123" not in cache
+    assert cache.stats()["bytes"] == 0
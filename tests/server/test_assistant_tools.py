@@ -1,7 +1,10 @@
 """Tests for OpenAI Assistant API MCP server tools."""
-from unittest.mock import Mock, patch
+import json
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
+from openai.pagination import SyncCursorPage
+from openai.types.beta.assistant import Assistant
 
 # Mock OpenAI before importing any modules that use it
 mock_openai = Mock()
@@ -130,21 +133,40 @@ def test_get_assistant(mock_openai_client):
     mock_openai_client.beta.assistants.retrieve.assert_called_once_with("asst_abc123")
 
 
-def test_list_assistants(mock_openai_client):
+async def test_list_assistants(mock_openai_client):
     """Test listing assistants through MCP server."""
-    mock_openai_client.beta.assistants.list.return_value = Mock(
-        data=EXAMPLE_ASSISTANTS_LIST["data"]
+    mock_openai_client.beta.assistants.list.return_value = SyncCursorPage[Assistant](
+        data=EXAMPLE_ASSISTANTS_LIST["data"], has_more=False
     )
 
-    result = list_assistants()
+    result = await list_assistants(ctx=Mock(), limit=2, order="desc")
 
-    assert len(result["data"]) == 2
-    assert result["data"][0]["id"] == "asst_abc123"
-    assert result["data"][0]["name"] == "Coding Tutor"
-    assert result["data"][1]["id"] == "asst_abc456"
-    assert result["data"][1]["name"] == "My Assistant"
+    assert len(result.data) == 2
+    assert result.data[0].id == "asst_abc123"
+    assert result.data[0].name == "Coding Tutor"
+    assert result.data[1].id == "asst_abc456"
+    assert result.data[1].name == "My Assistant"
 
-    mock_openai_client.beta.assistants.list.assert_called_once()
+    mock_openai_client.beta.assistants.list.assert_called_once_with(
+        limit=2, order="desc"
+    )
+
+
+async def test_list_assistants_all_reports_progress(mock_openai_client):
+    """Test that all=True reports each page's count and IDs as progress."""
+    mock_openai_client.beta.assistants.list.return_value = SyncCursorPage[Assistant](
+        data=EXAMPLE_ASSISTANTS_LIST["data"], has_more=False
+    )
+    ctx = AsyncMock()
+
+    result = await list_assistants(ctx=ctx, all=True)
+
+    assert len(result.data) == 2
+    ctx.report_progress.assert_awaited_once_with(2)
+    ctx.info.assert_awaited_once_with(json.dumps(["asst_abc123", "asst_abc456"]))
+    mock_openai_client.beta.assistants.list.assert_called_once_with(
+        limit=100, order="desc"
+    )
 
 
 def test_modify_assistant(mock_openai_client):
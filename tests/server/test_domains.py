@@ -0,0 +1,55 @@
+"""Tests for registering tools by domain."""
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from src.handlers import load_handlers, parse_domains
+
+LIST_TOOLS = """
+import asyncio, json, sys
+from src.server import mcp
+tools = asyncio.run(mcp.list_tools())
+print(json.dumps({
+    "tools": [tool.name for tool in tools],
+    "modules": sorted(name for name in sys.modules if name.startswith("src.")),
+}))
+"""
+
+
+def test_parse_domains():
+    """Test parsing domain lists and rejecting unknown domains."""
+    assert parse_domains(" runs, messages,") == {"runs", "messages"}
+    with pytest.raises(ValueError, match="retrieval"):
+        parse_domains("runs,retrieval")
+    with pytest.raises(ValueError):
+        load_handlers("assistant")
+
+
+def test_disabled_domains_are_not_imported():
+    """Test that only enabled domains are imported and registered."""
+    env = {**os.environ, "ENABLED_DOMAINS": "runs,messages", "LOG_LEVEL": "WARNING"}
+    output = subprocess.run(
+        [sys.executable, "-c", LIST_TOOLS],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
+    ).stdout
+    result = json.loads(output.strip().splitlines()[-1])
+
+    assert "get_run" in result["tools"]
+    assert "list_messages" in result["tools"]
+    assert "get_cache_stats" in result["tools"]
+    assert "create_assistant" not in result["tools"]
+    assert "get_thread" not in result["tools"]
+    assert "patch_metadata" not in result["tools"]
+    for module in (
+        "src.handlers.assistants",
+        "src.tools.assistant",
+        "src.tools.threads",
+    ):
+        assert module not in result["modules"]
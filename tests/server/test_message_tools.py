@@ -1,7 +1,10 @@
 """Tests for OpenAI Message API MCP server tools."""
-from unittest.mock import Mock, patch
+import json
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
+from openai.pagination import SyncCursorPage
+from openai.types.beta.threads.message import Message
 
 # Mock OpenAI before importing any modules that use it
 mock_openai = Mock()
@@ -11,7 +14,9 @@ with patch("openai.OpenAI", return_value=mock_openai):
             create_message,
             delete_message,
             get_message,
+            iter_thread_messages,
             list_messages,
+            mcp,
             modify_message,
         )
 
@@ -124,6 +129,137 @@ def test_list_messages(mock_openai_client):
     )
 
 
+CITED_MESSAGE = {
+    **EXAMPLE_MESSAGE,
+    "role": "assistant",
+    "status": "completed",
+    "content": [
+        {
+            "type": "text",
+            "text": {
+                "value": "Ships in two days【4:0†source】, see orders.csv",
+                "annotations": [
+                    {
+                        "type": "file_citation",
+                        "text": "【4:0†source】",
+                        "start_index": 16,
+                        "end_index": 28,
+                        "file_citation": {"file_id": "file_policy"},
+                    },
+                    {
+                        "type": "file_path",
+                        "text": "orders.csv",
+                        "start_index": 34,
+                        "end_index": 44,
+                        "file_path": {"file_id": "file_orders"},
+                    },
+                ],
+            },
+        },
+        {"type": "image_file", "image_file": {"file_id": "file_chart"}},
+    ],
+}
+
+
+def test_get_message_render_text(mock_openai_client):
+    """Test flattening a message to text, with and without citation markers."""
+    mock_openai_client.beta.threads.messages.retrieve.return_value = (
+        Message.model_validate(CITED_MESSAGE)
+    )
+
+    result = get_message(
+        thread_id="thread_abc123", message_id="msg_abc123", render="text"
+    )
+    assert result == {
+        "id": "msg_abc123",
+        "role": "assistant",
+        "created_at": 1699012949,
+        "run_id": None,
+        "content": "Ships in two days【4:0†source】, see orders.csv\n"
+        "[image_file file_chart]",
+    }
+
+    result = get_message(
+        thread_id="thread_abc123",
+        message_id="msg_abc123",
+        render="text",
+        citations=True,
+        fields=["content"],
+    )
+    assert result == {
+        "content": "Ships in two days[1], see [2]\n[image_file file_chart]\n\n"
+        "[1] file_policy\n[2] file_orders"
+    }
+
+
+def test_list_messages_render_text(mock_openai_client):
+    """Test that render="text" flattens every message of a page."""
+    page = {
+        **EXAMPLE_MESSAGE_LIST,
+        "data": [{**EXAMPLE_MESSAGE, "status": "completed"}],
+        "has_more": True,
+    }
+    mock_openai_client.beta.threads.messages.list.return_value = SyncCursorPage[
+        Message
+    ](**page)
+
+    result = list_messages(thread_id="thread_abc123", render="text", raw=True)
+
+    assert result == {
+        "data": [
+            {
+                "id": "msg_abc123",
+                "role": "user",
+                "created_at": 1699012949,
+                "run_id": None,
+                "content": "Hello, how are you?",
+            }
+        ],
+        "has_more": True,
+    }
+
+
+def test_list_messages_raw(mock_openai_client):
+    """Test that raw mode forwards the response body, projected to fields."""
+    raw_list = mock_openai_client.beta.threads.messages.with_raw_response.list
+    raw_list.return_value.text = json.dumps(EXAMPLE_MESSAGE_LIST)
+
+    result = list_messages(thread_id="thread_abc123", raw=True, fields=["id"])
+
+    assert json.loads(result) == {
+        **EXAMPLE_MESSAGE_LIST,
+        "data": [{"id": "msg_abc123"}],
+    }
+    raw_list.assert_called_once_with(thread_id="thread_abc123")
+
+
+async def test_list_messages_raw_capped(mock_openai_client):
+    """Test that an oversized page is sliced and continued by token."""
+    page = {
+        **EXAMPLE_MESSAGE_LIST,
+        "data": [{**EXAMPLE_MESSAGE, "id": f"msg_{n:03d}"} for n in range(30)],
+    }
+    raw_list = mock_openai_client.beta.threads.messages.with_raw_response.list
+    raw_list.return_value.text = json.dumps(page)
+
+    with patch("src.encoding.continuation.settings.MAX_RESULT_BYTES", 4096):
+        content = await mcp.call_tool(
+            "list_messages", {"thread_id": "thread_abc123", "raw": True}
+        )
+        messages = []
+        while True:
+            body = json.loads(content[0].text)
+            assert len(content[0].text) <= 4096
+            messages += body["data"]
+            if not body["continuation"]["token"]:
+                break
+            content = await mcp.call_tool(
+                "get_result_continuation", {"token": body["continuation"]["token"]}
+            )
+
+    assert messages == page["data"]
+
+
 def test_modify_message(mock_openai_client):
     """Test modifying a message through MCP server."""
     mock_openai_client.beta.threads.messages.update.return_value = (
@@ -159,3 +295,26 @@ def test_delete_message(mock_openai_client):
     mock_openai_client.beta.threads.messages.delete.assert_called_once_with(
         thread_id="thread_abc123", message_id="msg_abc123"
     )
+
+
+async def test_iter_thread_messages_reports_chunks(mock_openai_client):
+    """Test that each compact chunk is sent as progress and a log message."""
+    mock_openai_client.beta.threads.messages.list.return_value = SyncCursorPage[
+        Message
+    ](data=[Message(**EXAMPLE_MESSAGE, status="completed")], has_more=False)
+    ctx = AsyncMock()
+
+    result = await iter_thread_messages(ctx=ctx, thread_id="thread_abc123")
+
+    assert result["messages"] == 1
+    ctx.report_progress.assert_awaited_once_with(1)
+    chunk = json.loads(ctx.info.await_args.args[0])
+    assert chunk == [
+        {
+            "id": "msg_abc123",
+            "role": "user",
+            "created_at": 1699012949,
+            "run_id": None,
+            "content": "Hello, how are you?",
+        }
+    ]
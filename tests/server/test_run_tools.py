@@ -1,4 +1,5 @@
 """Tests for OpenAI Run API MCP server tools."""
+import json
 from unittest.mock import Mock, patch
 
 import pytest
@@ -13,6 +14,7 @@ with patch("openai.OpenAI", return_value=mock_openai):
             create_thread_and_run,
             get_run,
             list_runs,
+            mcp,
             modify_run,
             submit_tool_outputs,
         )
@@ -193,6 +195,39 @@ def test_get_run(mock_openai_client):
     )
 
 
+def test_get_run_with_fields(mock_openai_client):
+    """Test that fields limits the returned run to the requested keys."""
+    mock_openai_client.beta.threads.runs.retrieve.return_value = EXAMPLE_RUN
+
+    result = get_run(
+        thread_id="thread_abc123", run_id="run_abc123", fields=["id", "status"]
+    )
+
+    assert result == {"id": "run_abc123", "status": "completed"}
+
+
+def test_get_run_compact(mock_openai_client):
+    """Test that compact drops null fields from the returned run."""
+    mock_openai_client.beta.threads.runs.retrieve.return_value = EXAMPLE_RUN
+
+    result = get_run(thread_id="thread_abc123", run_id="run_abc123", compact=True)
+
+    assert result["id"] == "run_abc123"
+    assert None not in result.values()
+
+
+async def test_call_tool_encodes_result(mock_openai_client):
+    """Test that tool calls return the result encoded as JSON text."""
+    mock_openai_client.beta.threads.runs.retrieve.return_value = EXAMPLE_RUN
+
+    content = await mcp.call_tool(
+        "get_run", {"thread_id": "thread_abc123", "run_id": "run_abc123"}
+    )
+
+    assert len(content) == 1
+    assert json.loads(content[0].text) == EXAMPLE_RUN
+
+
 def test_modify_run(mock_openai_client):
     """Test modifying a run through MCP server."""
     mock_openai_client.beta.threads.runs.update.return_value = EXAMPLE_MODIFIED_RUN
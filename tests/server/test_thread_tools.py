@@ -1,4 +1,5 @@
 """Tests for OpenAI Thread API MCP server tools."""
+import threading
 from unittest.mock import Mock, patch
 
 import pytest
@@ -12,6 +13,7 @@ with patch("openai.OpenAI", return_value=mock_openai):
                 create_thread,
                 delete_thread,
                 get_thread,
+                get_threads,
                 modify_thread,
             )
 
@@ -151,3 +153,23 @@ def test_delete_thread(mock_openai_client):
     assert result["deleted"] is True
 
     mock_openai_client.beta.threads.delete.assert_called_once_with("thread_abc123")
+
+
+async def test_get_threads_runs_off_event_loop(mock_openai_client):
+    """Test that a batch tool does its blocking calls in a worker thread."""
+    callers = []
+
+    def retrieve(thread_id):
+        callers.append(threading.get_ident())
+        return {**EXAMPLE_THREAD, "id": thread_id}
+
+    mock_openai_client.beta.threads.retrieve.side_effect = retrieve
+
+    result = await get_threads(["thread_a", "thread_b"], max_concurrency=1)
+
+    assert result.succeeded == 2
+    assert [item.result["id"] for item in result.items] == [
+        "thread_a",
+        "thread_b",
+    ]
+    assert threading.get_ident() not in callers
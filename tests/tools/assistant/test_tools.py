@@ -1,7 +1,14 @@
 """Tests for OpenAI Assistant API tools implementation."""
+import time
 from unittest.mock import Mock, patch
 
 import pytest
+from openai import NOT_GIVEN
+from openai.pagination import SyncCursorPage
+from openai.types.beta.assistant import Assistant
+
+from src.cache import TTLCache
+from src.metrics import get_metrics, reset_metrics
 
 # Mock OpenAI before importing any modules that use it
 mock_openai = Mock()
@@ -9,9 +16,13 @@ with patch("openai.OpenAI", return_value=mock_openai):
     from src.tools.assistant.tools import (
         create_assistant,
         delete_assistant,
+        delete_assistants,
         get_assistant,
+        get_assistants,
+        list_all_assistants,
         list_assistants,
         modify_assistant,
+        warm_assistant_cache,
     )
     from src.tools.models import CodeInterpreterTool
 
@@ -119,19 +130,34 @@ def test_get_assistant(mock_openai_client):
 
 def test_list_assistants(mock_openai_client):
     """Test listing assistants."""
-    mock_openai_client.beta.assistants.list.return_value = Mock(
-        data=EXAMPLE_ASSISTANTS_LIST["data"]
+    mock_openai_client.beta.assistants.list.reset_mock()
+    mock_openai_client.beta.assistants.list.return_value = SyncCursorPage[Assistant](
+        data=EXAMPLE_ASSISTANTS_LIST["data"], has_more=False
     )
 
     result = list_assistants()
 
-    assert len(result["data"]) == 2
-    assert result["data"][0]["id"] == "asst_abc123"
-    assert result["data"][0]["name"] == "Coding Tutor"
-    assert result["data"][1]["id"] == "asst_abc456"
-    assert result["data"][1]["name"] == "My Assistant"
+    assert len(result.data) == 2
+    assert result.data[0].id == "asst_abc123"
+    assert result.data[0].name == "Coding Tutor"
+    assert result.data[1].id == "asst_abc456"
+    assert result.data[1].name == "My Assistant"
+
+    mock_openai_client.beta.assistants.list.assert_called_once_with()
+
+
+def test_list_assistants_with_pagination(mock_openai_client):
+    """Test that pagination parameters are forwarded."""
+    mock_openai_client.beta.assistants.list.reset_mock()
+    mock_openai_client.beta.assistants.list.return_value = SyncCursorPage[Assistant](
+        data=[], has_more=False
+    )
+
+    list_assistants(limit=50, order="asc", after="asst_abc123")
 
-    mock_openai_client.beta.assistants.list.assert_called_once()
+    mock_openai_client.beta.assistants.list.assert_called_once_with(
+        limit=50, order="asc", after="asst_abc123"
+    )
 
 
 def test_modify_assistant(mock_openai_client):
@@ -164,3 +190,260 @@ def test_delete_assistant(mock_openai_client):
     assert result["deleted"] is True
 
     mock_openai_client.beta.assistants.delete.assert_called_once_with("asst_abc123")
+
+
+def _make_assistants(count):
+    """Build Assistant objects with descending creation times."""
+    return [
+        Assistant(
+            id=f"asst_{i:03d}",
+            object="assistant",
+            created_at=1000 - i,
+            model="gpt-4o",
+            tools=[],
+        )
+        for i in range(count)
+    ]
+
+
+def _paged_list(assistants, limit):
+    """Emulate the cursor-paginated list endpoint."""
+
+    def list_page(limit=20, order="desc", after=NOT_GIVEN):
+        time.sleep(0.01)
+        items = assistants if order == "desc" else list(reversed(assistants))
+        start = 0
+        if after is not NOT_GIVEN:
+            start = [a.id for a in items].index(after) + 1
+        stop = start + limit
+        return SyncCursorPage[Assistant](
+            data=items[start:stop], has_more=stop < len(items)
+        )
+
+    return list_page
+
+
+@pytest.fixture
+def assistant_cache(monkeypatch):
+    """Fixture providing an enabled, empty assistant cache."""
+    cache = TTLCache("assistants", max_entries=1000, ttl_seconds=60)
+    monkeypatch.setattr("src.tools.assistant.tools.assistant_cache", cache)
+    monkeypatch.setattr("src.tools.assistant.tools._assistant_index_removals", None)
+    return cache
+
+
+def test_warm_assistant_cache(mock_openai_client, assistant_cache):
+    """Test that warm-up pages through every assistant from both ends."""
+    assistants = _make_assistants(450)
+    mock_openai_client.beta.assistants.list.reset_mock()
+    mock_openai_client.beta.assistants.list.side_effect = _paged_list(assistants, 100)
+
+    count = warm_assistant_cache()
+
+    assert count == 450
+    assert len(assistant_cache) == 450
+    # Each scan covers half the list, so neither needs the 5 serial round trips
+    orders = [
+        call.kwargs["order"]
+        for call in mock_openai_client.beta.assistants.list.call_args_list
+    ]
+    assert orders.count("desc") <= 3
+    assert orders.count("asc") <= 3
+    mock_openai_client.beta.assistants.list.side_effect = None
+
+
+def test_list_assistants_served_from_warm_cache(mock_openai_client, assistant_cache):
+    """Test that list_assistants does not call upstream once the cache is warm."""
+    assistants = _make_assistants(30)
+    mock_openai_client.beta.assistants.list.side_effect = _paged_list(assistants, 100)
+    warm_assistant_cache()
+    mock_openai_client.beta.assistants.list.reset_mock()
+    mock_openai_client.beta.assistants.list.side_effect = None
+
+    result = list_assistants()
+
+    assert [a.id for a in result.data] == [a.id for a in assistants[:20]]
+    assert result.has_more is True
+    mock_openai_client.beta.assistants.list.assert_not_called()
+
+
+def test_get_assistant_served_from_cache(mock_openai_client, assistant_cache):
+    """Test that a cached assistant is returned without an API call."""
+    assistant = _make_assistants(1)[0]
+    assistant_cache.set(assistant.id, assistant)
+    mock_openai_client.beta.assistants.retrieve.reset_mock()
+
+    result = get_assistant(assistant.id)
+
+    assert result is assistant
+    mock_openai_client.beta.assistants.retrieve.assert_not_called()
+
+
+def test_modify_assistant_sends_only_changed_fields(
+    mock_openai_client, assistant_cache
+):
+    """Test that fields matching the cached assistant are not resent."""
+    assistant = _make_assistants(1)[0].model_copy(
+        update={"instructions": "x" * 1000, "name": "Old"}
+    )
+    assistant_cache.set(assistant.id, assistant)
+    mock_openai_client.beta.assistants.update.reset_mock()
+    mock_openai_client.beta.assistants.update.return_value = assistant.model_copy(
+        update={"name": "New"}
+    )
+    reset_metrics()
+
+    modify_assistant(assistant.id, name="New", instructions="x" * 1000)
+
+    mock_openai_client.beta.assistants.update.assert_called_once_with(
+        assistant.id, name="New"
+    )
+    assert get_metrics()["assistant_modify.bytes_saved"] > 1000
+
+
+def test_modify_assistant_skips_unchanged(mock_openai_client, assistant_cache):
+    """Test that the upstream call is skipped when nothing changed."""
+    assistant = _make_assistants(1)[0].model_copy(update={"instructions": "Same"})
+    assistant_cache.set(assistant.id, assistant)
+    mock_openai_client.beta.assistants.update.reset_mock()
+    reset_metrics()
+
+    result = modify_assistant(assistant.id, instructions="Same", model="gpt-4o")
+
+    assert result is assistant
+    mock_openai_client.beta.assistants.update.assert_not_called()
+    assert get_metrics()["assistant_modify.calls_skipped"] == 1
+
+
+def test_modify_assistant_ignores_server_tool_defaults(
+    mock_openai_client, assistant_cache
+):
+    """Test that tools equal up to server-filled defaults are not resent."""
+    parameters = {"type": "object", "properties": {}}
+    assistant = Assistant.model_validate(
+        {
+            **_make_assistants(1)[0].model_dump(),
+            "tools": [
+                {
+                    "type": "file_search",
+                    "file_search": {
+                        "ranking_options": {
+                            "ranker": "default_2024_08_21",
+                            "score_threshold": 0.0,
+                        }
+                    },
+                },
+                {
+                    "type": "function",
+                    "function": {
+                        "name": "f",
+                        "parameters": parameters,
+                        "strict": False,
+                    },
+                },
+            ],
+        }
+    )
+    assistant_cache.set(assistant.id, assistant)
+    mock_openai_client.beta.assistants.update.reset_mock()
+    mock_openai_client.beta.assistants.update.return_value = assistant
+    tools = [
+        {"type": "file_search"},
+        {"type": "function", "function": {"name": "f", "parameters": parameters}},
+    ]
+
+    result = modify_assistant(assistant.id, tools=tools)
+
+    assert result is assistant
+    mock_openai_client.beta.assistants.update.assert_not_called()
+
+    modify_assistant(
+        assistant.id,
+        tools=[
+            {
+                "type": "file_search",
+                "file_search": {"ranking_options": {"score_threshold": 0.5}},
+            }
+        ],
+    )
+
+    mock_openai_client.beta.assistants.update.assert_called_once()
+
+
+def test_list_assistants_pages_from_warm_cache(mock_openai_client, assistant_cache):
+    """Test that cursors are applied to the cached assistant list."""
+    assistants = _make_assistants(30)
+    mock_openai_client.beta.assistants.list.side_effect = _paged_list(assistants, 100)
+    warm_assistant_cache()
+    mock_openai_client.beta.assistants.list.reset_mock()
+    mock_openai_client.beta.assistants.list.side_effect = None
+
+    after_page = list_assistants(limit=5, after="asst_009")
+    before_page = list_assistants(limit=5, before="asst_009")
+    asc_page = list_assistants(limit=5, order="asc")
+
+    assert [a.id for a in after_page.data] == [f"asst_{i:03d}" for i in range(10, 15)]
+    assert after_page.has_more is True
+    assert [a.id for a in before_page.data] == [f"asst_{i:03d}" for i in range(4, 9)]
+    assert before_page.has_more is True
+    assert asc_page.data[0].id == "asst_029"
+    mock_openai_client.beta.assistants.list.assert_not_called()
+
+
+async def test_list_all_assistants(mock_openai_client):
+    """Test that all assistants are listed at the maximum page size."""
+    assistants = _make_assistants(250)
+    mock_openai_client.beta.assistants.list.reset_mock()
+    mock_openai_client.beta.assistants.list.side_effect = _paged_list(assistants, 100)
+    counts = []
+
+    async def on_page(page, count):
+        counts.append(count)
+
+    result = await list_all_assistants(on_page=on_page)
+
+    assert len(result.data) == 250
+    assert result.has_more is False
+    assert counts == [100, 200, 250]
+    for call in mock_openai_client.beta.assistants.list.call_args_list:
+        assert call.kwargs["limit"] == 100
+    mock_openai_client.beta.assistants.list.side_effect = None
+
+
+def test_delete_assistants_evicts_cache(mock_openai_client, assistant_cache):
+    """Test bulk deletion with per-ID outcomes and cache eviction."""
+    for assistant in _make_assistants(2):
+        assistant_cache.set(assistant.id, assistant)
+
+    def delete(assistant_id):
+        if assistant_id == "asst_missing":
+            raise RuntimeError("No assistant found")
+        return {"id": assistant_id, "deleted": True}
+
+    mock_openai_client.beta.assistants.delete.side_effect = delete
+
+    result = delete_assistants(["asst_000", "asst_missing", "asst_001"])
+
+    assert [item.status for item in result.items] == [
+        "succeeded",
+        "failed",
+        "succeeded",
+    ]
+    assert result.items[1].error == "No assistant found"
+    assert len(assistant_cache) == 0
+
+
+def test_get_assistants_serves_cached(mock_openai_client, assistant_cache):
+    """Test that cached assistants are not fetched again."""
+    cached, missing = _make_assistants(2)
+    assistant_cache.set(cached.id, cached)
+    mock_openai_client.beta.assistants.retrieve.return_value = missing
+
+    result = get_assistants([missing.id, cached.id, missing.id])
+
+    assert [item.result.id for item in result.items] == [
+        missing.id,
+        cached.id,
+        missing.id,
+    ]
+    mock_openai_client.beta.assistants.retrieve.assert_called_once_with(missing.id)
@@ -0,0 +1 @@
+"""Cache tools tests."""
@@ -0,0 +1,54 @@
+"""Tests for cache introspection and control tools."""
+import pytest
+
+from src.cache import register_cache
+from src.tools.cache.tools import flush_caches, get_cache_stats, invalidate_cache
+
+
+@pytest.fixture
+def cache():
+    """Fixture providing a registered cache with a few entries."""
+    cache = register_cache("test_tools", max_entries=10, ttl_seconds=60)
+    cache.set("asst_1", {"id": "asst_1"})
+    cache.set("asst_2", {"id": "asst_2"})
+    cache.set("thread_1", {"id": "thread_1"})
+    cache.get("asst_1")
+    cache.get("missing")
+    return cache
+
+
+def test_get_cache_stats(cache):
+    """Test reporting stats for a single cache."""
+    result = get_cache_stats("test_tools")
+
+    stats = result["caches"]["test_tools"]
+    assert stats["entries"] == 3
+    assert stats["bytes"] > 0
+    assert stats["hit_rate"] == 0.5
+    assert set(stats["age_seconds"]) == {"min", "p50", "p90", "max"}
+    assert "metrics" in result
+
+
+def test_invalidate_cache_by_id_and_prefix(cache):
+    """Test invalidating entries by object ID and by prefix."""
+    assert invalidate_cache("test_tools", object_id="thread_1")["invalidated"] == 1
+    assert invalidate_cache("test_tools", prefix="asst_")["invalidated"] == 2
+    assert len(cache) == 0
+
+
+def test_invalidate_cache_requires_target(cache):
+    """Test that invalidation without an ID or prefix is rejected."""
+    with pytest.raises(ValueError):
+        invalidate_cache("test_tools")
+
+
+def test_flush_caches(cache):
+    """Test flushing a cache."""
+    assert flush_caches("test_tools") == {"test_tools": 3}
+    assert len(cache) == 0
+
+
+def test_unknown_cache():
+    """Test that unknown cache names are rejected."""
+    with pytest.raises(ValueError):
+        get_cache_stats("missing")
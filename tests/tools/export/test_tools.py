@@ -0,0 +1,124 @@
+"""Tests for thread export tools."""
+import gzip
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+from openai.pagination import SyncCursorPage
+
+from src.tools.export import export_thread, export_threads
+
+
+def _item(object_id):
+    """Build a minimal API object."""
+    item = Mock(id=object_id)
+    item.model_dump.return_value = {"id": object_id}
+    return item
+
+
+def _lister(pages):
+    """Build a list function returning ``pages`` in turn."""
+    return Mock(
+        side_effect=[
+            SyncCursorPage(data=[_item(i) for i in ids], has_more=more)
+            for ids, more in pages
+        ]
+    )
+
+
+@pytest.fixture(autouse=True)
+def export_dir(tmp_path):
+    """Fixture confining exports to the test's temporary directory."""
+    with patch("src.tools.paths.settings.EXPORT_DIR", str(tmp_path)):
+        yield tmp_path
+
+
+@pytest.fixture
+def api():
+    """Fixture patching the list and get tools used by the export."""
+    with patch("src.tools.export.tools.get_thread") as get_thread, patch(
+        "src.tools.export.tools.list_messages",
+        _lister([(["msg_1", "msg_2"], True), (["msg_3"], False)]),
+    ) as list_messages, patch(
+        "src.tools.export.tools.list_runs", _lister([(["run_1"], False)])
+    ), patch(
+        "src.tools.export.tools.list_run_steps", _lister([(["step_1"], False)])
+    ) as list_run_steps:
+        get_thread.side_effect = _item
+        yield list_messages, list_run_steps
+
+
+def test_export_thread_gzip(api, tmp_path):
+    """Test exporting every record of a thread to gzip JSONL."""
+    list_messages, list_run_steps = api
+    output_path = tmp_path / "thread.jsonl.gz"
+
+    result = export_thread("thread_abc123", str(output_path))
+
+    with gzip.open(output_path, "rt") as output:
+        records = [json.loads(line) for line in output]
+    assert [(r["type"], r["data"]["id"]) for r in records] == [
+        ("thread", "thread_abc123"),
+        ("message", "msg_1"),
+        ("message", "msg_2"),
+        ("message", "msg_3"),
+        ("run", "run_1"),
+        ("run_step", "step_1"),
+    ]
+    assert (result["messages"], result["runs"], result["run_steps"]) == (3, 1, 1)
+    assert list_messages.call_args_list[1].kwargs == {
+        "order": "asc",
+        "limit": 100,
+        "after": "msg_2",
+        "thread_id": "thread_abc123",
+    }
+    assert list_run_steps.call_args.kwargs["include"] == [
+        "step_details.tool_calls[*].file_search.results[*].content"
+    ]
+
+
+def test_failed_export_leaves_no_file(api, tmp_path):
+    """Test that a failed export removes its partial file."""
+    list_messages, _ = api
+    list_messages.side_effect = RuntimeError("boom")
+
+    result = export_threads(["thread_abc123"], str(tmp_path), compress=False)
+
+    assert result.items[0].status == "failed"
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.parametrize(
+    "output_path", ["../escape.jsonl", "/etc/passwd", "a/../../escape.jsonl", "."]
+)
+def test_export_thread_rejects_paths_outside_export_dir(api, output_path):
+    """Test that output paths cannot leave EXPORT_DIR."""
+    with pytest.raises(ValueError, match="outside the export directory"):
+        export_thread("thread_abc123", output_path)
+
+
+def test_export_thread_rejects_symlink_out_of_export_dir(
+    api, export_dir, tmp_path_factory
+):
+    """Test that a symlink inside EXPORT_DIR cannot redirect the export."""
+    outside = tmp_path_factory.mktemp("outside")
+    (export_dir / "link").symlink_to(outside, target_is_directory=True)
+
+    with pytest.raises(ValueError, match="outside the export directory"):
+        export_thread("thread_abc123", "link/thread.jsonl")
+    assert list(outside.iterdir()) == []
+
+
+def test_export_threads_relative_dir(api, export_dir):
+    """Test that output_dir is resolved inside EXPORT_DIR."""
+    result = export_threads(["thread_abc123"], "archive", compress=False)
+
+    assert result.items[0].status == "succeeded"
+    assert (export_dir / "archive" / "thread_abc123.jsonl").exists()
+
+
+@pytest.mark.parametrize("thread_id", ["../thread_abc123", "thread/abc", ""])
+def test_export_threads_rejects_bad_thread_ids(api, thread_id):
+    """Test that thread IDs that are not plain IDs are rejected."""
+    with pytest.raises(ValueError, match="Invalid object ID"):
+        export_threads([thread_id], ".")
@@ -1,15 +1,24 @@
 """Tests for OpenAI Message API tools implementation."""
-from unittest.mock import Mock, patch
+import json
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
+from openai._utils import maybe_transform
+from openai.pagination import SyncCursorPage
+from openai.types.beta.threads import MessageCreateParams
+from openai.types.beta.threads.message import Message
 
 # Mock OpenAI before importing any modules that use it
 mock_openai = Mock()
 with patch("openai.OpenAI", return_value=mock_openai):
+    from src.tools.messages.models import BatchMessage, MessageAttachment
     from src.tools.messages.tools import (
+        batch_create_messages,
+        compact_message,
         create_message,
         delete_message,
         get_message,
+        iter_thread_messages,
         list_messages,
         modify_message,
     )
@@ -150,6 +159,50 @@ def test_create_message(mock_openai_client):
     )
 
 
+def test_create_message_passes_validated_models(mock_openai_client):
+    """Test that validated attachments are sent without being dumped again."""
+    mock_openai_client.beta.threads.messages.create.return_value = EXAMPLE_MESSAGE
+
+    create_message(
+        thread_id="thread_abc123",
+        role="user",
+        content="Summarize this file",
+        attachments=[{"file_id": "file_abc123", "tools": [{"type": "file_search"}]}],
+    )
+
+    kwargs = mock_openai_client.beta.threads.messages.create.call_args.kwargs
+    assert set(kwargs) == {"thread_id", "role", "content", "attachments"}
+    assert isinstance(kwargs["attachments"][0], MessageAttachment)
+    assert kwargs["attachments"][0].file_id == "file_abc123"
+
+
+def test_create_message_omits_nested_nulls(mock_openai_client):
+    """Test that nested fields set to None are left out of the request body."""
+    mock_openai_client.beta.threads.messages.create.return_value = EXAMPLE_MESSAGE
+
+    create_message(
+        thread_id="thread_abc123",
+        role="user",
+        content=[
+            {"type": "text", "text": {"value": "What is in this image?"}},
+            {
+                "type": "image_file",
+                "image_file": {"file_id": "file_img", "detail": None},
+            },
+        ],
+        attachments=[{"file_id": "file_abc123", "tools": None}],
+    )
+
+    kwargs = mock_openai_client.beta.threads.messages.create.call_args.kwargs
+    kwargs.pop("thread_id")
+    body = maybe_transform(kwargs, MessageCreateParams)
+    assert body["attachments"] == [{"file_id": "file_abc123"}]
+    assert body["content"][1] == {
+        "type": "image_file",
+        "image_file": {"file_id": "file_img"},
+    }
+
+
 def test_list_messages(mock_openai_client):
     """Test listing messages."""
     mock_openai_client.beta.threads.messages.list.return_value = EXAMPLE_MESSAGE_LIST
@@ -236,3 +289,119 @@ def test_delete_message(mock_openai_client):
         thread_id="thread_abc123",
         message_id="msg_abc123",
     )
+
+
+async def test_iter_thread_messages_writes_jsonl(mock_openai_client, tmp_path):
+    """Test streaming a thread page by page into a JSONL file."""
+    messages = [Message(**m, status="completed") for m in EXAMPLE_MESSAGE_LIST["data"]]
+    mock_openai_client.beta.threads.messages.list.side_effect = [
+        SyncCursorPage[Message](data=messages[:1], has_more=True),
+        SyncCursorPage[Message](data=messages[1:], has_more=False),
+    ]
+    on_chunk = AsyncMock()
+    output_path = tmp_path / "thread.jsonl"
+
+    with patch("src.tools.paths.settings.EXPORT_DIR", str(tmp_path)):
+        result = await iter_thread_messages(
+            thread_id="thread_abc123", output_path="thread.jsonl", on_chunk=on_chunk
+        )
+
+    assert result["messages"] == 2
+    assert result["pages"] == 2
+    lines = [json.loads(line) for line in output_path.read_text().splitlines()]
+    assert [line["id"] for line in lines] == ["msg_abc123", "msg_abc456"]
+    assert lines[0]["content"] == messages[0].content[0].text.value
+    assert on_chunk.await_count == 2
+    assert on_chunk.await_args.args[1] == 2
+    mock_openai_client.beta.threads.messages.list.assert_called_with(
+        thread_id="thread_abc123", limit=100, order="asc", after="msg_abc123"
+    )
+
+
+async def test_iter_thread_messages_rejects_path_outside_export_dir(
+    mock_openai_client, tmp_path
+):
+    """Test that output_path cannot leave EXPORT_DIR."""
+    target = tmp_path / "victim.txt"
+    target.write_text("keep")
+
+    with patch("src.tools.paths.settings.EXPORT_DIR", str(tmp_path / "exports")):
+        with pytest.raises(ValueError, match="outside the export directory"):
+            await iter_thread_messages(
+                thread_id="thread_abc123", output_path="../victim.txt"
+            )
+
+    assert target.read_text() == "keep"
+    mock_openai_client.beta.threads.messages.list.assert_not_called()
+
+
+def test_batch_create_messages(mock_openai_client):
+    """Test creating messages across threads with a partial failure."""
+    created = []
+
+    def create(thread_id, **kwargs):
+        if kwargs["content"] == "fail":
+            raise RuntimeError("rate limited")
+        created.append((thread_id, kwargs["content"]))
+        return {"id": f"msg_{len(created)}", "thread_id": thread_id}
+
+    mock_openai_client.beta.threads.messages.create.side_effect = create
+    messages = [
+        BatchMessage(thread_id="thread_a", role="user", content="a1"),
+        BatchMessage(thread_id="thread_b", role="user", content="fail"),
+        BatchMessage(thread_id="thread_a", role="assistant", content="a2"),
+        BatchMessage(thread_id="thread_b", role="user", content="b2"),
+    ]
+
+    result = batch_create_messages(messages)
+
+    assert [item.status for item in result.items] == [
+        "succeeded",
+        "failed",
+        "succeeded",
+        "skipped",
+    ]
+    assert result.items[1].error == "rate limited"
+    assert [c for c in created if c[0] == "thread_a"] == [
+        ("thread_a", "a1"),
+        ("thread_a", "a2"),
+    ]
+    assert ("thread_b", "b2") not in created
+
+
+def test_compact_message_citations_with_drifted_indices():
+    """Test that citation markers fall back to the annotation text."""
+    message = Message.model_validate(
+        {
+            **EXAMPLE_MESSAGE,
+            "status": "completed",
+            "content": [
+                {
+                    "type": "text",
+                    "text": {
+                        "value": "A【1†a】 and B【2†b】 and A again【3†a】",
+                        "annotations": [
+                            {
+                                "type": "file_citation",
+                                "text": text,
+                                "start_index": 0,
+                                "end_index": 5,
+                                "file_citation": {"file_id": file_id},
+                            }
+                            for text, file_id in [
+                                ("【1†a】", "file_a"),
+                                ("【2†b】", "file_b"),
+                                ("【3†a】", "file_a"),
+                            ]
+                        ],
+                    },
+                }
+            ],
+        }
+    )
+
+    result = compact_message(message, citations=True)
+
+    assert result["content"] == (
+        "A[1] and B[2] and A again[1]\n\n[1] file_a\n[2] file_b"
+    )
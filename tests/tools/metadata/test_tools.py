@@ -0,0 +1,133 @@
+"""Tests for bulk metadata patch tools."""
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+from openai.types.beta.threads.message import Message
+
+from src.cache import TTLCache
+from src.mirror import ThreadTranscript
+from src.tools.metadata import MetadataTarget, merge_metadata, patch_metadata
+
+
+@pytest.fixture
+def threads():
+    """Fixture patching the thread tools used by patch_metadata."""
+    with patch("src.tools.metadata.tools.get_thread") as get_thread, patch(
+        "src.tools.metadata.tools.modify_thread"
+    ) as modify_thread:
+        modify_thread.side_effect = lambda thread_id, metadata: Mock(
+            id=thread_id, metadata=metadata
+        )
+        yield get_thread, modify_thread
+
+
+def test_merge_metadata():
+    """Test that patches set keys and None removes them."""
+    merged = merge_metadata({"a": "1", "b": "2"}, {"b": None, "c": "3"})
+
+    assert merged == {"a": "1", "c": "3"}
+
+
+def test_patch_metadata_merges_existing_keys(threads):
+    """Test that existing keys are kept and unchanged objects are skipped."""
+    get_thread, modify_thread = threads
+    get_thread.side_effect = lambda thread_id: Mock(
+        id=thread_id,
+        metadata={"team": "eval", "reviewed": "true"}
+        if thread_id == "thread_done"
+        else {"team": "eval"},
+    )
+    targets = [
+        MetadataTarget(thread_id="thread_new"),
+        MetadataTarget(thread_id="thread_done"),
+    ]
+
+    result = patch_metadata("thread", targets, {"reviewed": "true"})
+
+    assert result.succeeded == 2
+    modify_thread.assert_called_once_with(
+        "thread_new", metadata={"team": "eval", "reviewed": "true"}
+    )
+
+
+def test_patch_metadata_checks_limits_before_requests(threads):
+    """Test that an oversized patch is rejected without any request."""
+    get_thread, modify_thread = threads
+
+    with pytest.raises(ValueError, match="17 pairs"):
+        patch_metadata(
+            "thread",
+            [MetadataTarget(thread_id="thread_a")],
+            {f"key_{i}": "x" for i in range(17)},
+        )
+
+    get_thread.assert_not_called()
+    modify_thread.assert_not_called()
+
+
+def test_patch_metadata_fails_item_over_pair_limit(threads):
+    """Test that a target whose merged metadata is too large is not updated."""
+    get_thread, modify_thread = threads
+    get_thread.return_value = Mock(metadata={f"key_{i}": "x" for i in range(16)})
+
+    result = patch_metadata(
+        "thread", [MetadataTarget(thread_id="thread_a")], {"reviewed": "true"}
+    )
+
+    assert result.items[0].status == "failed"
+    assert "17 pairs" in result.items[0].error
+    modify_thread.assert_not_called()
+
+
+def test_patch_metadata_requires_object_id():
+    """Test that messages and runs need an object ID."""
+    with pytest.raises(ValueError, match="object_id is required"):
+        patch_metadata("run", [MetadataTarget(thread_id="thread_a")], {"a": "b"})
+
+
+def _message(message_id, status, metadata):
+    """Build a mirrored message in the given status."""
+    return Message.model_construct(
+        id=message_id, object="thread.message", status=status, metadata=metadata
+    )
+
+
+@pytest.mark.parametrize(
+    "status, synced_ago, fetched",
+    [
+        ("completed", 3600, False),
+        ("in_progress", 1, False),
+        ("in_progress", 3600, True),
+    ],
+)
+def test_patch_metadata_trusts_only_settled_or_fresh_mirror(
+    monkeypatch, status, synced_ago, fetched
+):
+    """Test that stale mirrored copies of changing objects are re-fetched."""
+    transcript = ThreadTranscript(
+        thread_id="thread_abc123", synced_at=time.time() - synced_ago
+    )
+    transcript.put(
+        transcript.messages, _message("msg_abc123", status, {"team": "eval"})
+    )
+    cache = TTLCache("thread_mirror", max_entries=10, ttl_seconds=0)
+    cache.set("thread_abc123", transcript)
+    monkeypatch.setattr("src.mirror.store.thread_mirror", cache)
+    monkeypatch.setattr("src.tools.metadata.tools.thread_mirror", cache)
+    fetched_message = _message("msg_abc123", "completed", {"team": "ops"})
+
+    with patch(
+        "src.tools.metadata.tools.get_message", return_value=fetched_message
+    ) as get_message, patch("src.tools.metadata.tools.modify_message") as modify:
+        patch_metadata(
+            "message",
+            [MetadataTarget(thread_id="thread_abc123", object_id="msg_abc123")],
+            {"reviewed": "true"},
+        )
+
+    assert get_message.called is fetched
+    team = "ops" if fetched else "eval"
+    modify.assert_called_once_with(
+        "thread_abc123", "msg_abc123", metadata={"team": team, "reviewed": "true"}
+    )
@@ -3,12 +3,18 @@ from unittest.mock import Mock, patch
 
 import pytest
 from openai import NOT_GIVEN
+from openai.pagination import SyncCursorPage
+from openai.types.beta.threads.runs.run_step import RunStep
+
+from src.cache import TTLCache
 
 # Mock OpenAI before importing any modules that use it
 mock_openai = Mock()
 with patch("openai.OpenAI", return_value=mock_openai):
     from src.tools.run_steps.tools import get_run_step, list_run_steps
 
+CONTENT_INCLUDE = "step_details.tool_calls[*].file_search.results[*].content"
+
 # Example responses from OpenAI API documentation
 EXAMPLE_RUN_STEP = {
     "id": "step_abc123",
@@ -173,3 +179,119 @@ def test_get_run_step_with_include(mock_openai_client):
         step_id="step_abc123",
         include=["step_details.tool_calls[*].file_search.results[*].content"],
     )
+
+
+def _file_search_step(step_id, content):
+    """Build a completed file_search run step with optional result content."""
+    result = {"file_id": "file_abc123", "file_name": "doc.txt", "score": 0.9}
+    if content is not None:
+        result["content"] = [{"type": "text", "text": content}]
+    return RunStep.model_validate(
+        {
+            **EXAMPLE_RUN_STEP,
+            "id": step_id,
+            "type": "tool_calls",
+            "step_details": {
+                "type": "tool_calls",
+                "tool_calls": [
+                    {
+                        "id": "call_abc123",
+                        "type": "file_search",
+                        "file_search": {"results": [result]},
+                    }
+                ],
+            },
+        }
+    )
+
+
+@pytest.fixture
+def content_cache(monkeypatch):
+    """Fixture providing an enabled, empty run step content cache."""
+    cache = TTLCache("run_step_content", max_entries=100, ttl_seconds=60)
+    runs = TTLCache("run_step_content_runs", max_entries=100, ttl_seconds=60)
+    monkeypatch.setattr("src.tools.run_steps.tools.run_step_content_cache", cache)
+    monkeypatch.setattr("src.tools.run_steps.tools.run_step_content_runs", runs)
+    return cache
+
+
+def test_get_run_step_content_cached(mock_openai_client, content_cache):
+    """Test that file_search content is cached compressed and reused."""
+    step = _file_search_step("step_fs1", "chunk " * 1000)
+    mock_openai_client.beta.threads.runs.steps.retrieve.return_value = step
+
+    first = get_run_step(
+        "thread_abc123", "run_abc123", "step_fs1", include=[CONTENT_INCLUDE]
+    )
+    second = get_run_step(
+        "thread_abc123", "run_abc123", "step_fs1", include=[CONTENT_INCLUDE]
+    )
+
+    assert second == first
+    mock_openai_client.beta.threads.runs.steps.retrieve.assert_called_once()
+    assert content_cache.stats()["bytes"] < len(step.model_dump_json())
+
+
+def test_list_run_steps_content_from_cache(mock_openai_client, content_cache):
+    """Test that a listing with content is served from a light page and cache."""
+    full = _file_search_step("step_fs1", "chunk")
+    light = _file_search_step("step_fs1", None)
+    steps = mock_openai_client.beta.threads.runs.steps
+    steps.list.return_value = SyncCursorPage[RunStep](data=[full], has_more=False)
+    list_run_steps("thread_abc123", "run_abc123", include=[CONTENT_INCLUDE])
+    steps.list.reset_mock()
+    steps.list.return_value = SyncCursorPage[RunStep](data=[light], has_more=False)
+
+    result = list_run_steps("thread_abc123", "run_abc123", include=[CONTENT_INCLUDE])
+
+    assert result.data[0] == full
+    assert steps.list.call_args.kwargs["include"] is NOT_GIVEN
+    steps.list.assert_called_once()
+
+
+def test_list_run_steps_content_first_listing(mock_openai_client, content_cache):
+    """Test that a run with nothing cached is listed once, with content."""
+    full = _file_search_step("step_fs1", "chunk")
+    steps = mock_openai_client.beta.threads.runs.steps
+    steps.list.reset_mock()
+    steps.list.return_value = SyncCursorPage[RunStep](data=[full], has_more=False)
+
+    result = list_run_steps("thread_abc123", "run_abc123", include=[CONTENT_INCLUDE])
+
+    assert result.data[0] == full
+    steps.list.assert_called_once()
+    assert steps.list.call_args.kwargs["include"] == [CONTENT_INCLUDE]
+
+
+def test_list_run_steps_content_refills_missing(mock_openai_client, content_cache):
+    """Test that a page with an uncached step is listed once more with content."""
+    cached, missing = (
+        _file_search_step(step_id, "chunk") for step_id in ("step_fs1", "step_fs2")
+    )
+    steps = mock_openai_client.beta.threads.runs.steps
+    steps.list.return_value = SyncCursorPage[RunStep](data=[cached], has_more=False)
+    list_run_steps("thread_abc123", "run_abc123", include=[CONTENT_INCLUDE])
+    steps.list.reset_mock()
+    steps.retrieve.reset_mock()
+    light = SyncCursorPage[RunStep](
+        data=[_file_search_step("step_fs1", None), _file_search_step("step_fs2", None)],
+        has_more=False,
+    )
+    full = SyncCursorPage[RunStep](data=[cached, missing], has_more=False)
+    steps.list.side_effect = [light, full]
+
+    try:
+        result = list_run_steps(
+            "thread_abc123", "run_abc123", include=[CONTENT_INCLUDE]
+        )
+    finally:
+        steps.list.side_effect = None
+
+    assert result.data == [cached, missing]
+    assert [call.kwargs["include"] for call in steps.list.call_args_list] == [
+        NOT_GIVEN,
+        [CONTENT_INCLUDE],
+    ]
+    steps.retrieve.assert_not_called()
+    assert "step_fs2" in content_cache
+    assert "run_abc123" not in content_cache
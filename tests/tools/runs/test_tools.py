@@ -1,7 +1,11 @@
 """Tests for OpenAI Run API tools implementation."""
-from unittest.mock import Mock, patch
+import time
+from unittest.mock import AsyncMock, Mock, patch
 
+import anyio
 import pytest
+from openai.types.beta.threads.run import Run
+from pydantic import ValidationError
 
 # Mock OpenAI before importing any modules that use it
 mock_openai = Mock()
@@ -11,8 +15,10 @@ with patch("openai.OpenAI", return_value=mock_openai):
         cancel_run,
         create_run,
         create_thread_and_run,
+        fan_out_runs,
         get_run,
         list_runs,
+        list_runs_raw,
         modify_run,
         submit_tool_outputs,
     )
@@ -336,6 +342,18 @@ def test_list_runs(mock_openai_client):
     )
 
 
+def test_list_runs_raw(mock_openai_client):
+    """Test listing runs as the raw response body."""
+    raw_list = mock_openai_client.beta.threads.runs.with_raw_response.list
+    raw_list.return_value.text = '{"object": "list", "data": []}'
+
+    result = list_runs_raw(thread_id="thread_abc123", limit=2)
+
+    assert result == '{"object": "list", "data": []}'
+    raw_list.assert_called_once_with(thread_id="thread_abc123", limit=2)
+    mock_openai_client.beta.threads.runs.list.assert_not_called()
+
+
 def test_get_run(mock_openai_client):
     """Test retrieving a run."""
     mock_openai_client.beta.threads.runs.retrieve.return_value = EXAMPLE_RUN
@@ -428,3 +446,141 @@ def test_cancel_run(mock_openai_client):
         thread_id="thread_abc123",
         run_id="run_abc123",
     )
+
+
+async def test_fan_out_runs(mock_openai_client):
+    """Test fanning out runs with a shared poller and aggregated usage."""
+    completed = {**EXAMPLE_RUN, "instructions": ""}
+    queued = {**completed, "status": "queued", "completed_at": None, "usage": None}
+
+    def create(thread_id, **kwargs):
+        if thread_id == "thread_bad":
+            raise RuntimeError("thread has an active run")
+        return Run(**{**queued, "id": f"run_{thread_id}", "thread_id": thread_id})
+
+    def retrieve(thread_id, run_id):
+        return Run(**{**completed, "id": run_id, "thread_id": thread_id})
+
+    mock_openai_client.beta.threads.runs.create.side_effect = create
+    mock_openai_client.beta.threads.runs.retrieve.side_effect = retrieve
+    on_complete = AsyncMock()
+
+    result = await fan_out_runs(
+        assistant_id="asst_abc123",
+        thread_ids=["thread_a", "thread_bad", "thread_b"],
+        max_concurrency=2,
+        poll_interval=0.01,
+        on_complete=on_complete,
+    )
+
+    assert result["status_counts"] == {"completed": 2, "not_started": 1}
+    assert [r["thread_id"] for r in result["results"]] == [
+        "thread_a",
+        "thread_bad",
+        "thread_b",
+    ]
+    assert result["usage"]["total_tokens"] == 2 * EXAMPLE_RUN["usage"]["total_tokens"]
+    assert result["results"][0]["duration_seconds"] == 1.0
+    assert on_complete.await_count == 3
+    assert on_complete.await_args.args[1] == 3
+
+
+async def test_fan_out_runs_gives_up_on_failing_polls(mock_openai_client):
+    """Test that a run whose polls keep failing is settled as poll_failed."""
+    queued = {**EXAMPLE_RUN, "instructions": "", "status": "queued"}
+    mock_openai_client.beta.threads.runs.create.side_effect = None
+    mock_openai_client.beta.threads.runs.create.return_value = Run(**queued)
+    mock_openai_client.beta.threads.runs.retrieve.side_effect = RuntimeError("502")
+
+    result = await fan_out_runs(
+        assistant_id="asst_abc123",
+        thread_ids=["thread_abc123"],
+        poll_interval=0.01,
+    )
+
+    assert result["status_counts"] == {"poll_failed": 1}
+    assert result["results"][0]["run_id"] == EXAMPLE_RUN["id"]
+    assert "502" in result["results"][0]["error"]
+    assert mock_openai_client.beta.threads.runs.retrieve.call_count == 5
+
+
+async def test_fan_out_runs_timeout(mock_openai_client):
+    """Test that runs still active or unstarted at the deadline are reported."""
+    queued = {**EXAMPLE_RUN, "instructions": "", "status": "queued"}
+
+    def create(thread_id, **kwargs):
+        return Run(**{**queued, "id": f"run_{thread_id}", "thread_id": thread_id})
+
+    mock_openai_client.beta.threads.runs.create.side_effect = create
+    mock_openai_client.beta.threads.runs.retrieve.return_value = Run(**queued)
+
+    result = await fan_out_runs(
+        assistant_id="asst_abc123",
+        thread_ids=["thread_a", "thread_b"],
+        max_concurrency=1,
+        poll_interval=0.01,
+        timeout=0.05,
+    )
+
+    assert result["status_counts"] == {"timed_out": 1, "not_started": 1}
+    assert result["results"][0]["run_id"] == "run_thread_a"
+    assert result["results"][1]["run_id"] is None
+    assert mock_openai_client.beta.threads.runs.create.call_count == 1
+
+
+async def test_fan_out_runs_timeout_waits_for_slow_create(mock_openai_client):
+    """Test that the poller waits for a create still running at the deadline."""
+    queued = {**EXAMPLE_RUN, "instructions": "", "status": "queued"}
+
+    def create(thread_id, **kwargs):
+        time.sleep(0.3)
+        return Run(**{**queued, "id": f"run_{thread_id}", "thread_id": thread_id})
+
+    mock_openai_client.beta.threads.runs.create.side_effect = create
+    mock_openai_client.beta.threads.runs.retrieve.return_value = Run(**queued)
+    sleep = AsyncMock(side_effect=anyio.sleep)
+
+    with patch("src.tools.runs.tools.anyio.sleep", sleep):
+        result = await fan_out_runs(
+            assistant_id="asst_abc123",
+            thread_ids=["thread_a"],
+            poll_interval=0.01,
+            timeout=0.05,
+        )
+
+    assert result["status_counts"] == {"timed_out": 1}
+    assert result["results"][0]["run_id"] == "run_thread_a"
+    assert sleep.await_count < 10
+
+
+def test_create_run_validates_dict_tools(mock_openai_client):
+    """Test that dict tools are validated against the discriminated union."""
+    mock_openai_client.beta.threads.runs.create.return_value = EXAMPLE_RUN
+
+    create_run(
+        thread_id="thread_abc123",
+        assistant_id="asst_abc123",
+        tools=[
+            {"type": "code_interpreter"},
+            {
+                "type": "function",
+                "function": {
+                    "name": "get_weather",
+                    "parameters": {
+                        "type": "object",
+                        "properties": {"city": {"type": "string"}},
+                    },
+                },
+            },
+        ],
+    )
+
+    tools = mock_openai_client.beta.threads.runs.create.call_args.kwargs["tools"]
+    assert [tool["type"] for tool in tools] == ["code_interpreter", "function"]
+
+    with pytest.raises(ValidationError):
+        create_run(
+            thread_id="thread_abc123",
+            assistant_id="asst_abc123",
+            tools=[{"type": "retrieval"}],
+        )
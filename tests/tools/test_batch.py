@@ -0,0 +1,98 @@
+"""Tests for the grouped batch runner."""
+import threading
+from unittest.mock import Mock
+
+import httpx
+from openai import RateLimitError
+
+from src.tools.batch import fetch_many, run_grouped
+
+
+def test_order_is_kept_within_groups():
+    """Test that items of a group run in request order."""
+    seen = []
+    lock = threading.Lock()
+    items = [("a", 1), ("b", 1), ("a", 2), ("b", 2), ("a", 3)]
+
+    def action(item):
+        with lock:
+            seen.append(item)
+        return item[1]
+
+    result = run_grouped(items, group=lambda item: item[0], action=action)
+
+    assert result.succeeded == 5
+    assert [item for item in seen if item[0] == "a"] == [("a", 1), ("a", 2), ("a", 3)]
+    assert [item for item in seen if item[0] == "b"] == [("b", 1), ("b", 2)]
+    assert [item.result for item in result.items] == [1, 1, 2, 2, 3]
+
+
+def test_failure_skips_rest_of_group():
+    """Test that a failure skips later items of its group only."""
+    items = [("a", 1), ("b", 1), ("a", 2), ("a", 3), ("b", 2)]
+
+    def action(item):
+        if item == ("a", 2):
+            raise RuntimeError("boom")
+        return item[1]
+
+    result = run_grouped(
+        items, group=lambda item: item[0], action=action, max_concurrency=2
+    )
+
+    assert (result.succeeded, result.failed, result.skipped) == (3, 1, 1)
+    assert [item.status for item in result.items] == [
+        "succeeded",
+        "succeeded",
+        "failed",
+        "skipped",
+        "succeeded",
+    ]
+    assert result.items[2].error == "boom"
+    assert result.items[3].group == "a"
+
+
+def test_rate_limited_item_is_retried(monkeypatch):
+    """Test that a 429 pauses the batch and the item is retried."""
+    sleeps = []
+    monkeypatch.setattr("src.tools.batch.time.sleep", sleeps.append)
+    request = httpx.Request("DELETE", "https://api.openai.com/v1/threads/t")
+    response = httpx.Response(429, headers={"retry-after": "2"}, request=request)
+    action = Mock(
+        side_effect=[RateLimitError("slow down", response=response, body=None), "ok"]
+    )
+
+    result = run_grouped(["thread_a"], group=lambda item: item, action=action)
+
+    assert result.items[0].status == "succeeded"
+    assert result.items[0].result == "ok"
+    assert action.call_count == 2
+    assert len(sleeps) == 1 and 1.9 < sleeps[0] <= 2
+
+
+def test_fetch_many_dedupes_and_uses_cache():
+    """Test that repeated and cached IDs are not fetched again."""
+    fetch = Mock(side_effect=lambda object_id: {"id": object_id})
+    cached = {"b": {"id": "b", "cached": True}}
+
+    result = fetch_many(["a", "b", "a", "c"], fetch=fetch, cached=cached.get)
+
+    assert [item.result["id"] for item in result.items] == ["a", "b", "a", "c"]
+    assert [item.index for item in result.items] == [0, 1, 2, 3]
+    assert result.items[1].result["cached"] is True
+    assert sorted(call.args[0] for call in fetch.call_args_list) == ["a", "c"]
+
+
+def test_fetch_many_reports_errors_per_id():
+    """Test that a failed ID does not hide the others."""
+
+    def fetch(object_id):
+        if object_id == "missing":
+            raise RuntimeError("not found")
+        return object_id
+
+    result = fetch_many(["missing", "a", "missing"], fetch=fetch)
+
+    assert [item.status for item in result.items] == ["failed", "succeeded", "failed"]
+    assert (result.succeeded, result.failed) == (1, 2)
+    assert result.items[2].error == "not found"
@@ -0,0 +1,47 @@
+"""Tests for cursor pagination over list endpoints."""
+from unittest.mock import Mock
+
+from openai.pagination import SyncCursorPage
+from openai.types.beta.threads.message import Message
+
+from src.tools.pagination import LIST_PAGE_LIMIT, iter_items, iter_pages
+
+
+def _lister(count, page_size):
+    """Build a list function paging over ``count`` messages."""
+    messages = [
+        Message.model_construct(id=f"msg_{i:03d}", object="thread.message")
+        for i in range(count)
+    ]
+
+    def list_page(limit, after=None, **params):
+        start = 0 if after is None else int(after[4:]) + 1
+        stop = start + page_size
+        return SyncCursorPage[Message](
+            data=messages[start:stop], has_more=stop < len(messages)
+        )
+
+    return Mock(side_effect=list_page)
+
+
+def test_iter_pages_follows_cursor():
+    """Test that pages are requested after the last ID of the previous page."""
+    list_fn = _lister(5, 2)
+
+    pages = list(iter_pages(list_fn, thread_id="thread_abc123", order="asc"))
+
+    assert [len(page.data) for page in pages] == [2, 2, 1]
+    assert [call.kwargs["after"] for call in list_fn.call_args_list] == [
+        None,
+        "msg_001",
+        "msg_003",
+    ]
+    assert list_fn.call_args.kwargs["limit"] == LIST_PAGE_LIMIT
+    assert list_fn.call_args.kwargs["thread_id"] == "thread_abc123"
+
+
+def test_iter_items_starts_after_cursor():
+    """Test that items are yielded from the given cursor onward."""
+    items = list(iter_items(_lister(5, 2), "msg_001"))
+
+    assert [item.id for item in items] == ["msg_002", "msg_003", "msg_004"]
@@ -0,0 +1,108 @@
+"""Tests for background prefetch of list pages."""
+import threading
+from unittest.mock import Mock
+
+import pytest
+from openai.pagination import SyncCursorPage
+from openai.types.beta.threads.message import Message
+
+from src.cache import TTLCache
+from src.tools import prefetch
+from src.tools.prefetch import fetch_page, invalidate_pages
+
+
+def _page(first, count, has_more):
+    """Build a page of messages with sequential IDs."""
+    return SyncCursorPage[Message](
+        data=[
+            Message.model_construct(id=f"msg_{i:03d}", object="thread.message")
+            for i in range(first, first + count)
+        ],
+        has_more=has_more,
+    )
+
+
+@pytest.fixture
+def prefetch_cache(monkeypatch):
+    """Fixture enabling prefetch with an empty page buffer."""
+    cache = TTLCache("list_prefetch", max_entries=4, ttl_seconds=30)
+    monkeypatch.setattr(prefetch, "prefetch_cache", cache)
+    monkeypatch.setattr(prefetch, "_inflight", {})
+    monkeypatch.setattr(prefetch, "_generations", {})
+    return cache
+
+
+def test_next_page_is_prefetched(prefetch_cache):
+    """Test that the follow-up call is served from the prefetched page."""
+    pages = {None: _page(0, 2, True), "msg_001": _page(2, 2, False)}
+    fetch = Mock(side_effect=lambda limit, after=None: pages[after])
+
+    first = fetch_page("messages", "thread_abc123", {"limit": 2}, fetch)
+    second = fetch_page(
+        "messages", "thread_abc123", {"limit": 2, "after": first.data[-1].id}, fetch
+    )
+
+    assert [m.id for m in second.data] == ["msg_002", "msg_003"]
+    assert fetch.call_count == 2
+    # The prefetched page is single-use
+    assert len(prefetch_cache) == 0
+
+
+def test_no_prefetch_when_disabled(monkeypatch):
+    """Test that nothing is fetched in the background when disabled."""
+    monkeypatch.setattr(
+        prefetch,
+        "prefetch_cache",
+        TTLCache("list_prefetch", max_entries=4, ttl_seconds=30, enabled=False),
+    )
+    fetch = Mock(return_value=_page(0, 2, True))
+
+    fetch_page("messages", "thread_abc123", {"limit": 2}, fetch)
+
+    fetch.assert_called_once_with(limit=2)
+
+
+def test_failed_prefetch_falls_back(prefetch_cache):
+    """Test that a failed background fetch is retried in the foreground."""
+    fetch = Mock(
+        side_effect=[_page(0, 2, True), RuntimeError("boom"), _page(2, 1, False)]
+    )
+
+    fetch_page("messages", "thread_abc123", {"limit": 2}, fetch)
+    result = fetch_page(
+        "messages", "thread_abc123", {"limit": 2, "after": "msg_001"}, fetch
+    )
+
+    assert [m.id for m in result.data] == ["msg_002"]
+    assert fetch.call_count == 3
+
+
+def test_invalidation_discards_inflight_page(prefetch_cache):
+    """Test that a page fetched across an invalidation is not served."""
+    started, release = threading.Event(), threading.Event()
+    stale, fresh = _page(2, 2, False), _page(2, 3, False)
+
+    def fetch(limit, after=None):
+        if after is None:
+            return _page(0, 2, True)
+        if fetch.prefetching:
+            fetch.prefetching = False
+            started.set()
+            release.wait(5)
+            return stale
+        return fresh
+
+    fetch.prefetching = True
+    fetch_page("messages", "thread_abc123", {"limit": 2}, fetch)
+    assert started.wait(5)
+    (future,) = prefetch._inflight.values()
+
+    invalidate_pages("messages", "thread_abc123")
+    release.set()
+    future.result(5)
+    result = fetch_page(
+        "messages", "thread_abc123", {"limit": 2, "after": "msg_001"}, fetch
+    )
+
+    assert result is fresh
+    assert len(prefetch_cache) == 0
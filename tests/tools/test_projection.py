@@ -0,0 +1,112 @@
+"""Tests for field projection and compaction of tool results."""
+from unittest.mock import patch
+
+from openai.pagination import SyncCursorPage
+from openai.types.beta.threads.message import Message
+
+from src.tools.models import BatchItemResult, BatchResult
+from src.tools.projection import field_tree, project, shape
+
+MESSAGE = Message(
+    id="msg_abc123",
+    object="thread.message",
+    created_at=1699012949,
+    thread_id="thread_abc123",
+    role="user",
+    status="completed",
+    content=[
+        {
+            "type": "text",
+            "text": {"value": "Hello", "annotations": []},
+        }
+    ],
+    attachments=[],
+    metadata={},
+)
+
+
+def test_field_tree():
+    """Test that dotted paths nest and whole fields win over subpaths."""
+    assert field_tree(["id", "usage.total_tokens", "usage", "a.b.c"]) == {
+        "id": True,
+        "usage": True,
+        "a": {"b": {"c": True}},
+    }
+    assert field_tree(["usage", "usage.total_tokens"]) == {"usage": True}
+
+
+def test_project_model_through_lists():
+    """Test projecting a model, descending into list items."""
+    result = project(MESSAGE, ["id", "content.text.value"])
+
+    assert result == {"id": "msg_abc123", "content": [{"text": {"value": "Hello"}}]}
+
+
+def test_project_without_fields_returns_value():
+    """Test that no projection leaves the result untouched."""
+    assert project(MESSAGE, None) is MESSAGE
+
+
+def test_project_page_keeps_pagination():
+    """Test that list pages keep has_more."""
+    page = SyncCursorPage[Message](data=[MESSAGE], has_more=True)
+
+    assert project(page, ["id", "role"]) == {
+        "data": [{"id": "msg_abc123", "role": "user"}],
+        "has_more": True,
+    }
+
+
+def test_project_batch_result_keeps_status():
+    """Test that batch results keep per-item status and errors."""
+    batch = BatchResult(
+        succeeded=1,
+        failed=1,
+        skipped=0,
+        items=[
+            BatchItemResult(index=0, group="a", status="succeeded", result=MESSAGE),
+            BatchItemResult(index=1, group="b", status="failed", error="not found"),
+        ],
+    )
+
+    result = project(batch, ["id"])
+
+    assert result["items"][0]["result"] == {"id": "msg_abc123"}
+    assert result["items"][1]["status"] == "failed"
+    assert result["items"][1]["result"] is None
+
+
+def test_shape_compact_drops_nulls_and_empties():
+    """Test that compact mode strips nulls, defaults and empty collections."""
+    result = shape(MESSAGE, compact=True)
+
+    assert result == {
+        "id": "msg_abc123",
+        "object": "thread.message",
+        "created_at": 1699012949,
+        "thread_id": "thread_abc123",
+        "role": "user",
+        "status": "completed",
+        "content": [{"type": "text", "text": {"value": "Hello"}}],
+    }
+
+
+def test_shape_compact_page_keeps_empty_data():
+    """Test that an empty page still carries data and has_more."""
+    page = SyncCursorPage[Message](data=[], has_more=False)
+
+    assert shape(page, compact=True) == {"data": [], "has_more": False}
+
+
+def test_shape_compact_with_fields():
+    """Test that compact mode applies after projection."""
+    result = shape(MESSAGE, ["id", "metadata", "assistant_id"], compact=True)
+
+    assert result == {"id": "msg_abc123"}
+
+
+def test_shape_uses_compact_setting():
+    """Test that COMPACT_RESPONSES is the default and a call can override it."""
+    with patch("src.tools.projection.settings.COMPACT_RESPONSES", True):
+        assert "metadata" not in shape(MESSAGE)
+        assert shape(MESSAGE, compact=False) is MESSAGE
@@ -6,9 +6,12 @@ import pytest
 # Mock OpenAI before importing any modules that use it
 mock_openai = Mock()
 with patch("openai.OpenAI", return_value=mock_openai):
+    from src.tools.threads.models import CreateThreadRequest
     from src.tools.threads.tools import (
         create_thread,
+        create_threads,
         delete_thread,
+        delete_threads,
         get_thread,
         modify_thread,
     )
@@ -149,3 +152,45 @@ def test_delete_thread(mock_openai_client):
     assert result["deleted"] is True
 
     mock_openai_client.beta.threads.delete.assert_called_once_with("thread_abc123")
+
+
+def test_create_threads_splits_long_message_lists(mock_openai_client):
+    """Test that messages beyond the request limit are appended in order."""
+    mock_openai_client.beta.threads.create.side_effect = [
+        Mock(id="thread_long"),
+        Mock(id="thread_short"),
+    ]
+    messages = [{"role": "user", "content": f"message {i}"} for i in range(34)]
+    threads = [
+        CreateThreadRequest(messages=messages),
+        CreateThreadRequest(messages=messages[:1]),
+    ]
+
+    with patch("src.tools.messages.tools.client") as messages_client:
+        result = create_threads(threads, max_concurrency=1)
+
+    assert result.succeeded == 2
+    assert [item.result.id for item in result.items] == [
+        "thread_long",
+        "thread_short",
+    ]
+    first_call = mock_openai_client.beta.threads.create.call_args_list[0]
+    assert len(first_call.kwargs["messages"]) == 32
+    appended = messages_client.beta.threads.messages.create.call_args_list
+    assert [c.kwargs["content"] for c in appended] == ["message 32", "message 33"]
+    assert {c.kwargs["thread_id"] for c in appended} == {"thread_long"}
+
+
+def test_delete_threads(mock_openai_client):
+    """Test deleting many threads in one call."""
+    mock_openai_client.beta.threads.delete.side_effect = lambda thread_id: {
+        "id": thread_id,
+        "object": "thread.deleted",
+        "deleted": True,
+    }
+
+    result = delete_threads(["thread_a", "thread_b"])
+
+    assert result.succeeded == 2
+    assert [item.result["id"] for item in result.items] == ["thread_a", "thread_b"]
+    assert mock_openai_client.beta.threads.delete.call_count == 2